@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Async Azure DevOps Manager - asyncio counterpart to AzureDevOpsManager
+Keeps many requests in flight over one pooled HTTP client, bounded by a semaphore.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import quote
+
+import aiohttp
+from azure.devops.v7_1.work_item_tracking.models import (
+    AttachmentReference, JsonPatchOperation, WorkItem, WorkItemQueryResult
+)
+
+from azure_devops_manager import (
+    BatchItemResult, Epic, RateLimitGovernor, RetryPolicy, UserStory, WorkItemDocumentBuilder
+)
+
+
+class AsyncAzureDevOpsManager(WorkItemDocumentBuilder):
+    """Asyncio manager class for Azure DevOps operations.
+    
+    Requests are paced by a RateLimitGovernor, which can be shared with a
+    synchronous AzureDevOpsManager running in the same process. Use as an
+    async context manager so the pooled HTTP client is closed:
+    
+        async with AsyncAzureDevOpsManager(org_url, pat, project) as manager:
+            ids = await asyncio.gather(*(manager.create_user_story(s) for s in stories))
+    """
+    
+    DEFAULT_MAX_CONCURRENCY = 16
+    
+    def __init__(self, organization_url: str, personal_access_token: str, project_name: str,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY, governor: Optional[RateLimitGovernor] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """Initialize async Azure DevOps manager"""
+        self.governor = governor or RateLimitGovernor()
+        self.retry_policy = retry_policy or RetryPolicy(transient_errors=(aiohttp.ClientConnectionError,))
+        self.organization_url = organization_url.rstrip('/')
+        self.project_name = project_name
+        self.max_concurrency = max_concurrency
+        self._auth = aiohttp.BasicAuth('', personal_access_token)
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self) -> "AsyncAzureDevOpsManager":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.close()
+    
+    async def close(self):
+        """Close the pooled HTTP client"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the pooled HTTP client inside the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(auth=self._auth, connector=connector)
+        return self._session
+    
+    def _project_url(self, path: str) -> str:
+        return f"{self.organization_url}/{quote(self.project_name)}/_apis/{path}"
+    
+    async def _request(self, operation: str, method: str, url: str, params: Optional[Dict] = None,
+                       json_body=None, data: Optional[bytes] = None,
+                       content_type: str = "application/json", idempotent: bool = True):
+        """Send a request with retries, counted under `operation`, and return the decoded JSON body"""
+        return await self.retry_policy.call_async(
+            operation, self._send_once, method, url, params, json_body, data, content_type,
+            idempotent=idempotent
+        )
+    
+    async def _send_once(self, method: str, url: str, params: Optional[Dict], json_body,
+                         data: Optional[bytes], content_type: str):
+        """Send one request under the concurrency semaphore"""
+        query = {"api-version": self.API_VERSION, **(params or {})}
+        headers = {"Content-Type": content_type}
+        
+        async with self._semaphore:
+            await self.governor.acquire_async()
+            async with self._get_session().request(
+                method, url, params=query, json=json_body, data=data, headers=headers
+            ) as response:
+                self.governor.observe(response.headers, response.status)
+                response.raise_for_status()
+                if response.status == 204:
+                    return None
+                return await response.json(content_type=None)
+    
+    async def create_epic(self, epic: Epic) -> int:
+        """Create an epic work item"""
+        data = await self._request(
+            "create_work_item", "POST", self._project_url("wit/workitems/$Epic"),
+            json_body=[operation.serialize() for operation in self.build_epic_document(epic)],
+            content_type="application/json-patch+json", idempotent=False
+        )
+        
+        print(f"✅ Created Epic: {epic.title} (ID: {data['id']})")
+        return data['id']
+    
+    async def create_user_story(self, story: UserStory, parent_id: Optional[int] = None) -> int:
+        """Create a user story work item"""
+        data = await self._request(
+            "create_work_item", "POST", self._project_url(f"wit/workitems/${quote('User Story')}"),
+            json_body=[operation.serialize() for operation in self.build_story_document(story, parent_id)],
+            content_type="application/json-patch+json", idempotent=False
+        )
+        
+        print(f"✅ Created User Story: {story.story_id} - {story.title} (ID: {data['id']})")
+        return data['id']
+    
+    async def update_work_item(self, work_item_id: int, updates: List[JsonPatchOperation]) -> bool:
+        """Update a work item with given operations"""
+        try:
+            await self._request(
+                "update_work_item", "PATCH", f"{self.organization_url}/_apis/wit/workitems/{work_item_id}",
+                json_body=[operation.serialize() for operation in updates],
+                content_type="application/json-patch+json"
+            )
+            return True
+        except Exception as e:
+            print(f"❌ Failed to update work item {work_item_id}: {e}")
+            return False
+    
+    async def update_work_item_conditional(self, work_item_id: int,
+                                           apply: Callable[[WorkItem], Optional[List[JsonPatchOperation]]],
+                                           work_item: Optional[WorkItem] = None,
+                                           fields: Optional[List[str]] = None) -> bool:
+        """Write only if the work item is still at the revision the updates were built from.
+        
+        Same contract as AzureDevOpsManager.update_work_item_conditional.
+        """
+        for _ in range(self.MAX_CONFLICT_ATTEMPTS):
+            try:
+                if work_item is None:
+                    work_item = await self.get_work_item(work_item_id, fields=fields)
+                operations = apply(work_item)
+            except Exception as e:
+                print(f"❌ Failed to update work item {work_item_id}: {e}")
+                return False
+            
+            if not operations:
+                return True
+            
+            document = [self.build_revision_test(work_item.rev)] + list(operations)
+            try:
+                await self._request(
+                    "update_work_item", "PATCH", f"{self.organization_url}/_apis/wit/workitems/{work_item_id}",
+                    json_body=[operation.serialize() for operation in document],
+                    content_type="application/json-patch+json", idempotent=False
+                )
+                return True
+            except Exception as e:
+                if RetryPolicy.status_code(e) in self.CONFLICT_STATUS:
+                    self.retry_policy.record_retry('revision conflict')
+                elif self.retry_policy.is_retryable(e):
+                    self.retry_policy.record_retry('unconfirmed write')
+                else:
+                    print(f"❌ Failed to update work item {work_item_id}: {e}")
+                    return False
+            
+            work_item = None
+        
+        self.retry_policy.record_failure('revision conflict')
+        print(f"❌ Failed to update work item {work_item_id}: no confirmed write after {self.MAX_CONFLICT_ATTEMPTS} attempts")
+        return False
+    
+    async def update_epic_from_data(self, work_item_id: int, epic: Epic) -> bool:
+        """Update an epic with rich data from Epic object"""
+        return await self.update_work_item(work_item_id, self.build_epic_updates(epic))
+    
+    async def update_story_from_data(self, work_item_id: int, story: UserStory) -> bool:
+        """Update a user story with data from UserStory object"""
+        return await self.update_work_item(work_item_id, self.build_story_updates(story))
+    
+    async def update_work_items_batch(self, updates: Dict[int, List[JsonPatchOperation]]) -> Dict[int, BatchItemResult]:
+        """Update many work items through concurrent $batch requests, BATCH_SIZE items each"""
+        items = list(updates.items())
+        chunks = [items[start:start + self.BATCH_SIZE] for start in range(0, len(items), self.BATCH_SIZE)]
+        
+        results = {}
+        for chunk_results in await asyncio.gather(*(self._send_batch(chunk) for chunk in chunks)):
+            results.update(chunk_results)
+        
+        for result in results.values():
+            if not result.success:
+                print(f"❌ Failed to update work item {result.work_item_id}: {result.error}")
+        
+        return results
+    
+    async def _send_batch(self, chunk) -> Dict[int, BatchItemResult]:
+        """Send one $batch request, re-sending items that failed with a retryable status"""
+        results = {}
+        pending = chunk
+        
+        for attempt in range(self.retry_policy.max_attempts):
+            try:
+                data = await self._request(
+                    "$batch", "POST", f"{self.organization_url}/_apis/wit/$batch",
+                    json_body=self.build_batch_request(pending)
+                )
+            except Exception as e:
+                print(f"❌ Batch request failed for {len(pending)} work items: {e}")
+                status_code = RetryPolicy.status_code(e) or 0
+                results.update({work_item_id: BatchItemResult(work_item_id, False, status_code, str(e)) for work_item_id, _ in pending})
+                break
+            
+            results.update(self.map_batch_responses(pending, data.get('value', [])))
+            pending = [(work_item_id, operations) for work_item_id, operations in pending
+                       if self.retry_policy.should_retry_status(results[work_item_id].status_code)]
+            if not pending or attempt + 1 >= self.retry_policy.max_attempts:
+                break
+            self.retry_policy.record_retry('$batch item', len(pending))
+            await asyncio.sleep(self.retry_policy.backoff(attempt))
+        
+        failed = sum(1 for work_item_id, _ in chunk if not results[work_item_id].success)
+        if failed:
+            self.retry_policy.record_failure('$batch item', failed)
+        return results
+    
+    async def get_work_item(self, work_item_id: int, fields: Optional[List[str]] = None,
+                            expand: Optional[str] = None) -> WorkItem:
+        """Fetch a single work item"""
+        params = {}
+        if fields:
+            params["fields"] = ",".join(fields)
+        if expand:
+            params["$expand"] = expand
+        
+        data = await self._request(
+            "get_work_item", "GET", f"{self.organization_url}/_apis/wit/workitems/{work_item_id}", params=params
+        )
+        return WorkItem.deserialize(data)
+    
+    async def get_work_items_bulk(self, ids: List[int], fields: Optional[List[str]] = None,
+                                  expand: Optional[str] = None) -> Dict[int, WorkItem]:
+        """Fetch many work items via concurrent workitemsbatch requests, keyed by ID.
+        
+        Only the requested fields are returned; IDs that do not exist or are not
+        accessible are omitted from the result.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [unique_ids[start:start + self.BATCH_SIZE] for start in range(0, len(unique_ids), self.BATCH_SIZE)]
+        
+        async def fetch(chunk: List[int]) -> List[Dict]:
+            body = {"ids": chunk, "errorPolicy": "omit"}
+            if fields:
+                body["fields"] = fields
+            if expand:
+                body["$expand"] = expand
+            data = await self._request("get_work_items_batch", "POST", self._project_url("wit/workitemsbatch"), json_body=body)
+            return data.get('value', [])
+        
+        work_items = {}
+        for values in await asyncio.gather(*(fetch(chunk) for chunk in chunks)):
+            for value in values:
+                if value is not None:
+                    work_item = WorkItem.deserialize(value)
+                    work_items[work_item.id] = work_item
+        
+        return work_items
+    
+    async def query_by_wiql(self, query: str, top: Optional[int] = None) -> WorkItemQueryResult:
+        """Run a WIQL query against the project"""
+        params = {"$top": top} if top else None
+        data = await self._request(
+            "query_by_wiql", "POST", self._project_url("wit/wiql"), params=params, json_body={"query": query}
+        )
+        return WorkItemQueryResult.deserialize(data)
+    
+    async def create_attachment(self, content: Union[bytes, str, Path], file_name: Optional[str] = None) -> AttachmentReference:
+        """Upload an attachment from bytes or a file path and return its reference"""
+        if not isinstance(content, bytes):
+            file_name = file_name or os.path.basename(str(content))
+            content = await asyncio.to_thread(Path(content).read_bytes)
+        
+        data = await self._request(
+            "create_attachment", "POST", self._project_url("wit/attachments"), params={"fileName": file_name},
+            data=content, content_type="application/octet-stream", idempotent=False
+        )
+        return AttachmentReference.deserialize(data)
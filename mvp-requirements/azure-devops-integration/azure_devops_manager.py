@@ -8,11 +8,32 @@ import sys
 import os
 import json
 import re
+import time
+import random
+import asyncio
+import threading
+import functools
+import io
+import mmap
+import hashlib
+import html
+import pickle
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import quote
+from dataclasses import dataclass, field
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from msrest.universal_http.requests import RequestsHTTPSender
 from azure.devops.connection import Connection
-from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from azure.devops.v7_1.work_item_tracking.models import (
+    JsonPatchOperation, Wiql, WorkItemBatchGetRequest, WorkItemDeleteBatchRequest, WorkItemDeleteUpdate
+)
 from msrest.authentication import BasicAuthentication
 
 
@@ -43,38 +64,692 @@ class Epic:
     risk_factors: List[str]
 
 
-class AzureDevOpsManager:
-    """Main manager class for Azure DevOps operations"""
+@dataclass(frozen=True, slots=True)
+class AcceptanceScenario:
+    """One Given clause and its When/Then/And steps, readable like the dicts MarkdownParser builds"""
+    given: str
+    when_then: Tuple[str, ...] = ()
     
-    def __init__(self, organization_url: str, personal_access_token: str, project_name: str):
-        """Initialize Azure DevOps manager"""
-        credentials = BasicAuthentication('', personal_access_token)
-        self.connection = Connection(base_url=organization_url, creds=credentials)
-        self.wit_client = self.connection.clients.get_work_item_tracking_client()
-        self.project_name = project_name
-        self.organization_url = organization_url
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
     
-    def create_epic(self, epic: Epic) -> int:
-        """Create an epic work item"""
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+    
+    def to_dict(self) -> Dict:
+        return {'given': self.given, 'when_then': list(self.when_then)}
+
+
+@dataclass(frozen=True, slots=True)
+class CompactUserStory:
+    """Immutable, slotted UserStory for large catalogs.
+    
+    Acceptance criteria are tuples of AcceptanceScenario and values shared by
+    many stories (epic, priority, persona, dependencies) are interned, so it
+    takes a fraction of the memory while reading the same as a UserStory.
+    """
+    story_id: str
+    title: str
+    epic: str
+    priority: str
+    story_points: int
+    as_a: str
+    i_want: str
+    so_that: str
+    acceptance_criteria_structured: Tuple[AcceptanceScenario, ...]
+    dependencies: str
+    technical_notes: str
+    
+    @classmethod
+    def from_story(cls, story: UserStory) -> "CompactUserStory":
+        return cls(
+            story_id=story.story_id,
+            title=story.title,
+            epic=sys.intern(story.epic),
+            priority=sys.intern(story.priority),
+            story_points=story.story_points,
+            as_a=sys.intern(story.as_a),
+            i_want=story.i_want,
+            so_that=story.so_that,
+            acceptance_criteria_structured=tuple(
+                AcceptanceScenario(scenario['given'], tuple(scenario.get('when_then') or ()))
+                for scenario in story.acceptance_criteria_structured
+            ),
+            dependencies=sys.intern(story.dependencies),
+            technical_notes=story.technical_notes
+        )
+    
+    def to_story(self) -> UserStory:
+        return UserStory(
+            story_id=self.story_id,
+            title=self.title,
+            epic=self.epic,
+            priority=self.priority,
+            story_points=self.story_points,
+            as_a=self.as_a,
+            i_want=self.i_want,
+            so_that=self.so_that,
+            acceptance_criteria_structured=[scenario.to_dict() for scenario in self.acceptance_criteria_structured],
+            dependencies=self.dependencies,
+            technical_notes=self.technical_notes
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactEpic:
+    """Immutable, slotted Epic with tuple metrics and risks"""
+    title: str
+    overview: str
+    business_value: str
+    stakeholders: str
+    success_metrics: Tuple[str, ...]
+    risk_factors: Tuple[str, ...]
+    
+    @classmethod
+    def from_epic(cls, epic: Epic) -> "CompactEpic":
+        return cls(
+            title=sys.intern(epic.title),
+            overview=epic.overview,
+            business_value=epic.business_value,
+            stakeholders=sys.intern(epic.stakeholders),
+            success_metrics=tuple(epic.success_metrics),
+            risk_factors=tuple(epic.risk_factors)
+        )
+    
+    def to_epic(self) -> Epic:
+        return Epic(
+            title=self.title,
+            overview=self.overview,
+            business_value=self.business_value,
+            stakeholders=self.stakeholders,
+            success_metrics=list(self.success_metrics),
+            risk_factors=list(self.risk_factors)
+        )
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of a single work item inside a $batch, bulk delete or bulk restore request"""
+    work_item_id: int
+    success: bool
+    status_code: int
+    error: str = ''
+
+
+@dataclass
+class SectionRecord:
+    """Byte range and content hash of one story or epic section in a markdown file"""
+    kind: str  # 'story' or 'epic'
+    key: str  # Story ID or epic title
+    start: int
+    end: int
+    digest: str
+
+
+@dataclass
+class HeadingRecord:
+    """A markdown heading and the byte range of the section it opens"""
+    level: int
+    title: str
+    line: int  # 1-based line of the heading
+    start: int
+    end: int  # Start of the next heading of the same or a higher level, or end of file
+
+
+@dataclass
+class CodeBlockRecord:
+    """A fenced code block: byte range of its code and the heading it appears under"""
+    language: str
+    heading: str
+    line: int  # 1-based line of the opening fence
+    start: int  # First byte after the opening fence line
+    end: int  # First byte of the closing fence line
+
+
+@dataclass
+class ParseDelta:
+    """Stories and epics that differ from the previous parse of the same file"""
+    added_stories: Dict[str, UserStory] = field(default_factory=dict)
+    changed_stories: Dict[str, UserStory] = field(default_factory=dict)
+    removed_stories: List[str] = field(default_factory=list)
+    added_epics: Dict[str, Epic] = field(default_factory=dict)
+    changed_epics: Dict[str, Epic] = field(default_factory=dict)
+    removed_epics: List[str] = field(default_factory=list)
+    
+    def is_empty(self) -> bool:
+        return not any((self.added_stories, self.changed_stories, self.removed_stories,
+                        self.added_epics, self.changed_epics, self.removed_epics))
+
+
+class RateLimitGovernor:
+    """Token-bucket request pacing driven by Azure DevOps rate-limit headers.
+    
+    The bucket refills at `rate` requests per second. Every response is fed to
+    observe(): Retry-After pauses all callers, X-RateLimit-Delay or a nearly
+    exhausted X-RateLimit-Remaining cut the rate, and unthrottled responses let
+    it climb back towards max_rate. One instance can be shared by threads,
+    async tasks and several managers; the lock is only held for arithmetic.
+    """
+    
+    LOW_REMAINING_RATIO = 0.1  # Slow down once less than 10% of the TSTU budget is left
+    
+    def __init__(self, rate: float = 10.0, burst: int = 10, min_rate: float = 0.5, max_rate: float = 50.0,
+                 increase_step: float = 0.5, decrease_factor: float = 0.5):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Take one token and return how many seconds the caller must wait before sending"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            
+            token_wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(token_wait, self._blocked_until - now)
+    
+    def acquire(self):
+        """Block the calling thread until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self):
+        """Suspend the calling task until a request may be sent"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def observe(self, headers: Mapping[str, str], status_code: Optional[int] = None):
+        """Adjust pacing from the rate-limit headers of a response"""
+        retry_after = self._parse_retry_after(headers.get('Retry-After'))
+        delay = self._parse_float(headers.get('X-RateLimit-Delay'))
+        remaining = self._parse_float(headers.get('X-RateLimit-Remaining'))
+        limit = self._parse_float(headers.get('X-RateLimit-Limit'))
+        
+        with self._lock:
+            now = time.monotonic()
+            
+            if retry_after is not None or status_code == 429:
+                self._blocked_until = max(self._blocked_until, now + (retry_after if retry_after is not None else 1.0))
+                self._slow_down()
+            elif delay:
+                self._slow_down()
+            elif remaining is not None and limit and remaining / limit < self.LOW_REMAINING_RATIO:
+                self._slow_down()
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase_step)
+    
+    def _slow_down(self):
+        self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+        self._tokens = min(self._tokens, 0.0)
+    
+    @staticmethod
+    def _parse_float(value: Optional[str]) -> Optional[float]:
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Retry-After is either delta-seconds or an HTTP date"""
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient Azure DevOps failures.
+    
+    408, 429 and 5xx responses, connection resets and timeouts are retried;
+    anything else (400, 401, 404, service exceptions) fails immediately.
+    Non-idempotent calls such as creating a work item are only retried on 429,
+    where the server guarantees it did no work, so a retry cannot duplicate items.
+    A batch delete counts as non-idempotent: a re-sent batch reports the items
+    the first attempt deleted as failures.
+    Retries and final failures are counted per call name.
+    """
+    
+    RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+    TRANSIENT_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError,
+                        requests.ConnectionError, requests.Timeout)
+    NON_IDEMPOTENT_PREFIXES = ('create_', 'delete_work_items')
+    _STATUS_IN_MESSAGE = re.compile(r'returned an? (\d{3}) status code')
+    
+    def __init__(self, max_attempts: int = 5, base_delay: float = 0.5, max_delay: float = 30.0,
+                 transient_errors: Tuple[type, ...] = ()):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.transient_errors = self.TRANSIENT_ERRORS + tuple(transient_errors)
+        self.retry_counts = Counter()
+        self.failure_counts = Counter()
+        self._lock = threading.Lock()
+    
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+    
+    def should_retry_status(self, status_code: Optional[int], idempotent: bool = True) -> bool:
+        return status_code == 429 or (idempotent and status_code in self.RETRYABLE_STATUS)
+    
+    def is_retryable(self, error: BaseException, idempotent: bool = True) -> bool:
+        """Classify an exception from requests, msrest, the SDK or aiohttp"""
+        status_code = self.status_code(error)
+        if status_code is not None:
+            return self.should_retry_status(status_code, idempotent)
+        if not idempotent:
+            return False
+        
+        # msrest wraps transport errors in inner_exception; walk the whole chain
+        while error is not None:
+            if isinstance(error, self.transient_errors):
+                return True
+            error = getattr(error, 'inner_exception', None) or error.__cause__
+        return False
+    
+    @classmethod
+    def status_code(cls, error: BaseException) -> Optional[int]:
+        """HTTP status behind an exception, if it carries one"""
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None) or getattr(error, 'status', None)
+        if isinstance(status_code, int):
+            return status_code
+        
+        # The SDK only reports the status in its message
+        match = cls._STATUS_IN_MESSAGE.search(str(error))
+        return int(match.group(1)) if match else None
+    
+    def record_retry(self, name: str, count: int = 1):
+        with self._lock:
+            self.retry_counts[name] += count
+    
+    def record_failure(self, name: str, count: int = 1):
+        with self._lock:
+            self.failure_counts[name] += count
+    
+    def call(self, name: str, func, *args, idempotent: bool = True, **kwargs):
+        """Call func, retrying transient failures with backoff"""
+        for attempt in range(self.max_attempts):
+            try:
+                return func(*args, **kwargs)
+            except Exception as error:
+                if attempt + 1 >= self.max_attempts or not self.is_retryable(error, idempotent):
+                    self.record_failure(name)
+                    raise
+                self.record_retry(name)
+                time.sleep(self.backoff(attempt))
+    
+    async def call_async(self, name: str, func, *args, idempotent: bool = True, **kwargs):
+        """Await func, retrying transient failures with backoff"""
+        for attempt in range(self.max_attempts):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                if attempt + 1 >= self.max_attempts or not self.is_retryable(error, idempotent):
+                    self.record_failure(name)
+                    raise
+                self.record_retry(name)
+                await asyncio.sleep(self.backoff(attempt))
+
+
+class RetryingClient:
+    """Proxy that sends every public method of an SDK client through a RetryPolicy"""
+    
+    def __init__(self, client, retry_policy: RetryPolicy):
+        self._client = client
+        self._retry_policy = retry_policy
+    
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+        
+        idempotent = not name.startswith(RetryPolicy.NON_IDEMPOTENT_PREFIXES)
+        
+        @functools.wraps(attribute)
+        def call(*args, **kwargs):
+            return self._retry_policy.call(name, self._call_with_status, attribute, *args, idempotent=idempotent, **kwargs)
+        
+        return call
+    
+    @staticmethod
+    def _call_with_status(method, *args, **kwargs):
+        """Call an SDK method, copying the HTTP status onto its error.
+        
+        Errors the SDK builds from a JSON error body (e.g. a throttled 429 or a
+        503) carry no status, so it is taken from the response the adapter saw.
+        """
+        GovernedHTTPAdapter.clear_last_status()
+        try:
+            return method(*args, **kwargs)
+        except Exception as error:
+            status_code = GovernedHTTPAdapter.last_status()
+            if status_code is not None and status_code >= 400 and RetryPolicy.status_code(error) is None:
+                error.status = status_code
+            raise
+
+
+class GovernedHTTPAdapter(HTTPAdapter):
+    """requests adapter that paces every request through a RateLimitGovernor.
+    
+    The status of the last response on each thread is kept for RetryingClient.
+    """
+    
+    _last_status = threading.local()
+    
+    def __init__(self, governor: RateLimitGovernor, **kwargs):
+        self.governor = governor
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        self.governor.acquire()
+        response = super().send(request, **kwargs)
+        GovernedHTTPAdapter._last_status.value = response.status_code
+        self.governor.observe(response.headers, response.status_code)
+        return response
+    
+    @classmethod
+    def last_status(cls) -> Optional[int]:
+        """Status of the last response received on the calling thread"""
+        return getattr(cls._last_status, 'value', None)
+    
+    @classmethod
+    def clear_last_status(cls):
+        cls._last_status.value = None
+
+
+class SharedSessionSender(RequestsHTTPSender):
+    """msrest sender that uses a session owned by the manager.
+    
+    The stock sender keeps one session per thread and closes it after every
+    call unless keep_alive is set, which costs a new TLS handshake per request.
+    """
+    
+    def __init__(self, config, session: requests.Session):
+        super().__init__(config)
+        self.session = session
+    
+    @property
+    def session(self) -> requests.Session:
+        return self._shared_session
+    
+    @session.setter
+    def session(self, value: requests.Session):
+        self._init_session(value)
+        self._shared_session = value
+    
+    def _init_session(self, session: requests.Session):
+        """msrest's session setup, without its urllib3 retries.
+        
+        msrest installs a Retry whose status_forcelist turns 5xx (and most 4xx)
+        responses into a RetryError with no status, which RetryPolicy cannot
+        classify and the governor never observes. Every response is returned
+        as-is instead, and RetryPolicy is the only retry layer.
+        """
+        super()._init_session(session)
+        for protocol in self._protocols:
+            session.adapters[protocol].max_retries = Retry(0, read=False, raise_on_status=False)
+    
+    def close(self):
+        """The owning manager closes the shared session"""
+
+
+class HtmlCanonicalizer:
+    """Normalizes HTML so field content Azure DevOps rewrote on save compares equal to what was sent.
+    
+    Tag and attribute names are lowercased, attributes sorted, entities decoded,
+    self-closing slashes and comments dropped, and whitespace collapsed (trimmed
+    next to block-level tags, kept as-is inside <pre>):
+    
+        HtmlCanonicalizer.equivalent('<p>A &amp; B<br/></p>', '<P>A &#38; B <br></P>')  # True
+    """
+    
+    BLOCK_TAGS = frozenset({
+        'address', 'article', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+        'hr', 'li', 'ol', 'p', 'pre', 'section', 'table', 'tbody', 'td', 'tfoot', 'th', 'thead', 'tr', 'ul'
+    })
+    TOKEN = re.compile(
+        r'<!--.*?-->'
+        r'|<(/?)([a-zA-Z][a-zA-Z0-9:-]*)((?:\s+[^\s"\'>/=]+(?:\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s"\'>]+))?)*)\s*/?>',
+        re.DOTALL
+    )
+    ATTRIBUTE = re.compile(r'([^\s"\'>/=]+)(?:\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+)))?')
+    WHITESPACE = re.compile(r'\s+')
+    MAX_CACHED_TAGS = 4096
+    _tags: Dict[str, Tuple[str, str, bool, bool]] = {}  # Raw tag -> _canonical_tag result
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def canonicalize(cls, html_text: Optional[str]) -> str:
+        """Canonical form of an HTML fragment; None and empty strings give an empty string"""
+        if not html_text:
+            return ""
+        
+        parts = []
+        pending = []  # Raw text (and skipped comments) since the last tag
+        after_block = True  # The start of the fragment trims like a block boundary
+        pre_depth = 0
+        position = 0
+        
+        for match in cls.TOKEN.finditer(html_text):
+            pending.append(html_text[position:match.start()])
+            position = match.end()
+            tag = cls._canonical_tag(match)
+            if tag is None:
+                continue  # Comment
+            
+            canonical, name, closing, is_block = tag
+            text = ''.join(pending)
+            if text:
+                cls._append_text(parts, text, after_block, is_block, pre_depth)
+            pending = []
+            parts.append(canonical)
+            if name == 'pre':
+                pre_depth = max(pre_depth - 1, 0) if closing else pre_depth + 1
+            after_block = is_block
+        
+        pending.append(html_text[position:])
+        cls._append_text(parts, ''.join(pending), after_block, True, pre_depth)
+        return "".join(parts)
+    
+    @classmethod
+    def digest(cls, html_text: Optional[str]) -> str:
+        """SHA-256 of the canonical form"""
+        return hashlib.sha256(cls.canonicalize(html_text).encode('utf-8')).hexdigest()
+    
+    @classmethod
+    def equivalent(cls, first: Optional[str], second: Optional[str]) -> bool:
+        return first == second or cls.canonicalize(first) == cls.canonicalize(second)
+    
+    @classmethod
+    def _append_text(cls, parts: List[str], text: str, after_block: bool, before_block: bool, pre_depth: int):
+        if not text:
+            return
+        if '&' in text:
+            text = html.unescape(text)
+        if pre_depth:
+            text = text.replace('\r\n', '\n')
+        else:
+            text = cls.WHITESPACE.sub(' ', text)
+            if after_block:
+                text = text.lstrip(' ')
+            if before_block:
+                text = text.rstrip(' ')
+        if text:
+            if '&' in text or '<' in text or '>' in text:
+                text = html.escape(text, quote=False)
+            parts.append(text)
+    
+    @classmethod
+    def _canonical_tag(cls, match) -> Optional[Tuple[str, str, bool, bool]]:
+        """(canonical tag, name, is closing, is block-level) for a TOKEN match, None for comments"""
+        raw = match.group(0)
+        tag = cls._tags.get(raw)
+        if tag is None and match.group(2) is not None:
+            name = match.group(2).lower()
+            closing = bool(match.group(1))
+            canonical = f"</{name}>" if closing else f"<{name}{cls._canonical_attributes(match.group(3))}>"
+            tag = (canonical, name, closing, name in cls.BLOCK_TAGS)
+            if len(cls._tags) >= cls.MAX_CACHED_TAGS:
+                cls._tags.clear()
+            cls._tags[raw] = tag
+        return tag
+    
+    @classmethod
+    def _canonical_attributes(cls, raw: str) -> str:
+        attributes = []
+        for match in cls.ATTRIBUTE.finditer(raw or ''):
+            value = next((group for group in match.groups()[1:] if group is not None), '')
+            value = cls.WHITESPACE.sub(' ', html.unescape(value)).strip()
+            attributes.append(f' {match.group(1).lower()}="{html.escape(value, quote=True)}"')
+        return "".join(sorted(attributes))
+
+
+class HtmlRenderer:
+    """Renders epics and user stories to the HTML stored in Azure DevOps fields.
+    
+    Patterns are compiled once and output is assembled with str.join. Results
+    are memoized in an LRU cache keyed by the rendered fields of the input, so
+    re-rendering an unchanged story (dry runs, hash diffing) is a lookup.
+    """
+    
+    CACHE_SIZE = 8192
+    CODE_FENCE = re.compile(r'```(\w+)?\n(.*?)```', re.DOTALL)
+    BOLD = re.compile(r'\*\*(.*?)\*\*')
+    
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self._render_story = functools.lru_cache(maxsize=cache_size)(self._render_story_fields)
+        self._render_epic = functools.lru_cache(maxsize=cache_size)(self._render_epic_fields)
+    
+    @staticmethod
+    def story_key(story: UserStory) -> Tuple:
+        """Hashable tuple of the story fields that appear in the HTML"""
+        return (
+            story.as_a, story.i_want, story.so_that, story.dependencies, story.technical_notes,
+            tuple((scenario['given'], tuple(scenario.get('when_then') or ()))
+                  for scenario in story.acceptance_criteria_structured)
+        )
+    
+    @staticmethod
+    def epic_key(epic: Epic) -> Tuple:
+        """Hashable tuple of the epic fields that appear in the HTML"""
+        return (epic.title, epic.overview, epic.business_value, epic.stakeholders,
+                tuple(epic.success_metrics), tuple(epic.risk_factors))
+    
+    def render_story(self, story: UserStory) -> Tuple[str, str]:
+        """(description, acceptance criteria) HTML for a story"""
+        return self._render_story(self.story_key(story))
+    
+    def story_description(self, story: UserStory) -> str:
+        return self.render_story(story)[0]
+    
+    def story_acceptance_criteria(self, story: UserStory) -> str:
+        return self.render_story(story)[1]
+    
+    def epic_description(self, epic: Epic) -> str:
+        return self._render_epic(self.epic_key(epic))
+    
+    def cache_info(self) -> Dict[str, Any]:
+        return {'story': self._render_story.cache_info(), 'epic': self._render_epic.cache_info()}
+    
+    def cache_clear(self):
+        self._render_story.cache_clear()
+        self._render_epic.cache_clear()
+    
+    def _render_story_fields(self, key: Tuple) -> Tuple[str, str]:
+        """(description, acceptance criteria) HTML for a story_key"""
+        as_a, i_want, so_that, dependencies, technical_notes, scenarios = key
+        
+        tech_notes = technical_notes or "None"
+        if tech_notes != "None":
+            if '```' in tech_notes:
+                tech_notes = self.CODE_FENCE.sub(r'<pre><code>\2</code></pre>', tech_notes)
+            if '**' in tech_notes:
+                tech_notes = self.BOLD.sub(r'<strong>\1</strong>', tech_notes)
+            tech_notes = tech_notes.replace('\n', '<br/>')
+        
+        description = (
+            f"<h3>User Story</h3>\n<p><strong>As a</strong> {as_a}<br/>\n"
+            f"<strong>I want</strong> {i_want}<br/>\n<strong>So that</strong> {so_that}</p>\n\n"
+            f"<h3>Dependencies</h3>\n<p>{dependencies}</p>\n\n"
+            f"<h3>Technical Notes</h3>\n<p>{tech_notes}</p>"
+        )
+        
+        if not scenarios:
+            return description, "To be defined during implementation"
+        
+        parts = ["<ul>\n"]
+        for given, when_then in scenarios:
+            parts.append(f'  <li><strong>{given}</strong>\n')
+            if when_then:
+                parts.append('    <ul>\n')
+                parts.extend([f'      <li>{sub_criteria}</li>\n' for sub_criteria in when_then])
+                parts.append('    </ul>\n')
+            parts.append('  </li>\n')
+        parts.append("</ul>")
+        return description, "".join(parts)
+    
+    @staticmethod
+    def _render_epic_fields(key: Tuple) -> str:
+        title, overview, business_value, stakeholders, metrics, risks = key
+        metrics_html = "".join(["<ul>\n", "\n".join([f"  <li>{metric}</li>" for metric in metrics]), "\n</ul>"]) if metrics else "<p>To be defined</p>"
+        risks_html = "".join(["<ul>\n", "\n".join([f"  <li>{risk}</li>" for risk in risks]), "\n</ul>"]) if risks else "<p>To be assessed</p>"
+        
+        return (
+            f"<h3>Epic Overview</h3>\n<p>{overview or f'Core functionality for {title} in the MAO MVP implementation'}</p>\n\n"
+            f"<h3>Business Value</h3>\n<p>{business_value or 'Delivers essential capabilities for the MVP launch'}</p>\n\n"
+            f"<h3>Key Stakeholders</h3>\n<p>{stakeholders or 'Development Team, Product Owner, End Users'}</p>\n\n"
+            f"<h3>Success Metrics</h3>\n{metrics_html}\n\n"
+            f"<h3>Risk Factors</h3>\n{risks_html}"
+        )
+
+
+class WorkItemDocumentBuilder:
+    """Builds JSON-patch documents and HTML field content for work items.
+    
+    Shared by the synchronous and asynchronous managers so both send
+    identical payloads; subclasses provide organization_url.
+    """
+    
+    API_VERSION = "7.1"
+    BATCH_SIZE = 200  # Server-side limit for $batch, workitemsbatch and workitemsdelete requests
+    CONFLICT_STATUS = frozenset({409, 412})  # A "test /rev" operation did not match
+    MAX_CONFLICT_ATTEMPTS = 5
+    renderer = HtmlRenderer()  # Shared, so every manager in the process reuses one render cache
+    
+    def build_epic_document(self, epic: Epic) -> List[JsonPatchOperation]:
+        """Build the patch document that creates an epic"""
         html_description = self._create_epic_html_description(epic)
         
-        document = [
+        return [
             JsonPatchOperation(op="add", path="/fields/System.Title", value=f"MAO MVP - {epic.title}"),
             JsonPatchOperation(op="add", path="/fields/System.Description", value=html_description),
             JsonPatchOperation(op="add", path="/fields/System.WorkItemType", value="Epic")
         ]
-        
-        work_item = self.wit_client.create_work_item(
-            document=document, project=self.project_name, type="Epic"
-        )
-        
-        print(f"✅ Created Epic: {epic.title} (ID: {work_item.id})")
-        return work_item.id
     
-    def create_user_story(self, story: UserStory, parent_id: Optional[int] = None) -> int:
-        """Create a user story work item"""
-        clean_description = self._create_story_html_description(story)
-        html_acceptance_criteria = self._create_html_acceptance_criteria(story)
+    def build_story_document(self, story: UserStory, parent_id: Optional[int] = None) -> List[JsonPatchOperation]:
+        """Build the patch document that creates a user story"""
+        clean_description, html_acceptance_criteria = self.renderer.render_story(story)
         
         priority_map = {"P0": 1, "P1": 2, "P2": 3}
         priority_value = priority_map.get(story.priority, 2)
@@ -94,8 +769,203 @@ class AzureDevOpsManager:
                 value={"rel": "System.LinkTypes.Hierarchy-Reverse", "url": f"{self.organization_url}/_apis/wit/workItems/{parent_id}"}
             ))
         
+        return document
+    
+    def build_epic_updates(self, epic: Epic) -> List[JsonPatchOperation]:
+        """Build the patch document that syncs an epic with its markdown data"""
+        html_description = self._create_epic_html_description(epic)
+        
+        return [
+            JsonPatchOperation(op="replace", path="/fields/System.Description", value=html_description),
+            JsonPatchOperation(op="replace", path="/fields/Microsoft.VSTS.Common.AcceptanceCriteria", value="")
+        ]
+    
+    def build_story_updates(self, story: UserStory) -> List[JsonPatchOperation]:
+        """Build the patch document that syncs a user story with its markdown data"""
+        clean_description, html_acceptance_criteria = self.renderer.render_story(story)
+        
+        return [
+            JsonPatchOperation(op="replace", path="/fields/System.Description", value=clean_description),
+            JsonPatchOperation(op="replace", path="/fields/Microsoft.VSTS.Common.AcceptanceCriteria", value=html_acceptance_criteria)
+        ]
+    
+    @staticmethod
+    def hash_field_values(operations: List[JsonPatchOperation]) -> Dict[str, str]:
+        """SHA-256 of each value a patch document writes, keyed by field path"""
+        return {
+            operation.path: hashlib.sha256(json.dumps(operation.value, ensure_ascii=False).encode('utf-8')).hexdigest()
+            for operation in operations if operation.op in ("add", "replace")
+        }
+    
+    @classmethod
+    def changed_operations(cls, operations: List[JsonPatchOperation],
+                           stored_hashes: Mapping[str, str]) -> List[JsonPatchOperation]:
+        """Drop writes whose value hashes the same as the one recorded at the last sync"""
+        hashes = cls.hash_field_values(operations)
+        return [
+            operation for operation in operations
+            if operation.path not in hashes or stored_hashes.get(operation.path) != hashes[operation.path]
+        ]
+    
+    @staticmethod
+    def diff_remote_fields(operations: List[JsonPatchOperation],
+                           remote_fields: Mapping[str, Any]) -> Tuple[List[JsonPatchOperation], List[JsonPatchOperation]]:
+        """Split field writes into (changed, already present) against a work item's current fields.
+        
+        String values are compared with HtmlCanonicalizer, since the service
+        rewrites stored HTML; a missing field matches an empty string.
+        """
+        changed, unchanged = [], []
+        for operation in operations:
+            if operation.op in ("add", "replace") and operation.path.startswith("/fields/"):
+                remote = remote_fields.get(operation.path[len("/fields/"):])
+                if isinstance(operation.value, str) and (remote is None or isinstance(remote, str)):
+                    matches = HtmlCanonicalizer.equivalent(operation.value, remote or "")
+                else:
+                    matches = operation.value == remote
+                if matches:
+                    unchanged.append(operation)
+                    continue
+            changed.append(operation)
+        return changed, unchanged
+    
+    @staticmethod
+    def build_revision_test(revision: int) -> JsonPatchOperation:
+        """Patch operation that rejects the write if the work item moved past `revision`"""
+        return JsonPatchOperation(op="test", path="/rev", value=revision)
+    
+    def build_batch_request(self, chunk: List[Tuple[int, List[JsonPatchOperation]]]) -> List[Dict]:
+        """Build the $batch request body for a chunk of (work item ID, operations) pairs"""
+        return [
+            {
+                "method": "PATCH",
+                "uri": f"/_apis/wit/workitems/{work_item_id}?api-version={self.API_VERSION}",
+                "headers": {"Content-Type": "application/json-patch+json"},
+                "body": [operation.serialize() for operation in operations]
+            }
+            for work_item_id, operations in chunk
+        ]
+    
+    def map_batch_responses(self, chunk: List[Tuple[int, List[JsonPatchOperation]]],
+                            responses: List[Dict]) -> Dict[int, BatchItemResult]:
+        """Pair $batch responses with the work items of the chunk they were sent for"""
+        results = {
+            work_item_id: self.parse_batch_item_response(work_item_id, item_response)
+            for (work_item_id, _), item_response in zip(chunk, responses)
+        }
+        
+        # The service returns one response per request; anything missing is a failure
+        for work_item_id, _ in chunk[len(responses):]:
+            results[work_item_id] = BatchItemResult(work_item_id, False, 0, "No response in batch")
+        return results
+    
+    @staticmethod
+    def parse_batch_item_response(work_item_id: int, item_response: Dict) -> BatchItemResult:
+        """Convert one entry of a $batch response into a BatchItemResult"""
+        status_code = item_response.get('code', 0)
+        if 200 <= status_code < 300:
+            return BatchItemResult(work_item_id, True, status_code)
+        
+        error = item_response.get('body') or f"HTTP {status_code}"
+        try:
+            error = json.loads(error).get('message', error)
+        except (TypeError, ValueError, AttributeError):
+            pass
+        return BatchItemResult(work_item_id, False, status_code, error)
+    
+    def _create_epic_html_description(self, epic: Epic) -> str:
+        """Create HTML description for epic"""
+        return self.renderer.epic_description(epic)
+    
+    def _create_story_html_description(self, story: UserStory) -> str:
+        """Create clean HTML description for user story (no acceptance criteria)"""
+        return self.renderer.story_description(story)
+    
+    def _create_html_acceptance_criteria(self, story: UserStory) -> str:
+        """Create HTML acceptance criteria for dedicated field"""
+        return self.renderer.story_acceptance_criteria(story)
+
+
+class AzureDevOpsManager(WorkItemDocumentBuilder):
+    """Main manager class for Azure DevOps operations"""
+    
+    DEFAULT_MAX_CONCURRENCY = 16
+    REPORTING_API_VERSION = "7.1-preview.2"
+    REVISIONS_PAGE_SIZE = 1000
+    WIQL_PAGE_SIZE = 20000  # Server-side cap on WIQL results
+    
+    def __init__(self, organization_url: str, personal_access_token: str, project_name: str,
+                 governor: Optional[RateLimitGovernor] = None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """Initialize Azure DevOps manager"""
+        self.governor = governor or RateLimitGovernor()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.project_name = project_name
+        self.organization_url = organization_url.rstrip('/')
+        self.max_concurrency = max_concurrency
+        
+        # One keep-alive session, sized to the concurrency, shared by the SDK clients and plain REST calls
+        self.session = requests.Session()
+        self.session.auth = ('', personal_access_token)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        adapter = GovernedHTTPAdapter(self.governor, pool_maxsize=max_concurrency)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        credentials = BasicAuthentication('', personal_access_token)
+        self.connection = Connection(base_url=organization_url, creds=credentials)
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+    
+    def __enter__(self) -> "AzureDevOpsManager":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        """Close the shared HTTP session and its pooled connections"""
+        self.session.close()
+    
+    @property
+    def wit_client(self):
+        """Work item tracking client, created on first use"""
+        return self.get_client('work_item_tracking')
+    
+    def get_client(self, client_type: str, api_version: str = ''):
+        """Return the cached SDK client for a type such as 'work_item_tracking' or 'core'.
+        
+        Clients are created lazily, so resource-area discovery only happens for
+        the areas a command actually uses. All of them send on the shared session
+        and every method call goes through the manager's RetryPolicy. The
+        released API version is used unless `api_version` (e.g. '7.1') is given.
+        """
+        key = (client_type, api_version)
+        with self._clients_lock:
+            if key not in self._clients:
+                factory = self.connection.clients
+                if api_version:
+                    factory = getattr(self.connection, f"clients_v{api_version.replace('.', '_')}")
+                client = getattr(factory, f"get_{client_type}_client")()
+                client.config.keep_alive = True
+                client.config.retry_policy.retries = 0  # RetryPolicy is the only retry layer
+                client.config.pipeline._sender.driver = SharedSessionSender(client.config, self.session)
+                self._clients[key] = RetryingClient(client, self.retry_policy)
+            return self._clients[key]
+    
+    def create_epic(self, epic: Epic) -> int:
+        """Create an epic work item"""
+        work_item = self.wit_client.create_work_item(
+            document=self.build_epic_document(epic), project=self.project_name, type="Epic"
+        )
+        
+        print(f"✅ Created Epic: {epic.title} (ID: {work_item.id})")
+        return work_item.id
+    
+    def create_user_story(self, story: UserStory, parent_id: Optional[int] = None) -> int:
+        """Create a user story work item"""
         work_item = self.wit_client.create_work_item(
-            document=document, project=self.project_name, type="User Story"
+            document=self.build_story_document(story, parent_id), project=self.project_name, type="User Story"
         )
         
         print(f"✅ Created User Story: {story.story_id} - {story.title} (ID: {work_item.id})")
@@ -110,110 +980,497 @@ class AzureDevOpsManager:
             print(f"❌ Failed to update work item {work_item_id}: {e}")
             return False
     
-    def update_epic_from_data(self, work_item_id: int, epic: Epic) -> bool:
-        """Update an epic with rich data from Epic object"""
-        html_description = self._create_epic_html_description(epic)
+    def get_work_items_bulk(self, ids: List[int], fields: Optional[List[str]] = None,
+                            expand: Optional[str] = None) -> Dict[int, object]:
+        """Fetch many work items via workitemsbatch, BATCH_SIZE IDs per request, keyed by ID.
         
-        updates = [
-            JsonPatchOperation(op="replace", path="/fields/System.Description", value=html_description),
-            JsonPatchOperation(op="replace", path="/fields/Microsoft.VSTS.Common.AcceptanceCriteria", value="")
-        ]
+        Only the requested fields are returned; IDs that do not exist or are not
+        accessible are omitted from the result.
+        """
+        work_items = {}
+        unique_ids = list(dict.fromkeys(ids))
+        
+        for start in range(0, len(unique_ids), self.BATCH_SIZE):
+            request = WorkItemBatchGetRequest(
+                ids=unique_ids[start:start + self.BATCH_SIZE],
+                fields=fields,
+                expand=expand,
+                error_policy="omit"
+            )
+            for work_item in self.wit_client.get_work_items_batch(request, project=self.project_name) or []:
+                if work_item is not None:
+                    work_items[work_item.id] = work_item
         
-        return self.update_work_item(work_item_id, updates)
+        return work_items
     
-    def update_story_from_data(self, work_item_id: int, story: UserStory) -> bool:
-        """Update a user story with data from UserStory object"""
-        clean_description = self._create_story_html_description(story)
-        html_acceptance_criteria = self._create_html_acceptance_criteria(story)
+    def query_ids(self, conditions: str = "") -> List[int]:
+        """IDs of the project's work items matching a WIQL condition, in ID order.
         
-        updates = [
-            JsonPatchOperation(op="replace", path="/fields/System.Description", value=clean_description),
-            JsonPatchOperation(op="replace", path="/fields/Microsoft.VSTS.Common.AcceptanceCriteria", value=html_acceptance_criteria)
-        ]
+        Pages past the WIQL result cap by ID, so `conditions` (e.g.
+        "[System.WorkItemType] = 'User Story'") must not contain ORDER BY.
+        """
+        project = self.project_name.replace("'", "''")
+        extra = f" AND ({conditions})" if conditions else ""
+        ids = []
+        last_id = 0
         
-        return self.update_work_item(work_item_id, updates)
+        while True:
+            query = (
+                f"SELECT [System.Id] FROM WorkItems WHERE [System.TeamProject] = '{project}'{extra} "
+                f"AND [System.Id] > {last_id} ORDER BY [System.Id]"
+            )
+            result = self.wit_client.query_by_wiql(Wiql(query=query), top=self.WIQL_PAGE_SIZE)
+            page = [reference.id for reference in result.work_items or []]
+            ids.extend(page)
+            if len(page) < self.WIQL_PAGE_SIZE:
+                return ids
+            last_id = page[-1]
     
-    def _create_epic_html_description(self, epic: Epic) -> str:
-        """Create HTML description for epic"""
-        metrics_html = "<ul>\n" + "\n".join(f"  <li>{metric}</li>" for metric in epic.success_metrics) + "\n</ul>" if epic.success_metrics else "<p>To be defined</p>"
-        risks_html = "<ul>\n" + "\n".join(f"  <li>{risk}</li>" for risk in epic.risk_factors) + "\n</ul>" if epic.risk_factors else "<p>To be assessed</p>"
+    def read_reporting_revisions(self, continuation_token: Optional[str] = None,
+                                 fields: Optional[List[str]] = None, include_deleted: bool = True,
+                                 max_page_size: int = REVISIONS_PAGE_SIZE) -> Dict:
+        """Read one page of the reporting revisions feed, latest revision per work item.
         
-        return f"""<h3>Epic Overview</h3>
-<p>{epic.overview or f'Core functionality for {epic.title} in the MAO MVP implementation'}</p>
-
-<h3>Business Value</h3>
-<p>{epic.business_value or 'Delivers essential capabilities for the MVP launch'}</p>
+        Returns the raw page with `values`, `continuationToken` and `isLastBatch`.
+        Pass the previous page's token to continue, or a token saved from an
+        earlier run to get only items changed since then. The SDK's
+        read_reporting_revisions_get drops these keys when deserializing, so
+        this goes to the REST endpoint directly.
+        """
+        params = {
+            "api-version": self.REPORTING_API_VERSION,
+            "includeLatestOnly": "true",
+            "includeDeleted": "true" if include_deleted else "false",
+            "$maxPageSize": max_page_size
+        }
+        if continuation_token:
+            params["continuationToken"] = continuation_token
+        if fields:
+            params["fields"] = ",".join(fields)
+        
+        return self.retry_policy.call('read_reporting_revisions', self._get_reporting_revisions, params)
+    
+    def _get_reporting_revisions(self, params: Dict) -> Dict:
+        response = self.session.get(
+            f"{self.organization_url}/{quote(self.project_name)}/_apis/wit/reporting/workitemrevisions",
+            params=params
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def update_work_items_batch(self, updates: Dict[int, List[JsonPatchOperation]]) -> Dict[int, BatchItemResult]:
+        """Update many work items through the $batch endpoint, BATCH_SIZE items per request"""
+        results = self._send_batches(updates)
+        
+        for result in results.values():
+            if not result.success:
+                print(f"❌ Failed to update work item {result.work_item_id}: {result.error}")
+        
+        return results
+    
+    def update_work_item_conditional(self, work_item_id: int,
+                                     apply: Callable[[object], Optional[List[JsonPatchOperation]]],
+                                     work_item=None, fields: Optional[List[str]] = None) -> bool:
+        """Write only if the work item is still at the revision the updates were built from.
+        
+        `apply` receives the current work item and returns the operations to send,
+        or nothing to skip the write. Pass a work item you already hold to skip the
+        initial read. On a revision conflict the item is re-fetched (only `fields`)
+        and `apply` runs again on the fresh copy. A write that fails with a 5xx or
+        a transport error may still have been applied, so it is not re-sent: the
+        item is re-read instead, and `apply` must return nothing once its change
+        is already there.
+        """
+        for _ in range(self.MAX_CONFLICT_ATTEMPTS):
+            try:
+                if work_item is None:
+                    work_item = self.get_work_items_bulk([work_item_id], fields=fields).get(work_item_id)
+                    if work_item is None:
+                        raise LookupError("work item not found or not accessible")
+                operations = apply(work_item)
+            except Exception as e:
+                print(f"❌ Failed to update work item {work_item_id}: {e}")
+                return False
+            
+            if not operations:
+                return True
+            
+            document = [self.build_revision_test(work_item.rev)] + list(operations)
+            try:
+                status_code = self.retry_policy.call(
+                    'update_work_item', self._patch_work_item, work_item_id, document, idempotent=False
+                )
+            except Exception as e:
+                if not self.retry_policy.is_retryable(e):
+                    print(f"❌ Failed to update work item {work_item_id}: {e}")
+                    return False
+                self.retry_policy.record_retry('unconfirmed write')
+                work_item = None
+                continue
+            
+            if status_code not in self.CONFLICT_STATUS:
+                return True
+            self.retry_policy.record_retry('revision conflict')
+            work_item = None
+        
+        self.retry_policy.record_failure('revision conflict')
+        print(f"❌ Failed to update work item {work_item_id}: no confirmed write after {self.MAX_CONFLICT_ATTEMPTS} attempts")
+        return False
+    
+    def update_work_items_conditional(self, work_items: Dict[int, object],
+                                      apply: Callable[[object], Optional[List[JsonPatchOperation]]],
+                                      fields: Optional[List[str]] = None) -> Dict[int, BatchItemResult]:
+        """Conditional writes for many work items through $batch.
+        
+        `work_items` maps each ID to a work item already held, or None to read it
+        first. Items whose revision moved, or whose write is unconfirmed after a
+        5xx or transport error, are re-fetched together and re-applied; as with
+        update_work_item_conditional, `apply` must skip changes already present.
+        """
+        results = {}
+        pending = dict(work_items)
+        
+        for _ in range(self.MAX_CONFLICT_ATTEMPTS):
+            missing = [work_item_id for work_item_id, work_item in pending.items() if work_item is None]
+            if missing:
+                fetched = self.get_work_items_bulk(missing, fields=fields)
+                for work_item_id in missing:
+                    if work_item_id in fetched:
+                        pending[work_item_id] = fetched[work_item_id]
+                    else:
+                        del pending[work_item_id]
+                        results[work_item_id] = BatchItemResult(work_item_id, False, 404, "work item not found or not accessible")
+            
+            updates = {}
+            for work_item_id, work_item in pending.items():
+                operations = apply(work_item)
+                if operations:
+                    updates[work_item_id] = [self.build_revision_test(work_item.rev)] + list(operations)
+                else:
+                    results[work_item_id] = BatchItemResult(work_item_id, True, 304)
+            
+            batch_results = self._send_batches(updates, idempotent=False)
+            results.update(batch_results)
+            
+            conflicted = [work_item_id for work_item_id, result in batch_results.items()
+                          if result.status_code in self.CONFLICT_STATUS]
+            unconfirmed = [work_item_id for work_item_id, result in batch_results.items()
+                           if result.status_code == 0 or result.status_code in RetryPolicy.RETRYABLE_STATUS]
+            if not conflicted and not unconfirmed:
+                break
+            if conflicted:
+                self.retry_policy.record_retry('revision conflict', len(conflicted))
+            if unconfirmed:
+                self.retry_policy.record_retry('unconfirmed write', len(unconfirmed))
+            pending = {work_item_id: None for work_item_id in conflicted + unconfirmed}
+        
+        for result in results.values():
+            if not result.success:
+                print(f"❌ Failed to update work item {result.work_item_id}: {result.error}")
+        
+        return results
+    
+    def delete_work_items(self, ids: List[int], destroy: bool = False,
+                          on_batch: Optional[Callable[[Dict[int, BatchItemResult]], None]] = None
+                          ) -> Dict[int, BatchItemResult]:
+        """Delete work items through concurrent workitemsdelete requests, BATCH_SIZE IDs each.
+        
+        Deleted items go to the Recycle Bin and can be restored with
+        restore_work_items; destroy=True deletes them permanently. `on_batch` is
+        called in this thread with each batch's results as they arrive.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        chunks = [unique_ids[start:start + self.BATCH_SIZE] for start in range(0, len(unique_ids), self.BATCH_SIZE)]
+        
+        results = {}
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for chunk_results in executor.map(lambda chunk: self._delete_batch(chunk, destroy), chunks):
+                results.update(chunk_results)
+                if on_batch:
+                    on_batch(chunk_results)
+        
+        failed = [result for result in results.values() if not result.success]
+        if failed:
+            self.retry_policy.record_failure('workitemsdelete item', len(failed))
+        for result in failed:
+            print(f"❌ Failed to delete work item {result.work_item_id}: {result.error}")
+        
+        return results
+    
+    def _delete_batch(self, chunk: List[int], destroy: bool) -> Dict[int, BatchItemResult]:
+        request = WorkItemDeleteBatchRequest(ids=chunk, destroy=destroy, skip_notifications=True)
+        try:
+            # The workitemsdelete batch endpoint is only in the 7.1 client
+            response = self.get_client('work_item_tracking', '7.1').delete_work_items(request, project=self.project_name)
+        except Exception as e:
+            status_code = RetryPolicy.status_code(e) or 0
+            results = {work_item_id: BatchItemResult(work_item_id, False, status_code, str(e)) for work_item_id in chunk}
+            if self.retry_policy.is_retryable(e):
+                # The batch may have been applied; items that can no longer be read were deleted
+                self.retry_policy.record_retry('unconfirmed delete')
+                try:
+                    remaining = self.get_work_items_bulk(chunk, fields=['System.Id'])
+                except Exception:
+                    return results
+                for work_item_id in chunk:
+                    if work_item_id not in remaining:
+                        results[work_item_id] = BatchItemResult(work_item_id, True, 200)
+            return results
+        
+        results = {work_item_id: BatchItemResult(work_item_id, False, 0, "no result returned") for work_item_id in chunk}
+        for deleted in response.results or []:
+            status_code = deleted.code or 200
+            results[deleted.id] = BatchItemResult(deleted.id, 200 <= status_code < 300, status_code, deleted.message or '')
+        return results
+    
+    def restore_work_items(self, ids: List[int]) -> Dict[int, BatchItemResult]:
+        """Restore deleted work items from the Recycle Bin, max_concurrency requests at a time"""
+        payload = WorkItemDeleteUpdate(is_deleted=False)
+        
+        def restore(work_item_id):
+            try:
+                self.wit_client.restore_work_item(payload, work_item_id, project=self.project_name)
+                return BatchItemResult(work_item_id, True, 200)
+            except Exception as e:
+                print(f"❌ Failed to restore work item {work_item_id}: {e}")
+                return BatchItemResult(work_item_id, False, RetryPolicy.status_code(e) or 0, str(e))
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            return {result.work_item_id: result for result in executor.map(restore, dict.fromkeys(ids))}
+    
+    def _patch_work_item(self, work_item_id: int, document: List[JsonPatchOperation]) -> int:
+        """PATCH one work item and return the status, raising for anything but success or a revision conflict"""
+        response = self.session.patch(
+            f"{self.organization_url}/_apis/wit/workitems/{work_item_id}",
+            params={"api-version": self.API_VERSION},
+            data=json.dumps([operation.serialize() for operation in document]),
+            headers={"Content-Type": "application/json-patch+json"}
+        )
+        if response.status_code not in self.CONFLICT_STATUS:
+            response.raise_for_status()
+        return response.status_code
+    
+    def _send_batches(self, updates: Dict[int, List[JsonPatchOperation]],
+                      idempotent: bool = True) -> Dict[int, BatchItemResult]:
+        """Send updates as consecutive $batch requests of at most BATCH_SIZE items"""
+        results = {}
+        items = list(updates.items())
+        
+        for start in range(0, len(items), self.BATCH_SIZE):
+            results.update(self._send_batch(items[start:start + self.BATCH_SIZE], idempotent))
+        
+        return results
+    
+    def _send_batch(self, chunk: List[Tuple[int, List[JsonPatchOperation]]],
+                    idempotent: bool = True) -> Dict[int, BatchItemResult]:
+        """Send one $batch request, re-sending items that failed with a retryable status.
+        
+        Non-idempotent updates are only re-sent after a 429, where nothing was applied.
+        """
+        results = {}
+        pending = chunk
+        
+        for attempt in range(self.retry_policy.max_attempts):
+            try:
+                responses = self.retry_policy.call('$batch', self._post_batch, pending, idempotent=idempotent)
+            except Exception as e:
+                print(f"❌ Batch request failed for {len(pending)} work items: {e}")
+                status_code = RetryPolicy.status_code(e) or 0
+                results.update({work_item_id: BatchItemResult(work_item_id, False, status_code, str(e)) for work_item_id, _ in pending})
+                break
+            
+            results.update(self.map_batch_responses(pending, responses))
+            pending = [(work_item_id, operations) for work_item_id, operations in pending
+                       if self.retry_policy.should_retry_status(results[work_item_id].status_code, idempotent)]
+            if not pending or attempt + 1 >= self.retry_policy.max_attempts:
+                break
+            self.retry_policy.record_retry('$batch item', len(pending))
+            time.sleep(self.retry_policy.backoff(attempt))
+        
+        failed = sum(1 for work_item_id, _ in chunk if not results[work_item_id].success)
+        if failed:
+            self.retry_policy.record_failure('$batch item', failed)
+        return results
+    
+    def _post_batch(self, chunk: List[Tuple[int, List[JsonPatchOperation]]]) -> List[Dict]:
+        response = self.session.post(
+            f"{self.organization_url}/_apis/wit/$batch",
+            params={"api-version": self.API_VERSION},
+            json=self.build_batch_request(chunk)
+        )
+        response.raise_for_status()
+        return response.json().get('value', [])
+    
+    def update_epic_from_data(self, work_item_id: int, epic: Epic) -> bool:
+        """Update an epic with rich data from Epic object"""
+        return self.update_work_item(work_item_id, self.build_epic_updates(epic))
+    
+    def update_story_from_data(self, work_item_id: int, story: UserStory) -> bool:
+        """Update a user story with data from UserStory object"""
+        return self.update_work_item(work_item_id, self.build_story_updates(story))
 
-<h3>Key Stakeholders</h3>
-<p>{epic.stakeholders or 'Development Team, Product Owner, End Users'}</p>
 
-<h3>Success Metrics</h3>
-{metrics_html}
 
-<h3>Risk Factors</h3>
-{risks_html}"""
+class StorySectionParser:
+    """Line-at-a-time parser for the body of one user story section.
     
-    def _create_story_html_description(self, story: UserStory) -> str:
-        """Create clean HTML description for user story (no acceptance criteria)"""
-        tech_notes = story.technical_notes or "None"
-        if tech_notes != "None":
-            tech_notes = re.sub(r'```(\w+)?\n(.*?)```', r'<pre><code>\2</code></pre>', tech_notes, flags=re.DOTALL)
-            tech_notes = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', tech_notes)
-            tech_notes = tech_notes.replace('\n', '<br/>')
+    Lines are fed as they are read (without the trailing newline), so a story
+    is built without holding its section text; build() returns the UserStory.
+    """
+    
+    def __init__(self, story_id: str, title: str):
+        self.story_data = {
+            'story_id': story_id, 'title': title, 'epic': '', 'priority': 'P1', 'story_points': 5,
+            'as_a': '', 'i_want': '', 'so_that': '', 'acceptance_criteria_structured': [],
+            'dependencies': 'None', 'technical_notes': ''
+        }
+        self.current_section = None
+        self.acceptance_buffer = []
+        self.technical_buffer = []
+        self.dependencies_buffer = []
+        self.in_code_block = False
+        self.pending_blank_lines = []  # Blank code lines are kept only if more content follows
+        self.stopped = False
+    
+    def feed(self, raw_line: str):
+        """Consume one line of the section"""
+        if self.stopped:
+            return
         
-        return f"""<h3>User Story</h3>
-<p><strong>As a</strong> {story.as_a}<br/>
-<strong>I want</strong> {story.i_want}<br/>
-<strong>So that</strong> {story.so_that}</p>
-
-<h3>Dependencies</h3>
-<p>{story.dependencies}</p>
-
-<h3>Technical Notes</h3>
-<p>{tech_notes}</p>"""
+        line = raw_line.strip()
+        
+        # Code blocks in technical notes are copied until the closing fence
+        if self.in_code_block:
+            if not line:
+                self.pending_blank_lines.append(raw_line)
+                return
+            self.technical_buffer.extend(self.pending_blank_lines)
+            self.pending_blank_lines = []
+            self.technical_buffer.append(line)
+            if line.endswith('```'):
+                self.in_code_block = False
+            return
+        
+        # Stop at next heading of the same level
+        if line.startswith('#### '):
+            self.stopped = True
+            return
+        
+        # Skip empty lines
+        if not line:
+            return
+        
+        # Parse basic fields
+        if line.startswith('**Priority:**'):
+            self.story_data['priority'] = line.split('**Priority:**')[1].strip()
+        elif line.startswith('**Story Points:**'):
+            try:
+                self.story_data['story_points'] = int(line.split('**Story Points:**')[1].strip())
+            except ValueError:
+                self.story_data['story_points'] = 5
+        elif line.startswith('**As a**'):
+            self.story_data['as_a'] = line.replace('**As a**', '').strip()
+        elif line.startswith('**I want**'):
+            self.story_data['i_want'] = line.replace('**I want**', '').strip()
+        elif line.startswith('**So that**'):
+            self.story_data['so_that'] = line.replace('**So that**', '').strip()
+        
+        # Parse section headers
+        elif line.startswith('**Acceptance Criteria:**'):
+            self.current_section = 'acceptance'
+        elif line.startswith('**Dependencies:**'):
+            self.current_section = 'dependencies'
+            # Check if dependencies are on the same line
+            deps_content = line.replace('**Dependencies:**', '').strip()
+            if deps_content:
+                self.dependencies_buffer.append(deps_content)
+        elif line.startswith('**Technical Notes:**'):
+            self.current_section = 'technical'
+        
+        # Parse section content
+        elif self.current_section == 'acceptance':
+            if line.startswith('-'):
+                criteria = line.lstrip('- ').strip()
+                if criteria:
+                    self.acceptance_buffer.append(criteria)
+            elif not line.startswith('**'):
+                # Handle multi-line acceptance criteria
+                if self.acceptance_buffer:
+                    self.acceptance_buffer[-1] += ' ' + line
+        
+        elif self.current_section == 'dependencies':
+            if not line.startswith('**'):
+                self.dependencies_buffer.append(line)
+        
+        elif self.current_section == 'technical':
+            if not line.startswith('**'):
+                self.technical_buffer.append(line)
+                # Start of code block - collect until end
+                if line.startswith('```'):
+                    self.in_code_block = True
     
-    def _create_html_acceptance_criteria(self, story: UserStory) -> str:
-        """Create HTML acceptance criteria for dedicated field"""
-        if not story.acceptance_criteria_structured:
-            return "To be defined during implementation"
+    def build(self) -> UserStory:
+        """Finish the section and return the parsed story"""
+        story_data = dict(self.story_data)
         
-        html = "<ul>\n"
-        for scenario in story.acceptance_criteria_structured:
-            html += f'  <li><strong>{scenario["given"]}</strong>\n'
-            if scenario.get('when_then'):
-                html += '    <ul>\n'
-                for sub_criteria in scenario['when_then']:
-                    html += f'      <li>{sub_criteria}</li>\n'
-                html += '    </ul>\n'
-            html += '  </li>\n'
-        html += "</ul>"
+        # Process dependencies
+        if self.dependencies_buffer:
+            story_data['dependencies'] = ' '.join(self.dependencies_buffer).strip()
+            if not story_data['dependencies']:
+                story_data['dependencies'] = 'None'
+        
+        # Process acceptance criteria
+        story_data['acceptance_criteria_structured'] = MarkdownParser._structure_acceptance_criteria(self.acceptance_buffer)
+        
+        # Process technical notes
+        if self.technical_buffer:
+            story_data['technical_notes'] = '\n'.join(self.technical_buffer)
         
-        return html
+        return UserStory(**story_data)
 
 
 class MarkdownParser:
     """Parser for extracting user stories and epics from markdown files"""
     
+    PARSER_VERSION = "1"  # Bump whenever parsing output changes, so cached results are not reused
+    STORY_HEADING = re.compile(r'#### ([A-Z]+-\d+): (.+)')
+    EPIC_HEADING = re.compile(r'## Epic \d+: (.+)')
+    
     @staticmethod
     def parse_user_stories(file_path: str) -> Dict[str, UserStory]:
         """Parse user stories from markdown file"""
-        with open(file_path, 'r') as f:
-            content = f.read()
-        
         stories = {}
-        story_sections = re.split(r'#### ([A-Z]+-\d+): (.+)', content)
+        for story in MarkdownParser.iter_user_stories(file_path):
+            stories[story.story_id] = story
+        return stories
+    
+    @staticmethod
+    def iter_user_stories(file_path: str) -> Iterator[UserStory]:
+        """Yield user stories in file order, reading one line at a time.
+        
+        Memory use is bounded by the largest story, not the file size.
+        """
+        section = None
         
-        for i in range(1, len(story_sections), 3):
-            if i+2 < len(story_sections):
-                story_id = story_sections[i]
-                story_title = story_sections[i+1]
-                story_content = story_sections[i+2]
+        with open(file_path, 'r') as f:
+            for raw_line in f:
+                raw_line = raw_line.rstrip('\n')
+                
+                # Cheap substring test first; most lines are not headings
+                match = MarkdownParser.STORY_HEADING.search(raw_line) if '#### ' in raw_line else None
+                if match is None:
+                    if section is not None:
+                        section.feed(raw_line)
+                    continue
                 
-                parsed_story = MarkdownParser._parse_story_content(story_id, story_title, story_content)
-                if parsed_story:
-                    stories[story_id] = parsed_story
+                # Text before the heading on the same line still belongs to the previous story
+                if section is not None:
+                    section.feed(raw_line[:match.start()])
+                    yield section.build()
+                section = StorySectionParser(match.group(1), match.group(2))
         
-        return stories
+        if section is not None:
+            yield section.build()
     
     @staticmethod
     def parse_epics(file_path: str) -> Dict[str, Epic]:
@@ -240,107 +1497,70 @@ class MarkdownParser:
         return epics
     
     @staticmethod
-    def _parse_story_content(story_id: str, title: str, content: str) -> Optional[UserStory]:
-        """Parse individual story content"""
-        story_data = {
-            'story_id': story_id, 'title': title, 'epic': '', 'priority': 'P1', 'story_points': 5,
-            'as_a': '', 'i_want': '', 'so_that': '', 'acceptance_criteria_structured': [],
-            'dependencies': 'None', 'technical_notes': ''
-        }
+    def index_sections(data: bytes) -> List[SectionRecord]:
+        """Locate every story and epic section in one pass over the raw file bytes.
         
-        lines = content.strip().split('\n')
-        current_section = None
-        acceptance_buffer = []
-        technical_buffer = []
-        dependencies_buffer = []
+        Section boundaries follow parse_user_stories and parse_epics exactly: a
+        story runs to the next story heading, an epic to the next '## Epic ' line.
+        """
+        records = []
+        story = None  # (story ID, start offset) of the open story section
+        epic = None  # (epic title, start offset) of the open epic section
+        offset = 0
         
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Stop at next story
-            if line.startswith('#### '):
-                break
+        def close(kind, section, end):
+            key, start = section
+            records.append(SectionRecord(kind, key, start, end, hashlib.sha256(data[start:end]).hexdigest()))
+        
+        for raw_line in io.BytesIO(data):
+            line = raw_line.decode('utf-8')
             
-            # Skip empty lines
-            if not line:
-                i += 1
-                continue
+            if line.startswith('## Epic '):
+                if epic is not None:
+                    close('epic', epic, offset)
+                    epic = None
+                match = MarkdownParser.EPIC_HEADING.match(line) if offset > 0 else None
+                if match:
+                    epic = (match.group(1).strip(), offset)
             
-            # Parse basic fields
-            if line.startswith('**Priority:**'):
-                story_data['priority'] = line.split('**Priority:**')[1].strip()
-            elif line.startswith('**Story Points:**'):
-                try:
-                    story_data['story_points'] = int(line.split('**Story Points:**')[1].strip())
-                except:
-                    story_data['story_points'] = 5
-            elif line.startswith('**As a**'):
-                story_data['as_a'] = line.replace('**As a**', '').strip()
-            elif line.startswith('**I want**'):
-                story_data['i_want'] = line.replace('**I want**', '').strip()
-            elif line.startswith('**So that**'):
-                story_data['so_that'] = line.replace('**So that**', '').strip()
-                
-            # Parse section headers
-            elif line.startswith('**Acceptance Criteria:**'):
-                current_section = 'acceptance'
-            elif line.startswith('**Dependencies:**'):
-                current_section = 'dependencies'
-                # Check if dependencies are on the same line
-                deps_content = line.replace('**Dependencies:**', '').strip()
-                if deps_content:
-                    dependencies_buffer.append(deps_content)
-            elif line.startswith('**Technical Notes:**'):
-                current_section = 'technical'
-                
-            # Parse section content
-            elif current_section == 'acceptance':
-                if line.startswith('-') or line.startswith('  -'):
-                    criteria = line.lstrip('- ').strip()
-                    if criteria:
-                        acceptance_buffer.append(criteria)
-                elif line and not line.startswith('**'):
-                    # Handle multi-line acceptance criteria
-                    if acceptance_buffer:
-                        acceptance_buffer[-1] += ' ' + line
-                        
-            elif current_section == 'dependencies':
-                if line and not line.startswith('**'):
-                    dependencies_buffer.append(line)
-                    
-            elif current_section == 'technical':
-                if line and not line.startswith('**'):
-                    # Handle code blocks properly
-                    if line.startswith('```'):
-                        # Start of code block - collect until end
-                        technical_buffer.append(line)
-                        i += 1
-                        while i < len(lines):
-                            code_line = lines[i].strip() if lines[i].strip() else lines[i]
-                            technical_buffer.append(code_line)
-                            if code_line.strip().endswith('```'):
-                                break
-                            i += 1
-                    else:
-                        technical_buffer.append(line)
+            match = MarkdownParser.STORY_HEADING.search(line) if '#### ' in line else None
+            if match:
+                start = offset + len(line[:match.start()].encode('utf-8'))
+                if story is not None:
+                    close('story', story, start)
+                story = (match.group(1), start)
             
-            i += 1
+            offset += len(raw_line)
         
-        # Process dependencies
-        if dependencies_buffer:
-            story_data['dependencies'] = ' '.join(dependencies_buffer).strip()
-            if not story_data['dependencies']:
-                story_data['dependencies'] = 'None'
+        if story is not None:
+            close('story', story, offset)
+        if epic is not None:
+            close('epic', epic, offset)
         
-        # Process acceptance criteria
-        story_data['acceptance_criteria_structured'] = MarkdownParser._structure_acceptance_criteria(acceptance_buffer)
+        records.sort(key=lambda record: record.start)
+        return records
+    
+    @staticmethod
+    def parse_section(data: bytes, record: SectionRecord):
+        """Parse one section located by index_sections into a UserStory or Epic"""
+        text = data[record.start:record.end].decode('utf-8').replace('\r\n', '\n')
+        heading, _, body = text.partition('\n')
         
-        # Process technical notes
-        if technical_buffer:
-            story_data['technical_notes'] = '\n'.join(technical_buffer)
+        if record.kind == 'epic':
+            return MarkdownParser._parse_epic_content(record.key, body)
         
-        return UserStory(**story_data)
+        section = StorySectionParser(record.key, MarkdownParser.STORY_HEADING.match(heading).group(2))
+        for line in body.split('\n'):
+            section.feed(line)
+        return section.build()
+    
+    @staticmethod
+    def _parse_story_content(story_id: str, title: str, content: str) -> Optional[UserStory]:
+        """Parse individual story content"""
+        section = StorySectionParser(story_id, title)
+        for line in content.strip().split('\n'):
+            section.feed(line)
+        return section.build()
     
     @staticmethod
     def _parse_epic_content(title: str, content: str) -> Optional[Epic]:
@@ -414,6 +1634,271 @@ class MarkdownParser:
         return structured
 
 
+class IncrementalMarkdownParser:
+    """Keeps the parse of one markdown file and re-parses only edited sections.
+    
+    Every story and epic section is recorded with its byte range and SHA-256.
+    On update() only sections whose hash changed are parsed again, and the
+    returned ParseDelta lists what was added, changed or removed:
+        
+        parser = IncrementalMarkdownParser()
+        parser.update(markdown_file)           # first call: everything is added
+        delta = parser.update(markdown_file)   # later: only the edits
+        for story_id, story in delta.changed_stories.items(): ...
+    
+    `stories` and `epics` always match parse_user_stories and parse_epics.
+    The parser pickles, so its state can be kept between runs.
+    """
+    
+    def __init__(self):
+        self.file_digest: Optional[str] = None
+        self.sections: Dict[Tuple[str, str], SectionRecord] = {}
+        self.stories: Dict[str, UserStory] = {}
+        self.epics: Dict[str, Epic] = {}
+    
+    def update(self, file_path: str) -> ParseDelta:
+        """Re-parse the sections of file_path that changed since the last update"""
+        data = Path(file_path).read_bytes()
+        file_digest = hashlib.sha256(data).hexdigest()
+        if file_digest == self.file_digest:
+            return ParseDelta()
+        
+        records = MarkdownParser.index_sections(data)
+        # Like the dict-building parsers, a repeated key keeps its first position and last content
+        sections = {(record.kind, record.key): record for record in records}
+        previous = {'story': self.stories, 'epic': self.epics}
+        current = {'story': {}, 'epic': {}}
+        delta = ParseDelta()
+        added = {'story': delta.added_stories, 'epic': delta.added_epics}
+        changed = {'story': delta.changed_stories, 'epic': delta.changed_epics}
+        
+        for record in records:
+            kind, key = record.kind, record.key
+            if key in current[kind]:
+                continue
+            
+            record = sections[(kind, key)]
+            old_record = self.sections.get((kind, key))
+            if old_record is not None and old_record.digest == record.digest:
+                current[kind][key] = previous[kind][key]
+                continue
+            
+            parsed = MarkdownParser.parse_section(data, record)
+            current[kind][key] = parsed
+            if key not in previous[kind]:
+                added[kind][key] = parsed
+            elif previous[kind][key] != parsed:
+                changed[kind][key] = parsed
+        
+        delta.removed_stories = [key for key in self.stories if key not in current['story']]
+        delta.removed_epics = [key for key in self.epics if key not in current['epic']]
+        
+        self.file_digest = file_digest
+        self.sections = sections
+        self.stories = current['story']
+        self.epics = current['epic']
+        return delta
+
+
+class DocumentIndex:
+    """Headings and fenced code blocks of one markdown file, mapped to byte offsets.
+    
+    The file is scanned once when the index is built; lookups slice an mmap of
+    the file instead of reading it again. DocumentIndex.open() keeps one index
+    per file for the life of the process and rebuilds it when the file changes:
+        
+        index = DocumentIndex.open(user_story_dir / "UC-004-Bundle-Pack-Workflow.md")
+        diagram = index.code('mermaid', heading='System Workflow Diagram')
+        steps = index.section_text('Process Steps')
+    """
+    
+    HEADING = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+    _open_indexes: Dict[str, "DocumentIndex"] = {}
+    
+    def __init__(self, file_path: str):
+        self.path = Path(file_path)
+        stat = self.path.stat()
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self.headings: List[HeadingRecord] = []
+        self.code_blocks: List[CodeBlockRecord] = []
+        
+        with open(self.path, 'rb') as f:
+            # mmap refuses empty files; an empty bytes object serves the same lookups
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+        self._scan()
+    
+    @classmethod
+    def open(cls, file_path: str) -> "DocumentIndex":
+        """Shared index for file_path, rebuilt only if the file changed since it was built.
+        
+        A replaced index is not closed, since earlier callers may still hold it;
+        its mmap is released when the last of them drops it.
+        """
+        key = str(Path(file_path).resolve())
+        stat = os.stat(key)
+        index = cls._open_indexes.get(key)
+        if index is None or index.signature != (stat.st_mtime_ns, stat.st_size):
+            index = cls._open_indexes[key] = cls(key)
+        return index
+    
+    @classmethod
+    def close_all(cls):
+        for index in cls._open_indexes.values():
+            index.close()
+        cls._open_indexes.clear()
+    
+    def __enter__(self) -> "DocumentIndex":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+    
+    def heading_titles(self, level: Optional[int] = None) -> List[str]:
+        return [heading.title for heading in self.headings if level is None or heading.level == level]
+    
+    def find_heading(self, title: str) -> Optional[HeadingRecord]:
+        """First heading whose title contains `title`"""
+        return next((heading for heading in self.headings if title in heading.title), None)
+    
+    def find_code_blocks(self, language: Optional[str] = None, heading: Optional[str] = None) -> List[CodeBlockRecord]:
+        """Code blocks in file order, filtered by language and by the exact title they appear under"""
+        return [
+            block for block in self.code_blocks
+            if (language is None or block.language == language) and (heading is None or block.heading == heading)
+        ]
+    
+    def code(self, language: str = 'mermaid', heading: Optional[str] = None) -> str:
+        """Stripped code of the first matching block, or an empty string"""
+        blocks = self.find_code_blocks(language, heading)
+        return self.text(blocks[0].start, blocks[0].end).strip() if blocks else ""
+    
+    def section_text(self, title: str) -> str:
+        """Body of the first section whose heading contains `title`, without the heading line"""
+        heading = self.find_heading(title)
+        if heading is None:
+            return ""
+        body_start = self._buffer.find(b'\n', heading.start, heading.end)
+        return self.text(body_start + 1, heading.end).strip() if body_start != -1 else ""
+    
+    def contains(self, text: str) -> bool:
+        return self._buffer.find(text.encode('utf-8')) != -1
+    
+    def search(self, pattern: bytes):
+        """re.search over the raw bytes of the file"""
+        return re.search(pattern, self._buffer)
+    
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        return self._buffer[start:end].decode('utf-8')
+    
+    def _scan(self):
+        """Single pass over the mapped file recording headings and fenced code blocks"""
+        buffer = self._buffer
+        size = len(buffer)
+        current_heading = ""
+        fence = None  # (language, opening line, first code byte) while inside a code block
+        offset = 0
+        line_number = 0
+        
+        while offset < size:
+            line_end = buffer.find(b'\n', offset)
+            next_offset = size if line_end == -1 else line_end + 1
+            line_number += 1
+            stripped = buffer[offset:next_offset].strip()
+            
+            if fence is not None:
+                if stripped.startswith(b'```'):
+                    language, opened_at, code_start = fence
+                    self.code_blocks.append(CodeBlockRecord(language, current_heading, opened_at, code_start, offset))
+                    fence = None
+            elif stripped.startswith(b'```'):
+                fence = (stripped[3:].strip().lower().decode('utf-8'), line_number, next_offset)
+            elif stripped.startswith(b'#'):
+                match = self.HEADING.match(stripped.decode('utf-8'))
+                if match:
+                    current_heading = match.group(2)
+                    self.headings.append(HeadingRecord(len(match.group(1)), current_heading, line_number, offset, size))
+            
+            offset = next_offset
+        
+        # A section runs until the next heading of the same or a higher level
+        open_sections: List[HeadingRecord] = []
+        for heading in self.headings:
+            while open_sections and open_sections[-1].level >= heading.level:
+                open_sections.pop().end = heading.start
+            open_sections.append(heading)
+
+
+class ParseCache:
+    """Content-addressed on-disk cache of markdown parse results.
+    
+    Entries are keyed by the SHA-256 of the file contents, the kind of result
+    and the parser version, and stored with pickle. An unchanged file is never
+    parsed twice; editing it (or bumping PARSER_VERSION) misses the cache:
+        
+        cache = ParseCache()
+        stories = cache.user_stories(markdown_file)
+        epics = cache.epics(markdown_file)
+    """
+    
+    DEFAULT_DIR = Path(__file__).parent / ".parse_cache"
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir or os.getenv('AZURE_DEVOPS_PARSE_CACHE') or self.DEFAULT_DIR)
+    
+    def user_stories(self, file_path: str) -> Dict[str, UserStory]:
+        return self.get_or_parse('user_stories', file_path, MarkdownParser.parse_user_stories)
+    
+    def epics(self, file_path: str) -> Dict[str, Epic]:
+        return self.get_or_parse('epics', file_path, MarkdownParser.parse_epics)
+    
+    def get_or_parse(self, kind: str, file_path: str, parse: Callable[[str], Any],
+                     version: str = MarkdownParser.PARSER_VERSION) -> Any:
+        """Return the cached result of parse(file_path), parsing and storing it on a miss"""
+        entry = self.cache_dir / f"{kind}-v{version}-{self.file_digest(file_path)}.pickle"
+        
+        try:
+            with open(entry, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            # Unreadable or written by incompatible code; parse again and overwrite
+            print(f"⚠️  Ignoring unreadable parse cache entry {entry.name}: {e}")
+        
+        result = parse(file_path)
+        self._store(entry, result)
+        return result
+    
+    def clear(self):
+        """Remove every cached entry"""
+        for entry in self.cache_dir.glob("*.pickle"):
+            entry.unlink()
+    
+    @staticmethod
+    def file_digest(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def _store(self, entry: Path, result: Any):
+        """Write atomically so concurrent runs never read a partial entry"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
 class ConfigManager:
     """Manages configuration and environment setup"""
     
@@ -452,6 +1937,22 @@ class ConfigManager:
         mapping_file = config_dir / "work_item_mapping.json"
         with open(mapping_file, 'w') as f:
             json.dump(mapping, f, indent=2)
+    
+    @staticmethod
+    def load_field_hashes(config_dir: Path) -> Dict[str, Dict[str, str]]:
+        """Load the field hashes recorded at the last sync, keyed by work item ID"""
+        hashes_file = config_dir / "work_item_hashes.json"
+        if hashes_file.exists():
+            with open(hashes_file, 'r') as f:
+                return json.load(f)
+        return {}
+    
+    @staticmethod
+    def save_field_hashes(config_dir: Path, hashes: Dict[str, Dict[str, str]]):
+        """Save field hashes next to the work item mapping"""
+        hashes_file = config_dir / "work_item_hashes.json"
+        with open(hashes_file, 'w') as f:
+            json.dump(hashes, f, indent=2, sort_keys=True)
 
 
 if __name__ == "__main__":
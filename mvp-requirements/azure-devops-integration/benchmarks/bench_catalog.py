@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark RequirementsCatalog.build across worker counts
+Copies the requirements sources --copies times into a temporary tree and times
+a full catalog build with 1..N worker processes.
+
+    python benchmarks/bench_catalog.py --copies 200
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from requirements_catalog import REQUIREMENTS_ROOT, SOURCE_DIRS, RequirementsCatalog
+
+
+def build_tree(root: Path, copies: int) -> int:
+    """Replicate every source directory `copies` times under root"""
+    count = 0
+    for source_dir in SOURCE_DIRS:
+        for path in (REQUIREMENTS_ROOT / source_dir).rglob('*.md'):
+            relative = path.relative_to(REQUIREMENTS_ROOT / source_dir)
+            for copy in range(copies):
+                target = root / source_dir / f"copy-{copy:04d}" / relative
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, target)
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--copies', type=int, default=200, help="copies of the source tree (default: 200)")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        files = build_tree(root, args.copies)
+        print(f"📝 {files} documents, {sum(p.stat().st_size for p in root.rglob('*.md')) / (1024 * 1024):.1f} MB")
+        
+        baseline = None
+        print(f"\n{'workers':>7} {'seconds':>9} {'speedup':>8}")
+        workers = 1
+        while workers <= args.max_workers:
+            started = time.perf_counter()
+            catalog = RequirementsCatalog.build(root, max_workers=workers)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"{workers:>7} {elapsed:>9.2f} {baseline / elapsed:>7.1f}x")
+            workers *= 2
+        
+        print(f"\n📖 {len(catalog.stories)} stories, 📊 {len(catalog.mermaid_blocks)} Mermaid blocks")
+
+
+if __name__ == "__main__":
+    main()
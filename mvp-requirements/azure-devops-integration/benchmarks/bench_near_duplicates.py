@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark near-duplicate detection with MinHash/LSH
+Indexes --items synthetic stories, one in --copy-every of them followed by an
+edited copy, and reports signature and grouping time, plus recall and the
+all-pairs cost on a --sample subset checked against exact Jaccard similarity.
+
+    python benchmarks/bench_near_duplicates.py --items 100000 --threshold 0.8
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from near_duplicates import MinHasher, NearDuplicateIndex
+
+
+def build_texts(count: int, copy_every: int, seed: int = 0):
+    """Random stories of 30-400 words; copies have up to 5% of their words replaced"""
+    generator = random.Random(seed)
+    vocabulary = [f"term{number}" for number in range(20000)]
+    texts = {}
+    copies = {}
+    while len(texts) < count:
+        key = len(texts)
+        words = generator.choices(vocabulary, k=generator.randint(30, 400))
+        texts[key] = " ".join(words)
+        if key % copy_every == 0 and len(texts) < count:
+            for _ in range(generator.randint(0, len(words) // 20)):
+                words[generator.randrange(len(words))] = generator.choice(vocabulary)
+            texts[key + 1] = " ".join(words)
+            copies[key + 1] = key
+    return texts, copies
+
+
+def timed(run):
+    started = time.perf_counter()
+    result = run()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=100000, help="number of items (default: 100000)")
+    parser.add_argument('--threshold', type=float, default=0.8, help="similarity threshold (default: 0.8)")
+    parser.add_argument('--copy-every', type=int, default=20, help="add an edited copy after every Nth item (default: 20)")
+    parser.add_argument('--max-workers', type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument('--sample', type=int, default=2000, help="items checked against exact similarity (default: 2000)")
+    args = parser.parse_args()
+    
+    texts, copies = build_texts(args.items, args.copy_every)
+    index = NearDuplicateIndex(threshold=args.threshold)
+    print(f"📝 {len(texts)} items, {len(copies)} edited copies, threshold {args.threshold} "
+          f"({index.bands} bands x {index.rows} rows)")
+    
+    signature_time, _ = timed(lambda: index.add_many(texts, max_workers=args.max_workers))
+    group_time, groups = timed(index.groups)
+    print(f"\n{'step':<24} {'seconds':>9}")
+    print(f"{'signatures + LSH':<24} {signature_time:>9.2f}")
+    print(f"{'groups':<24} {group_time:>9.2f}")
+    
+    # Exact Jaccard over all pairs of a sample, the quadratic baseline
+    hasher = MinHasher()
+    sample = list(texts)[:args.sample]
+    shingle_time, shingles = timed(lambda: {key: hasher.shingles(texts[key]) for key in sample})
+    
+    def exact_pairs():
+        return {
+            (first, second) for first, second in itertools.combinations(sample, 2)
+            if len(shingles[first] & shingles[second]) / len(shingles[first] | shingles[second]) >= args.threshold
+        }
+    pair_time, expected = timed(exact_pairs)
+    pair_count = len(texts) * (len(texts) - 1) // 2
+    sample_pairs = len(sample) * (len(sample) - 1) // 2
+    estimate = shingle_time * len(texts) / len(sample) + pair_time * pair_count / sample_pairs
+    print(f"{'all pairs (estimated)':<24} {estimate:>9.0f}")
+    
+    grouped = {key: number for number, group in enumerate(groups) for key in group}
+    found = sum(1 for first, second in expected if first in grouped and grouped.get(first) == grouped.get(second))
+    recall = found / len(expected) if expected else 1.0
+    print(f"\n✅ {len(groups)} groups; recall {recall:.1%} of the {len(expected)} pairs at or above "
+          f"{args.threshold} among the first {len(sample)} items")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark MarkdownParser user story parsing on large synthetic inputs
+Scales mvp-user-stories.md up to --size-mb of renumbered stories and compares the
+streaming tokenizer against the previous read-everything-and-re.split approach.
+
+    python benchmarks/bench_parse_user_stories.py --size-mb 100
+"""
+
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import MarkdownParser
+
+SOURCE_FILE = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+STORY_HEADING = re.compile(r'^#### ([A-Z]+)-\d+: ', re.MULTILINE)
+
+
+def build_synthetic_file(target_bytes: int, output_path: Path) -> int:
+    """Write renumbered copies of the source stories until the file reaches target_bytes"""
+    content = SOURCE_FILE.read_text()
+    starts = [match.start() for match in STORY_HEADING.finditer(content)] + [len(content)]
+    stories = [content[start:end] for start, end in zip(starts, starts[1:])]
+    
+    written = 0
+    count = 0
+    with open(output_path, 'w') as f:
+        while written < target_bytes:
+            for story in stories:
+                count += 1
+                block = STORY_HEADING.sub(lambda match: f"#### {match.group(1)}-{count}: ", story, count=1)
+                f.write(block)
+                written += len(block.encode('utf-8'))
+                if written >= target_bytes:
+                    break
+    return count
+
+
+def parse_with_split(file_path: str) -> int:
+    """The previous implementation: read the whole file, re.split it, re-split each section"""
+    with open(file_path, 'r') as f:
+        content = f.read()
+    
+    stories = {}
+    story_sections = re.split(r'#### ([A-Z]+-\d+): (.+)', content)
+    for i in range(1, len(story_sections), 3):
+        stories[story_sections[i]] = MarkdownParser._parse_story_content(
+            story_sections[i], story_sections[i + 1], story_sections[i + 2]
+        )
+    return len(stories)
+
+
+def stream_stories(file_path: str) -> int:
+    """Consume the generator without keeping the stories"""
+    return sum(1 for _ in MarkdownParser.iter_user_stories(file_path))
+
+
+MODES = {
+    'split': parse_with_split,
+    'stream': stream_stories,
+    'parse_user_stories': lambda file_path: len(MarkdownParser.parse_user_stories(file_path)),
+}
+
+
+def run_mode(mode: str, file_path: str):
+    """Run one mode and print its timing and peak RSS as JSON (executed in a fresh process)"""
+    started = time.perf_counter()
+    stories = MODES[mode](file_path)
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    print(json.dumps({'mode': mode, 'stories': stories, 'seconds': elapsed, 'peak_rss_mb': peak_mb}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size-mb', type=float, default=100.0, help="synthetic file size (default: 100)")
+    parser.add_argument('--modes', default=','.join(MODES), help="comma-separated modes to run")
+    parser.add_argument('--run', nargs=2, metavar=('MODE', 'FILE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.run:
+        run_mode(*args.run)
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "synthetic-user-stories.md"
+        print(f"📝 Generating {args.size_mb:.0f} MB of stories from {SOURCE_FILE.name}...")
+        count = build_synthetic_file(int(args.size_mb * 1024 * 1024), file_path)
+        print(f"   {count} stories, {file_path.stat().st_size / (1024 * 1024):.1f} MB")
+        
+        print(f"\n{'mode':<20} {'stories':>8} {'seconds':>9} {'MB/s':>8} {'peak RSS MB':>12}")
+        for mode in args.modes.split(','):
+            # Each mode runs in its own process so peak RSS is not shared between them
+            output = subprocess.run(
+                [sys.executable, __file__, '--run', mode, str(file_path)],
+                check=True, capture_output=True, text=True
+            ).stdout
+            result = json.loads(output)
+            throughput = args.size_mb / result['seconds']
+            print(f"{mode:<20} {result['stories']:>8} {result['seconds']:>9.2f} {throughput:>8.1f} {result['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
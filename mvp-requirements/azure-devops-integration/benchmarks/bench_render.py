@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTML rendering of user stories for a dry-run plan
+Renders --stories distinct stories (variants of mvp-user-stories.md) with the
+previous inline implementation and with HtmlRenderer, uncached, cold and warm.
+
+    python benchmarks/bench_render.py --stories 100000
+"""
+
+import argparse
+import dataclasses
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import HtmlRenderer, MarkdownParser
+
+SOURCE_FILE = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+
+
+def build_stories(count: int):
+    """Distinct stories: each copy of a source story gets its own I want / Given text"""
+    source = list(MarkdownParser.parse_user_stories(str(SOURCE_FILE)).values())
+    stories = []
+    for number in range(count):
+        story = source[number % len(source)]
+        stories.append(dataclasses.replace(
+            story,
+            story_id=f"BENCH-{number}",
+            i_want=f"{story.i_want} (variant {number})",
+            acceptance_criteria_structured=[
+                {'given': f"{scenario['given']} [{number}]", 'when_then': list(scenario['when_then'])}
+                for scenario in story.acceptance_criteria_structured
+            ]
+        ))
+    return stories
+
+
+def render_inline(story):
+    """The previous implementation: re.sub on every call and += string building"""
+    tech_notes = story.technical_notes or "None"
+    if tech_notes != "None":
+        tech_notes = re.sub(r'```(\w+)?\n(.*?)```', r'<pre><code>\2</code></pre>', tech_notes, flags=re.DOTALL)
+        tech_notes = re.sub(r'\*\*(.*?)\*\*', r'<strong>\1</strong>', tech_notes)
+        tech_notes = tech_notes.replace('\n', '<br/>')
+    
+    description = f"""<h3>User Story</h3>
+<p><strong>As a</strong> {story.as_a}<br/>
+<strong>I want</strong> {story.i_want}<br/>
+<strong>So that</strong> {story.so_that}</p>
+
+<h3>Dependencies</h3>
+<p>{story.dependencies}</p>
+
+<h3>Technical Notes</h3>
+<p>{tech_notes}</p>"""
+    
+    if not story.acceptance_criteria_structured:
+        return description, "To be defined during implementation"
+    
+    html = "<ul>\n"
+    for scenario in story.acceptance_criteria_structured:
+        html += f'  <li><strong>{scenario["given"]}</strong>\n'
+        if scenario.get('when_then'):
+            html += '    <ul>\n'
+            for sub_criteria in scenario['when_then']:
+                html += f'      <li>{sub_criteria}</li>\n'
+            html += '    </ul>\n'
+        html += '  </li>\n'
+    html += "</ul>"
+    return description, html
+
+
+def timed(render, stories):
+    started = time.perf_counter()
+    for story in stories:
+        render(story)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stories', type=int, default=100000, help="number of stories (default: 100000)")
+    args = parser.parse_args()
+    
+    print(f"📝 Building {args.stories} distinct stories from {SOURCE_FILE.name}...")
+    stories = build_stories(args.stories)
+    
+    cached = HtmlRenderer(cache_size=args.stories)
+    runs = [
+        ("inline (previous)", render_inline),
+        ("HtmlRenderer, no cache", HtmlRenderer(cache_size=0).render_story),
+        ("HtmlRenderer, cold", cached.render_story),
+        ("HtmlRenderer, warm", cached.render_story),
+    ]
+    
+    print(f"\n{'renderer':<24} {'seconds':>9} {'stories/s':>11}")
+    for name, render in runs:
+        elapsed = timed(render, stories)
+        print(f"{name:<24} {elapsed:>9.2f} {args.stories / elapsed:>11.0f}")
+    
+    rendered = HtmlRenderer(cache_size=0).render_story
+    assert all(render_inline(story) == rendered(story) for story in stories[:1000]), "renderers disagree"
+    print("\n✅ HtmlRenderer output matches the previous implementation")
+
+
+if __name__ == "__main__":
+    main()
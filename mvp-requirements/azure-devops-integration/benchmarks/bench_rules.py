@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark story verification over a mirror-sized set of work items
+Evaluates the corruption and completeness rules for --items rendered stories
+with the previous inline checks and with RuleSet, and checks that they agree.
+RuleSet is a rule registry rather than a faster matcher, so this shows what the
+indirection costs.
+
+    python benchmarks/bench_rules.py --items 50000
+"""
+
+import argparse
+import dataclasses
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import HtmlRenderer, MarkdownParser
+from story_rules import CORRUPTION_RULES, RuleSet
+
+SOURCE_FILE = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+
+
+def build_items(count: int):
+    """Rendered story fields; every tenth item carries leaked markdown sections"""
+    source = list(MarkdownParser.parse_user_stories(str(SOURCE_FILE)).values())
+    renderer = HtmlRenderer(cache_size=0)
+    items = {}
+    for number in range(count):
+        story = source[number % len(source)]
+        description, acceptance_criteria = renderer.render_story(
+            dataclasses.replace(story, i_want=f"{story.i_want} (variant {number})")
+        )
+        if number % 10 == 0:
+            description += "\n## Implementation Phases\n### Phase 1 (Sprint 1)\n## Risk Mitigation"
+        items[number] = {'description': description, 'acceptance_criteria': acceptance_criteria}
+    return items
+
+
+def analyze_inline(description, acceptance_criteria):
+    """The previous final_comprehensive_verification checks, one `in` test per indicator"""
+    issues = []
+    warnings = []
+    corruption_indicators = [
+        "## Implementation Phases", "### Phase 1 (Sprint", "## Success Criteria", "### Technical Metrics",
+        "### Business Metrics", "## Risk Mitigation", "### Assumptions", "## Acceptance Criteria"
+    ]
+    for indicator in corruption_indicators:
+        if indicator in description:
+            issues.append(f"CORRUPTION: '{indicator}' found in Description")
+    for indicator in corruption_indicators:
+        if indicator in acceptance_criteria:
+            issues.append(f"CORRUPTION: '{indicator}' found in Acceptance Criteria")
+    
+    missing_elements = [
+        element.replace('<strong>', '') for element in ['<strong>As a', '<strong>I want', '<strong>So that']
+        if element not in description
+    ]
+    if missing_elements:
+        issues.append(f"MISSING: User story elements: {', '.join(missing_elements)}")
+    if not description or len(description.strip()) < 50:
+        issues.append("MISSING: Description too short or empty")
+    if not acceptance_criteria or len(acceptance_criteria.strip()) < 30:
+        issues.append("MISSING: Acceptance criteria too short or empty")
+    if 'Dependencies' not in description:
+        warnings.append("Dependencies section missing")
+    if 'Technical Notes' not in description:
+        warnings.append("Technical Notes section missing")
+    return issues, warnings
+
+
+def timed(run):
+    started = time.perf_counter()
+    result = run()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--items', type=int, default=50000, help="number of work items (default: 50000)")
+    args = parser.parse_args()
+    
+    print(f"📝 Rendering {args.items} work items from {SOURCE_FILE.name}...")
+    items = build_items(args.items)
+    rules = RuleSet(CORRUPTION_RULES)
+    
+    runs = [
+        ("inline (previous)", lambda: {
+            key: analyze_inline(fields['description'], fields['acceptance_criteria']) for key, fields in items.items()
+        }),
+        ("RuleSet", lambda: {
+            key: RuleSet.split(findings) for key, findings in rules.evaluate_many(items).items()
+        }),
+    ]
+    
+    print(f"\n{'verifier':<24} {'seconds':>9} {'items/s':>11}")
+    results = []
+    for name, run in runs:
+        elapsed, result = timed(run)
+        results.append(result)
+        print(f"{name:<24} {elapsed:>9.2f} {args.items / elapsed:>11.0f}")
+    assert all(result == results[0] for result in results), "verifiers disagree"
+    print("\n✅ RuleSet findings match the previous implementation")
+
+
+if __name__ == "__main__":
+    main()
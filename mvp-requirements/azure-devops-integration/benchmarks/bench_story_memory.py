@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory held by UserStory versus CompactUserStory
+Parses --stories renumbered copies of mvp-user-stories.md and measures, with
+tracemalloc, how much memory the resulting dict of stories keeps alive.
+
+    python benchmarks/bench_story_memory.py --stories 100000
+"""
+
+import argparse
+import gc
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import CompactUserStory, MarkdownParser
+
+SOURCE_FILE = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+STORY_HEADING = re.compile(r'^#### ([A-Z]+)-\d+: ', re.MULTILINE)
+
+
+def build_synthetic_file(story_count: int, output_path: Path):
+    """Write story_count renumbered copies of the source stories"""
+    content = SOURCE_FILE.read_text()
+    starts = [match.start() for match in STORY_HEADING.finditer(content)] + [len(content)]
+    stories = [content[start:end] for start, end in zip(starts, starts[1:])]
+    
+    with open(output_path, 'w') as f:
+        for number in range(1, story_count + 1):
+            story = stories[number % len(stories)]
+            f.write(STORY_HEADING.sub(lambda match: f"#### {match.group(1)}-{number}: ", story, count=1))
+
+
+MODES = {
+    'UserStory': lambda story: story,
+    'CompactUserStory': CompactUserStory.from_story,
+}
+
+
+def measure(mode: str, file_path: str):
+    """Parse the file keeping stories in `mode` form; return (stories, MB retained, seconds)"""
+    convert = MODES[mode]
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    stories = {story.story_id: convert(story) for story in MarkdownParser.iter_user_stories(file_path)}
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(stories), retained / (1024 * 1024), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--stories', type=int, default=100000, help="number of stories (default: 100000)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = Path(tmp) / "synthetic-user-stories.md"
+        print(f"📝 Generating {args.stories} stories from {SOURCE_FILE.name}...")
+        build_synthetic_file(args.stories, file_path)
+        
+        print(f"\n{'representation':<18} {'stories':>8} {'retained MB':>12} {'bytes/story':>12} {'seconds':>9}")
+        results = {}
+        for mode in MODES:
+            count, retained_mb, elapsed = measure(mode, str(file_path))
+            results[mode] = retained_mb
+            print(f"{mode:<18} {count:>8} {retained_mb:>12.1f} {retained_mb * 1024 * 1024 / count:>12.0f} {elapsed:>9.2f}")
+        
+        saved = 1 - results['CompactUserStory'] / results['UserStory']
+        print(f"\n✅ CompactUserStory retains {saved:.0%} less memory")
+
+
+if __name__ == "__main__":
+    main()
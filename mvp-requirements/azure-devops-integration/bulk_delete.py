@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Bulk Delete - Preview, delete and restore sets of work items
+Targets come from a WIQL condition or an ID list. Deletes go to the Recycle Bin
+by default and every run writes a manifest, before the first request and after
+every batch, that restore() can undo from.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from azure_devops_manager import BatchItemResult
+
+MANIFEST_DIR = 'deletion_manifests'
+MANIFEST_FIELDS = ['System.WorkItemType', 'System.Title', 'System.State']
+
+
+@dataclass
+class DeletionPlan:
+    """Work items a delete would remove, and requested IDs it would leave alone"""
+    work_items: Dict[int, Dict[str, str]] = field(default_factory=dict)  # ID -> MANIFEST_FIELDS
+    protected: List[int] = field(default_factory=list)  # In work_item_mapping.json
+    missing: List[int] = field(default_factory=list)  # Not found or not accessible
+    
+    def is_empty(self) -> bool:
+        return not self.work_items
+
+
+class BulkDeleter:
+    """Delete work items in bulk with a manifest, and restore them from it.
+        
+        deleter = BulkDeleter(manager, config_dir, protected_ids=current_work_items)
+        plan = deleter.plan(conditions="[System.Tags] CONTAINS 'obsolete'")
+        manifest_path, results = deleter.delete(plan)
+        ...
+        deleter.restore(manifest_path)
+    """
+    
+    def __init__(self, manager, config_dir: Path, protected_ids: Iterable[int] = ()):
+        self.manager = manager
+        self.config_dir = Path(config_dir)
+        self.protected_ids = set(protected_ids)
+    
+    def plan(self, ids: Iterable[int] = (), conditions: str = "") -> DeletionPlan:
+        """Resolve IDs and WIQL matches to the work items a delete would remove"""
+        requested = dict.fromkeys(ids)
+        if conditions:
+            requested.update(dict.fromkeys(self.manager.query_ids(conditions)))
+        
+        plan = DeletionPlan(protected=[work_item_id for work_item_id in requested if work_item_id in self.protected_ids])
+        targets = [work_item_id for work_item_id in requested if work_item_id not in self.protected_ids]
+        work_items = self.manager.get_work_items_bulk(targets, fields=MANIFEST_FIELDS)
+        for work_item_id in targets:
+            if work_item_id in work_items:
+                fields = work_items[work_item_id].fields or {}
+                plan.work_items[work_item_id] = {name: fields.get(name, '') for name in MANIFEST_FIELDS}
+            else:
+                plan.missing.append(work_item_id)
+        return plan
+    
+    def delete(self, plan: DeletionPlan, destroy: bool = False) -> Tuple[Path, Dict[int, BatchItemResult]]:
+        """Delete the planned work items, recording each item's outcome in the manifest as its batch returns.
+        
+        Items stay 'pending' until their batch returns, so a manifest left by an
+        interrupted run still lists every item the run may have deleted.
+        """
+        path = self._new_manifest_path()
+        manifest = {
+            'project': self.manager.project_name,
+            'deleted_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'destroy': destroy,
+            'items': [
+                {
+                    'id': work_item_id,
+                    'type': fields['System.WorkItemType'],
+                    'title': fields['System.Title'],
+                    'state': fields['System.State'],
+                    'status': 'pending',
+                    'error': ''
+                }
+                for work_item_id, fields in plan.work_items.items()
+            ]
+        }
+        self.save_manifest(path, manifest)
+        
+        entries = {entry['id']: entry for entry in manifest['items']}
+        
+        def record(batch_results: Dict[int, BatchItemResult]):
+            for work_item_id, result in batch_results.items():
+                entries[work_item_id]['status'] = 'deleted' if result.success else 'failed'
+                entries[work_item_id]['error'] = result.error
+            self.save_manifest(path, manifest)
+        
+        results = self.manager.delete_work_items(list(plan.work_items), destroy=destroy, on_batch=record)
+        return path, results
+    
+    def restore(self, manifest_path: Path, ids: Optional[Iterable[int]] = None) -> Dict[int, BatchItemResult]:
+        """Restore the manifest's deleted and pending items (or only `ids`) and mark them restored.
+        
+        Pending items are left by an interrupted delete and may not have been
+        deleted; restoring one that was not fails and leaves it pending.
+        """
+        manifest = self.load_manifest(manifest_path)
+        if manifest['destroy']:
+            raise ValueError(f"{Path(manifest_path).name} records a permanent delete; nothing can be restored")
+        
+        wanted = set(ids) if ids is not None else None
+        entries = [entry for entry in manifest['items']
+                   if entry['status'] in ('deleted', 'pending') and (wanted is None or entry['id'] in wanted)]
+        results = self.manager.restore_work_items([entry['id'] for entry in entries])
+        for entry in entries:
+            if results[entry['id']].success:
+                entry['status'] = 'restored'
+        self.save_manifest(manifest_path, manifest)
+        return results
+    
+    def _new_manifest_path(self) -> Path:
+        """Create an empty manifest file named by the current UTC time, to the microsecond.
+        
+        O_EXCL guarantees a name no other run holds, so runs never overwrite each other's manifests.
+        """
+        directory = self.config_dir / MANIFEST_DIR
+        directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            path = directory / f"deletion-{datetime.now(timezone.utc):%Y%m%d-%H%M%S-%f}.json"
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return path
+            except FileExistsError:
+                continue
+    
+    @staticmethod
+    def load_manifest(path: Path) -> Dict:
+        with open(path, 'r') as f:
+            return json.load(f)
+    
+    @staticmethod
+    def save_manifest(path: Path, manifest: Dict):
+        """Write the manifest atomically, so an interrupted run never leaves it half-written"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
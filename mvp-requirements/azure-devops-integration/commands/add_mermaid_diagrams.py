@@ -4,30 +4,24 @@ Add Mermaid Diagrams to User Stories - Update existing user stories with Mermaid
 """
 
 import sys
-import re
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from azure_devops_manager import AzureDevOpsManager, ConfigManager, DocumentIndex
 from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
 
 def extract_mermaid_diagram(file_path: Path) -> str:
     """Extract Mermaid diagram from markdown file"""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        
-        # Find mermaid code block
-        pattern = r'```mermaid\n(.*?)\n```'
-        match = re.search(pattern, content, re.DOTALL)
-        
-        if match:
-            return match.group(1).strip()
-        else:
+        # Prefer the block under System Workflow Diagram, else the first one in the file
+        index = DocumentIndex.open(file_path)
+        diagram = index.code('mermaid', heading='System Workflow Diagram') or index.code('mermaid')
+        if not diagram:
             print(f"⚠️  No Mermaid diagram found in {file_path.name}")
-            return ""
+        return diagram
     except Exception as e:
         print(f"❌ Error reading {file_path.name}: {e}")
         return ""
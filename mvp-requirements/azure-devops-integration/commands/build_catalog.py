@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Build Catalog - Parse every requirements document into one indexed catalog
+Covers user story, workflows, data-models, api-specs and grooming in a process pool.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import ParseCache
+from requirements_catalog import RequirementsCatalog
+
+
+def main():
+    """Build the requirements catalog and print what it contains"""
+    
+    print("📚 Building requirements catalog...")
+    started = time.perf_counter()
+    catalog = RequirementsCatalog.build(parse_cache=ParseCache())
+    elapsed = time.perf_counter() - started
+    
+    print(f"✅ Parsed {len(catalog.documents)} documents in {elapsed:.2f}s")
+    print(f"  📖 User stories: {len(catalog.stories)}")
+    print(f"  🎯 Epics: {len(catalog.epics)}")
+    print(f"  🔀 Workflow documents: {len(catalog.workflows)}")
+    print(f"  📊 Mermaid blocks: {len(catalog.mermaid_blocks)}")
+    
+    if catalog.duplicates:
+        print("\n⚠️  Defined in more than one document (first one wins):")
+        for key, sources in sorted(catalog.duplicates.items()):
+            print(f"  {key}: {', '.join(sources)}")
+    
+    return catalog
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Bulk Delete - Delete work items matched by IDs or a WIQL condition
+Items are sent to the Recycle Bin in concurrent batches and recorded in a manifest
+under deletion_manifests/, which commands/restore_deleted.py restores from.
+Work items in work_item_mapping.json are never deleted.
+
+    python commands/bulk_delete.py 51664 51665 51666 --dry-run
+    python commands/bulk_delete.py "[System.Tags] CONTAINS 'obsolete'"
+    python commands/bulk_delete.py 51664 --destroy   # permanent, cannot be restored
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from bulk_delete import BulkDeleter
+from work_item_mirror import WorkItemMirror
+
+
+def main():
+    """Preview or delete the requested work items"""
+    
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    ids = [int(arg) for arg in args if arg.isdigit()]
+    conditions = [arg for arg in args if not arg.isdigit()]
+    dry_run = '--dry-run' in sys.argv[1:]
+    destroy = '--destroy' in sys.argv[1:]
+    if len(conditions) > 1 or not (ids or conditions):
+        print("❌ Pass work item IDs and/or one quoted WIQL condition")
+        return False
+    
+    # Load configuration
+    config_dir = Path(__file__).parent.parent
+    try:
+        org_url, project, pat = ConfigManager.load_config(config_dir)
+        print(f"🔧 Configuration loaded for project: {project}")
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
+    
+    # Work items in our mapping are the current ones and must be kept
+    mapping = ConfigManager.load_work_item_mapping(config_dir)
+    current_work_items = set(mapping.get('stories', {}).values()) | set(mapping.get('epics', {}).values())
+    
+    print("🔌 Connecting to Azure DevOps...")
+    with AzureDevOpsManager(org_url, pat, project) as manager:
+        deleter = BulkDeleter(manager, config_dir, protected_ids=current_work_items)
+        try:
+            plan = deleter.plan(ids, conditions[0] if conditions else "")
+        except Exception as e:
+            print(f"❌ Failed to resolve work items: {e}")
+            return False
+        
+        if plan.protected:
+            print(f"🛡️  Keeping {len(plan.protected)} current work items: {', '.join(map(str, plan.protected))}")
+        if plan.missing:
+            print(f"⚠️  {len(plan.missing)} work items not found: {', '.join(map(str, plan.missing))}")
+        if plan.is_empty():
+            print("ℹ️  Nothing to delete")
+            return True
+        
+        print(f"\n🔍 {'DRY RUN - would delete' if dry_run else 'Deleting'} {len(plan.work_items)} work items:")
+        for work_item_id, fields in plan.work_items.items():
+            print(f"  - {work_item_id}: [{fields['System.WorkItemType']}] {fields['System.Title']} ({fields['System.State']})")
+        if dry_run:
+            return True
+        
+        if destroy:
+            print("\n⚠️  --destroy: work items are deleted permanently and cannot be restored")
+        manifest_path, results = deleter.delete(plan, destroy=destroy)
+    
+    deleted = [work_item_id for work_item_id, result in results.items() if result.success]
+    with WorkItemMirror.open(config_dir) as mirror:
+        mirror.delete(deleted)
+    
+    # Summary
+    print(f"\n📊 Deletion Summary:")
+    print(f"  ✅ {'Destroyed' if destroy else 'Moved to Recycle Bin'}: {len(deleted)}")
+    print(f"  ❌ Failed to delete: {len(results) - len(deleted)}")
+    print(f"  📝 Manifest: {manifest_path}")
+    if deleted and not destroy:
+        print(f"  ↩️  Undo with: python commands/restore_deleted.py {manifest_path}")
+    return len(deleted) == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
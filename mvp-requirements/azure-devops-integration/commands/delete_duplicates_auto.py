@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 Delete Duplicate Work Items - Remove old duplicate work items, keeping only current updated ones
-AUTOMATED VERSION - No user confirmation required
+AUTOMATED VERSION - No user confirmation required; restore with commands/restore_deleted.py
 """
 
 import sys
@@ -11,6 +11,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from bulk_delete import BulkDeleter
 
 
 def main():
@@ -65,29 +66,28 @@ def main():
     
     print("✅ Safety check passed - no conflicts with current work items")
     
-    # Proceed with deletion automatically
+    # Proceed with deletion automatically; items go to the Recycle Bin and can be restored
     print(f"\n🗑️  Proceeding with deletion of {len(duplicate_ids)} duplicate work items...")
     
-    deleted_count = 0
-    failed_count = 0
+    deleter = BulkDeleter(manager, config_dir, protected_ids=current_work_items | current_epics)
+    try:
+        plan = deleter.plan(duplicate_ids)
+    except Exception as e:
+        print(f"❌ Failed to read work items to delete: {e}")
+        return
+    for work_item_id in plan.missing:
+        print(f"⚠️  Work item {work_item_id} not found (already deleted?)")
     
-    for work_item_id in duplicate_ids:
-        try:
-            # Delete the work item
-            manager.wit_client.delete_work_item(work_item_id, destroy=True)
-            print(f"✅ Deleted work item {work_item_id}")
-            deleted_count += 1
-            
-        except Exception as e:
-            print(f"❌ Failed to delete work item {work_item_id}: {e}")
-            failed_count += 1
-            continue
+    manifest_path, results = deleter.delete(plan)
+    deleted_count = sum(1 for result in results.values() if result.success)
+    failed_count = len(results) - deleted_count
     
     # Summary
     print(f"\n📊 Deletion Summary:")
     print(f"  ✅ Successfully deleted: {deleted_count}")
     print(f"  ❌ Failed to delete: {failed_count}")
     print(f"  📋 Remaining current work items: {len(current_work_items)} stories + {len(current_epics)} epics")
+    print(f"  📝 Manifest: {manifest_path} (undo with commands/restore_deleted.py)")
     
     if deleted_count > 0:
         print(f"\n🎉 Successfully cleaned up {deleted_count} duplicate work items!")
@@ -59,15 +59,21 @@ def main():
     print(f"\n🔍 Checking which old epics still exist:")
     existing_epics = []
     
+    try:
+        work_items = manager.get_work_items_bulk(old_epic_ids, fields=['System.Title', 'System.State'])
+    except Exception as e:
+        print(f"❌ Failed to fetch old epics: {e}")
+        return
+    
     for epic_id in old_epic_ids:
-        try:
-            work_item = manager.wit_client.get_work_item(epic_id)
-            title = work_item.fields.get('System.Title', 'No Title')
-            state = work_item.fields.get('System.State', 'Unknown')
-            print(f"  📋 {epic_id}: {title} ({state})")
-            existing_epics.append(epic_id)
-        except Exception as e:
+        work_item = work_items.get(epic_id)
+        if work_item is None:
             print(f"  ❌ {epic_id}: Does not exist or no access")
+            continue
+        title = work_item.fields.get('System.Title', 'No Title')
+        state = work_item.fields.get('System.State', 'Unknown')
+        print(f"  📋 {epic_id}: {title} ({state})")
+        existing_epics.append(epic_id)
     
     if not existing_epics:
         print("✅ No old epics found - they may already be deleted!")
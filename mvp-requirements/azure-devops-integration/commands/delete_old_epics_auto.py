@@ -10,6 +10,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from bulk_delete import BulkDeleter
 
 
 def main():
@@ -56,20 +57,22 @@ def main():
     
     print(f"\n🗑️  Proceeding with deletion of {len(old_epics)} old epics...")
     
-    deleted_count = 0
-    failed_count = 0
+    # Epics go to the Recycle Bin in one request and can be restored from the manifest
+    deleter = BulkDeleter(manager, config_dir)
+    try:
+        plan = deleter.plan(old_epics.values())
+    except Exception as e:
+        print(f"❌ Failed to read epics to delete: {e}")
+        return
     
+    manifest_path, results = deleter.delete(plan)
     for epic_name, epic_id in old_epics.items():
-        try:
-            # Delete the epic (destroy=True for permanent deletion)
-            manager.wit_client.delete_work_item(epic_id, destroy=True)
+        if epic_id in plan.missing:
+            print(f"⚠️  Epic {epic_name} (ID: {epic_id}) not found (already deleted?)")
+        elif results[epic_id].success:
             print(f"✅ Deleted epic: {epic_name} (ID: {epic_id})")
-            deleted_count += 1
-            
-        except Exception as e:
-            print(f"❌ Failed to delete epic {epic_name} (ID: {epic_id}): {e}")
-            failed_count += 1
-            continue
+    deleted_count = sum(1 for result in results.values() if result.success)
+    failed_count = len(results) - deleted_count
     
     # Update work item mapping - remove deleted epics
     if deleted_count > 0:
@@ -92,6 +95,7 @@ def main():
     print(f"  ❌ Failed to delete: {failed_count} old epics")
     print(f"  🎯 Preserved: 1 new epic ({new_epic_name})")
     print(f"  📖 Preserved: {len(mapping.get('stories', {}))} user stories")
+    print(f"  📝 Manifest: {manifest_path} (undo with commands/restore_deleted.py)")
     
     if deleted_count > 0:
         print(f"\n🎉 Successfully cleaned up {deleted_count} old epics!")
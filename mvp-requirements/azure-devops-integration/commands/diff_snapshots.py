@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Diff Snapshots - Show which items and fields differ between two render snapshots
+
+    python commands/diff_snapshots.py old.jsonl.gz new.jsonl.gz
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from render_snapshot import diff_snapshots
+
+
+def main():
+    """Print the differences between two snapshots"""
+    
+    if len(sys.argv) != 3:
+        print("Usage: python commands/diff_snapshots.py OLD_SNAPSHOT NEW_SNAPSHOT")
+        return False
+    
+    old_path, new_path = Path(sys.argv[1]), Path(sys.argv[2])
+    try:
+        diff = diff_snapshots(old_path, new_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return False
+    
+    if diff.is_empty():
+        print("✅ Snapshots are identical")
+        return True
+    
+    for item in diff.added:
+        print(f"➕ {item}")
+    for item in diff.removed:
+        print(f"➖ {item}")
+    for item, fields in diff.changed.items():
+        print(f"✏️  {item}: {', '.join(fields)}")
+    
+    print(f"\n📊 {len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Export Snapshot - Render every epic and story to the field payloads a sync would push
+Writes a gzipped JSONL snapshot without contacting Azure DevOps. Compare two
+snapshots with commands/diff_snapshots.py.
+
+    python commands/export_snapshot.py [snapshot.jsonl.gz] [markdown file]
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import ParseCache
+from render_snapshot import render_records, write_snapshot
+
+DEFAULT_SNAPSHOT = Path(__file__).parent.parent / "render_snapshot.jsonl.gz"
+DEFAULT_MARKDOWN = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+
+
+def main():
+    """Render the markdown to a snapshot file"""
+    
+    args = sys.argv[1:]
+    snapshot_path = Path(args[0]) if args else DEFAULT_SNAPSHOT
+    markdown_file = Path(args[1]) if len(args) > 1 else DEFAULT_MARKDOWN
+    
+    if not markdown_file.exists():
+        print(f"❌ Markdown file not found: {markdown_file}")
+        return False
+    
+    print(f"📖 Parsing {markdown_file.name}...")
+    parse_cache = ParseCache()
+    epics = parse_cache.epics(markdown_file)
+    stories = parse_cache.user_stories(markdown_file)
+    
+    print(f"📝 Rendering {len(epics)} epics and {len(stories)} user stories...")
+    started = time.perf_counter()
+    try:
+        count = write_snapshot(snapshot_path, render_records(epics, stories))
+    except OSError as e:
+        print(f"❌ Could not write snapshot: {e}")
+        return False
+    
+    elapsed = time.perf_counter() - started
+    print(f"✅ Wrote {count} items to {snapshot_path} ({snapshot_path.stat().st_size / 1024:.1f} KB, {elapsed:.2f}s)")
+    return True
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,59 @@
 #!/usr/bin/env python3
 """
 Find Duplicate Work Items - Identify and list duplicate stories with same IDs but different work item numbers
+User stories are read from the work item mirror when it has been synced, otherwise (or with
+--live) with one WIQL query and batched reads, and grouped by story ID in memory.
 """
 
+import re
 import sys
 from pathlib import Path
+from typing import Dict, Iterable, List, Set
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from work_item_mirror import WorkItemMirror
+
+
+STORY_FIELDS = ['System.Title', 'System.State', 'System.CreatedDate', 'System.Tags']
+TITLE_STORY_ID = re.compile(r'\b([A-Z]+-\d+):')  # create_user_story titles read "ORD-001: ..."
+TAG_STORY_ID = re.compile(r'[A-Z]+-\d+')  # ... and tag the story with its ID
+
+
+def story_ids_of(work_item) -> Set[str]:
+    """Story IDs named in a work item's title or tags"""
+    fields = work_item.fields or {}
+    story_ids = set(TITLE_STORY_ID.findall(fields.get('System.Title') or ''))
+    story_ids.update(
+        tag.strip() for tag in (fields.get('System.Tags') or '').split(';') if TAG_STORY_ID.fullmatch(tag.strip())
+    )
+    return story_ids
+
+
+def group_by_story_id(work_items: Iterable, story_ids: Iterable[str]) -> Dict[str, List]:
+    """Work items for each story ID, in ID order"""
+    groups = {story_id: [] for story_id in story_ids}
+    for work_item in sorted(work_items, key=lambda item: item.id):
+        for story_id in story_ids_of(work_item) & groups.keys():
+            groups[story_id].append(work_item)
+    return groups
+
+
+def load_user_stories(config_dir: Path, org_url: str, pat: str, project: str, live: bool):
+    """All user stories with STORY_FIELDS, from the mirror unless live or never synced"""
+    if not live:
+        with WorkItemMirror.open(config_dir) as mirror:
+            if mirror.last_synced is not None:
+                print(f"🗄️  Using work item mirror synced {mirror.last_synced}")
+                return mirror.query(work_item_type='User Story', fields=STORY_FIELDS)
+    
+    print("🔌 Connecting to Azure DevOps...")
+    with AzureDevOpsManager(org_url, pat, project) as manager:
+        print("✅ Connected successfully!")
+        ids = manager.query_ids("[System.WorkItemType] = 'User Story'")
+        return list(manager.get_work_items_bulk(ids, fields=STORY_FIELDS).values())
 
 
 def main():
@@ -24,15 +68,6 @@ def main():
         print(f"❌ {e}")
         return
     
-    # Initialize Azure DevOps manager
-    print("🔌 Connecting to Azure DevOps...")
-    try:
-        manager = AzureDevOpsManager(org_url, pat, project)
-        print("✅ Connected successfully!")
-    except Exception as e:
-        print(f"❌ Connection failed: {e}")
-        return
-    
     # Load our current work item mapping
     mapping = ConfigManager.load_work_item_mapping(config_dir)
     current_story_ids = set(mapping.get('stories', {}).keys())
@@ -42,45 +77,33 @@ def main():
     print(f"🎯 Story IDs: {sorted(current_story_ids)}")
     print(f"📊 Work item range: {min(current_work_items)}-{max(current_work_items)}")
     
-    # Search for duplicate stories using Azure DevOps query
-    # We'll search for work items with same story ID patterns but different work item numbers
+    # Read every user story once and group by the story ID in its title or tags
+    try:
+        user_stories = load_user_stories(config_dir, org_url, pat, project, live='--live' in sys.argv[1:])
+    except Exception as e:
+        print(f"❌ Failed to read user stories: {e}")
+        return
     
     duplicate_candidates = []
     
-    # Check for each story ID pattern
-    for story_id in current_story_ids:
-        try:
-            # Use work item tracking client to search for items with same title pattern
-            query = f"SELECT [System.Id], [System.Title], [System.State], [System.CreatedDate] FROM WorkItems WHERE [System.TeamProject] = '{project}' AND [System.WorkItemType] = 'User Story' AND [System.Title] CONTAINS '{story_id}:'"
-            
-            query_result = manager.wit_client.query_by_wiql(
-                {"query": query}
-            )
+    for story_id, work_items in sorted(group_by_story_id(user_stories, current_story_ids).items()):
+        if len(work_items) > 1:
+            print(f"\n🔍 Found {len(work_items)} work items for {story_id}:")
             
-            if query_result.work_items and len(query_result.work_items) > 1:
-                print(f"\n🔍 Found {len(query_result.work_items)} work items for {story_id}:")
+            for work_item in work_items:
+                is_current = work_item.id in current_work_items
+                status = "✅ CURRENT" if is_current else "❌ DUPLICATE"
                 
-                work_item_ids = [item.id for item in query_result.work_items]
-                work_items = manager.wit_client.get_work_items(work_item_ids)
+                print(f"  {status} - ID: {work_item.id}, Title: {work_item.fields['System.Title']}")
+                print(f"    Created: {work_item.fields['System.CreatedDate']}")
                 
-                for work_item in work_items:
-                    is_current = work_item.id in current_work_items
-                    status = "✅ CURRENT" if is_current else "❌ DUPLICATE"
-                    
-                    print(f"  {status} - ID: {work_item.id}, Title: {work_item.fields['System.Title']}")
-                    print(f"    Created: {work_item.fields['System.CreatedDate']}")
-                    
-                    if not is_current:
-                        duplicate_candidates.append({
-                            'id': work_item.id,
-                            'title': work_item.fields['System.Title'],
-                            'story_id': story_id,
-                            'created': work_item.fields['System.CreatedDate']
-                        })
-        
-        except Exception as e:
-            print(f"⚠️  Error searching for {story_id}: {e}")
-            continue
+                if not is_current:
+                    duplicate_candidates.append({
+                        'id': work_item.id,
+                        'title': work_item.fields['System.Title'],
+                        'story_id': story_id,
+                        'created': work_item.fields['System.CreatedDate']
+                    })
     
     # Summary
     print(f"\n📊 Duplicate Analysis Summary:")
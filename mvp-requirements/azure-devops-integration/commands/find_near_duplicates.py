@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Find Near-Duplicate Work Items - List user stories whose text is almost a copy of another's
+Compares title, description and acceptance criteria from the work item mirror with
+MinHash/LSH, so copies that were retitled or lightly edited are found too.
+
+    python commands/find_near_duplicates.py [THRESHOLD]   # default 0.8
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import ConfigManager
+from near_duplicates import WORK_ITEM_TEXT_FIELDS, NearDuplicateIndex, work_item_text
+from work_item_mirror import WorkItemMirror
+
+
+def main():
+    """Find and list groups of near-duplicate user stories"""
+    
+    config_dir = Path(__file__).parent.parent
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    try:
+        threshold = float(args[0]) if args else 0.8
+        index = NearDuplicateIndex(threshold=threshold)
+    except ValueError as e:
+        print(f"❌ Invalid threshold: {e}")
+        return False
+    
+    # Work items in our mapping are the ones to keep
+    mapping = ConfigManager.load_work_item_mapping(config_dir)
+    current_work_items = set(mapping.get('stories', {}).values())
+    
+    with WorkItemMirror.open(config_dir) as mirror:
+        if mirror.last_synced is None:
+            print("❌ Work item mirror is empty. Run commands/sync_mirror.py first")
+            return False
+        print(f"🗄️  Using work item mirror synced {mirror.last_synced}")
+        user_stories = {
+            work_item.id: work_item
+            for work_item in mirror.query(work_item_type='User Story', fields=WORK_ITEM_TEXT_FIELDS)
+        }
+    
+    print(f"🔍 Comparing {len(user_stories)} user stories at similarity {threshold} "
+          f"({index.bands} bands x {index.rows} rows)...")
+    index.add_many({work_item_id: work_item_text(work_item) for work_item_id, work_item in user_stories.items()})
+    groups = index.groups()
+    
+    duplicate_candidates = []
+    for group in groups:
+        # Compare against the mapped work item when the group has one, else the oldest
+        reference = next((work_item_id for work_item_id in group if work_item_id in current_work_items), group[0])
+        print(f"\n🔍 Found {len(group)} near-identical work items:")
+        for work_item_id in [reference] + [work_item_id for work_item_id in group if work_item_id != reference]:
+            is_current = work_item_id in current_work_items
+            status = "✅ CURRENT" if is_current else "❌ NEAR-DUPLICATE"
+            title = user_stories[work_item_id].fields.get('System.Title')
+            print(f"  {status} - ID: {work_item_id}, Title: {title}")
+            if work_item_id != reference:
+                print(f"    Similarity to {reference}: {index.similarity(reference, work_item_id):.0%}")
+                if not is_current:
+                    duplicate_candidates.append(work_item_id)
+    
+    # Summary
+    print(f"\n📊 Near-Duplicate Analysis Summary:")
+    print(f"  🔍 Groups: {len(groups)}")
+    print(f"  ❌ Near-duplicate candidates: {len(duplicate_candidates)}")
+    if duplicate_candidates:
+        print(f"\n🗑️  Review for deletion: {', '.join(str(work_item_id) for work_item_id in sorted(duplicate_candidates))}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
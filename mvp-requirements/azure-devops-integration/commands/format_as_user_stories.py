@@ -4,13 +4,12 @@ Format as User Stories - Reformat work items into proper user story format
 """
 
 import sys
-import re
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from azure_devops_manager import AzureDevOpsManager, ConfigManager, DocumentIndex
 from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 
 
@@ -198,10 +197,8 @@ def get_story_definitions():
 def extract_mermaid_from_file(file_path: Path) -> str:
     """Extract mermaid diagram from workflow file"""
     try:
-        content = file_path.read_text(encoding='utf-8')
-        pattern = r'```mermaid\n(.*?)\n```'
-        match = re.search(pattern, content, re.DOTALL)
-        return match.group(1).strip() if match else ""
+        index = DocumentIndex.open(file_path)
+        return index.code('mermaid', heading='System Workflow Diagram') or index.code('mermaid')
     except Exception:
         return ""
 
@@ -257,6 +254,7 @@ def main():
     
     updated_count = 0
     failed_count = 0
+    updates = {}
     
     for story_id, work_item_id in story_ids.items():
         if story_id not in story_definitions:
@@ -285,8 +283,8 @@ def main():
             # Create proper acceptance criteria  
             acceptance_criteria = create_proper_acceptance_criteria(story_data)
             
-            # Update work item
-            document = [
+            # Queue work item update
+            updates[work_item_id] = [
                 JsonPatchOperation(
                     op="replace",
                     path="/fields/System.Description", 
@@ -299,20 +297,25 @@ def main():
                 )
             ]
             
-            manager.wit_client.update_work_item(
-                document=document,
-                id=work_item_id,
-                project=project
-            )
-            
-            print(f"✅ Reformatted {story_id} into proper user story format")
-            updated_count += 1
-            
         except Exception as e:
             print(f"❌ Failed to reformat {story_id}: {e}")
             failed_count += 1
             continue
     
+    # Send all reformatted stories through the $batch endpoint
+    results = manager.update_work_items_batch(updates)
+    
+    for story_id, work_item_id in story_ids.items():
+        result = results.get(work_item_id)
+        if result is None:
+            continue
+        if result.success:
+            print(f"✅ Reformatted {story_id} into proper user story format")
+            updated_count += 1
+        else:
+            print(f"❌ Failed to reformat {story_id}: {result.error}")
+            failed_count += 1
+    
     # Summary
     print(f"\n📊 Reformatting Summary:")
     print(f"  ✅ Successfully reformatted: {updated_count} user stories")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Lint Mermaid - Check every Mermaid flowchart for syntax and structure errors
+Lints the markdown files in `user story/` and `workflows/`, or the files given.
+Exits non-zero when errors are found, so it can run from an editor on save.
+
+    python commands/lint_mermaid.py
+    python commands/lint_mermaid.py "../user story/UC-001-System-Workflow.md"
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from mermaid_lint import lint_file
+
+REQUIREMENTS_ROOT = Path(__file__).parent.parent.parent
+SOURCE_DIRS = ["user story", "workflows"]
+
+
+def main():
+    """Lint Mermaid diagrams and report errors as file:line"""
+    
+    paths = [Path(arg) for arg in sys.argv[1:]]
+    if not paths:
+        paths = sorted(path for source in SOURCE_DIRS for path in (REQUIREMENTS_ROOT / source).glob("*.md"))
+    
+    error_count = 0
+    for path in paths:
+        try:
+            issues = lint_file(path)
+        except OSError as e:
+            print(f"❌ {path}: {e}")
+            error_count += 1
+            continue
+        
+        for issue in issues:
+            print(f"❌ {path}:{issue.line}: {issue.message}")
+        error_count += len(issues)
+    
+    if error_count:
+        print(f"\n📊 {error_count} Mermaid errors in {len(paths)} files")
+        return False
+    
+    print(f"✅ No Mermaid errors in {len(paths)} files")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
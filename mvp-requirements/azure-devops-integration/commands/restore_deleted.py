@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Restore Deleted - Restore work items from the Recycle Bin using a deletion manifest
+Defaults to the newest manifest in deletion_manifests/; pass IDs after the manifest
+to restore only some of its items.
+
+    python commands/restore_deleted.py
+    python commands/restore_deleted.py deletion_manifests/deletion-20261016-093000-482113.json 51664 51665
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from bulk_delete import MANIFEST_DIR, BulkDeleter
+
+
+def main():
+    """Restore the deleted work items recorded in a manifest"""
+    
+    # Load configuration
+    config_dir = Path(__file__).parent.parent
+    try:
+        org_url, project, pat = ConfigManager.load_config(config_dir)
+        print(f"🔧 Configuration loaded for project: {project}")
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
+    
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if args and not args[0].isdigit():
+        manifest_path = Path(args.pop(0))
+    else:
+        manifests = sorted((config_dir / MANIFEST_DIR).glob('deletion-*.json'))
+        if not manifests:
+            print(f"❌ No deletion manifests found in {config_dir / MANIFEST_DIR}")
+            return False
+        manifest_path = manifests[-1]
+    ids = [int(arg) for arg in args] if args else None
+    
+    print(f"📝 Restoring from {manifest_path}")
+    print("🔌 Connecting to Azure DevOps...")
+    with AzureDevOpsManager(org_url, pat, project) as manager:
+        try:
+            results = BulkDeleter(manager, config_dir).restore(manifest_path, ids)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return False
+    
+    restored = sum(1 for result in results.values() if result.success)
+    
+    # Summary
+    print(f"\n📊 Restore Summary:")
+    print(f"  ✅ Restored: {restored}")
+    print(f"  ❌ Failed to restore: {len(results) - restored}")
+    if restored:
+        print("  🗄️  Run commands/sync_mirror.py to add them back to the work item mirror")
+    return restored == len(results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -53,32 +53,29 @@ def main():
     updated_count = 0
     failed_count = 0
     
-    # Update each user story
+    # Build one iteration update per user story
+    updates = {
+        work_item_id: [
+            JsonPatchOperation(
+                op="replace",
+                path="/fields/System.IterationPath",
+                value=target_iteration
+            )
+        ]
+        for work_item_id in user_stories.values()
+    }
+    
+    # Send all updates through the $batch endpoint
+    results = manager.update_work_items_batch(updates)
+    
     for story_id, work_item_id in user_stories.items():
-        try:
-            # Create update operation for iteration path
-            updates = [
-                JsonPatchOperation(
-                    op="replace",
-                    path="/fields/System.IterationPath",
-                    value=target_iteration
-                )
-            ]
-            
-            # Update the work item
-            success = manager.update_work_item(work_item_id, updates)
-            
-            if success:
-                print(f"✅ Updated {story_id} (ID: {work_item_id})")
-                updated_count += 1
-            else:
-                print(f"❌ Failed to update {story_id} (ID: {work_item_id})")
-                failed_count += 1
-                
-        except Exception as e:
-            print(f"❌ Error updating {story_id} (ID: {work_item_id}): {e}")
+        result = results.get(work_item_id)
+        if result and result.success:
+            print(f"✅ Updated {story_id} (ID: {work_item_id})")
+            updated_count += 1
+        else:
+            print(f"❌ Failed to update {story_id} (ID: {work_item_id})")
             failed_count += 1
-            continue
     
     # Summary
     print(f"\n📊 Iteration Update Summary:")
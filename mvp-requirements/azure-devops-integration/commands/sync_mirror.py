@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Sync Mirror - Refresh the local SQLite mirror of project work items
+Read-only commands (verify_*, final_comprehensive_verification) read from the mirror.
+Only items changed since the last sync are downloaded; pass --full to re-download everything.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from work_item_mirror import WorkItemMirror
+
+
+def main():
+    """Download project work items into the local mirror"""
+    
+    # Load configuration
+    config_dir = Path(__file__).parent.parent
+    try:
+        org_url, project, pat = ConfigManager.load_config(config_dir)
+        print(f"🔧 Configuration loaded for project: {project}")
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    # Initialize Azure DevOps manager
+    print("🔌 Connecting to Azure DevOps...")
+    try:
+        manager = AzureDevOpsManager(org_url, pat, project)
+        print("✅ Connected successfully!")
+    except Exception as e:
+        print(f"❌ Connection failed: {e}")
+        return
+    
+    full = '--full' in sys.argv[1:]
+    
+    with manager, WorkItemMirror.open(config_dir) as mirror:
+        mode = "Full sync" if full or mirror.last_synced is None else f"Syncing changes since {mirror.last_synced}"
+        print(f"🗄️  {mode} into {mirror.path.name}...")
+        try:
+            downloaded = mirror.sync(manager, full=full)
+        except Exception as e:
+            print(f"❌ Sync failed: {e}")
+            return
+        
+        print(f"✅ Downloaded {downloaded} changed work items ({mirror.count()} mirrored, synced {mirror.last_synced})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """
 Update From Markdown Command - Update existing work items with latest markdown content
+Only fields whose rendered content changed since the last run, and that differ from the
+work item mirror when one has been synced, are sent; pass --force to send everything.
 """
 
 import sys
@@ -9,7 +11,8 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from azure_devops_manager import AzureDevOpsManager, MarkdownParser, ConfigManager
+from azure_devops_manager import AzureDevOpsManager, ConfigManager, ParseCache
+from work_item_mirror import WorkItemMirror
 
 
 # Explicit mapping for precise epic matching
@@ -25,6 +28,23 @@ EPIC_MAPPING = {
 }
 
 
+def select_changed_operations(manager, work_item_id, operations, field_hashes, remote_items):
+    """Drop writes recorded at the last sync or already present on the work item.
+    
+    Fields the work item already has are recorded in field_hashes so later
+    runs skip them without consulting the mirror.
+    """
+    operations = manager.changed_operations(operations, field_hashes.get(str(work_item_id), {}))
+    remote = remote_items.get(work_item_id)
+    if remote is None or not operations:
+        return operations
+    
+    operations, unchanged = manager.diff_remote_fields(operations, remote.fields or {})
+    if unchanged:
+        field_hashes.setdefault(str(work_item_id), {}).update(manager.hash_field_values(unchanged))
+    return operations
+
+
 def main():
     """Update existing work items from markdown content"""
     
@@ -43,16 +63,30 @@ def main():
         print("❌ No work item mapping found. Run create_work_items.py first.")
         return
     
+    # Hashes of the field values pushed by the previous run
+    force = '--force' in sys.argv[1:]
+    field_hashes = ConfigManager.load_field_hashes(config_dir)
+    
+    # Current field values from the mirror; HTML is compared canonically since Azure DevOps rewrites it
+    remote_items = {}
+    if not force:
+        with WorkItemMirror.open(config_dir) as mirror:
+            if mirror.last_synced is not None:
+                print(f"🗄️  Comparing with work item mirror synced {mirror.last_synced}")
+                mapped_ids = list(mapping.get('epics', {}).values()) + list(mapping.get('stories', {}).values())
+                remote_items = mirror.get_work_items_bulk(mapped_ids)
+    
     # Path to markdown file
     markdown_file = "/Users/chongraktanaka/Projects/mao-docsite/mvp-requirements/user story/mvp-user-stories.md"
     if not Path(markdown_file).exists():
         print(f"❌ Markdown file not found: {markdown_file}")
         return
     
-    # Parse markdown content
+    # Parse markdown content (reused from the parse cache when the file is unchanged)
     print("📖 Parsing latest markdown content...")
-    epics = MarkdownParser.parse_epics(markdown_file)
-    stories = MarkdownParser.parse_user_stories(markdown_file)
+    parse_cache = ParseCache()
+    epics = parse_cache.epics(markdown_file)
+    stories = parse_cache.user_stories(markdown_file)
     
     print(f"📋 Found {len(epics)} epics and {len(stories)} user stories in markdown")
     print(f"🎯 Found {len(mapping.get('epics', {}))} epics and {len(mapping.get('stories', {}))} stories to update")
@@ -72,6 +106,9 @@ def main():
     updated_epics = 0
     updated_stories = 0
     failed_updates = 0
+    unchanged_items = 0
+    epic_updates = {}
+    story_updates = {}
     
     # Update epics with precise matching
     for epic_name, work_item_id in mapping.get('epics', {}).items():
@@ -85,11 +122,15 @@ def main():
             print(f"⚠️  No markdown content found for: {markdown_title}")
             continue
         
+        operations = manager.build_epic_updates(epic_data)
+        if not force:
+            operations = select_changed_operations(manager, work_item_id, operations, field_hashes, remote_items)
+        if not operations:
+            unchanged_items += 1
+            continue
+        
         print(f"✅ Updating Epic: {epic_name} → {markdown_title}")
-        if manager.update_epic_from_data(work_item_id, epic_data):
-            updated_epics += 1
-        else:
-            failed_updates += 1
+        epic_updates[work_item_id] = operations
     
     # Update user stories
     for story_id, work_item_id in mapping.get('stories', {}).items():
@@ -98,17 +139,40 @@ def main():
             print(f"⚠️  No markdown content found for story: {story_id}")
             continue
         
+        operations = manager.build_story_updates(story_data)
+        if not force:
+            operations = select_changed_operations(manager, work_item_id, operations, field_hashes, remote_items)
+        if not operations:
+            unchanged_items += 1
+            continue
+        
         print(f"✅ Updating Story: {story_id}")
-        if manager.update_story_from_data(work_item_id, story_data):
-            updated_stories += 1
-        else:
+        story_updates[work_item_id] = operations
+    
+    # Send all updates in as few $batch round-trips as possible
+    all_updates = {**epic_updates, **story_updates}
+    results = manager.update_work_items_batch(all_updates)
+    for work_item_id, result in results.items():
+        if not result.success:
             failed_updates += 1
+            continue
+        
+        field_hashes.setdefault(str(work_item_id), {}).update(manager.hash_field_values(all_updates[work_item_id]))
+        if work_item_id in epic_updates:
+            updated_epics += 1
+        else:
+            updated_stories += 1
+    
+    ConfigManager.save_field_hashes(config_dir, field_hashes)
     
     # Summary
     print(f"\n📊 Update Summary:")
     print(f"  ✅ Epics updated: {updated_epics}")
     print(f"  ✅ Stories updated: {updated_stories}")
+    print(f"  ⏭️  Unchanged (skipped): {unchanged_items}")
     print(f"  ❌ Failed updates: {failed_updates}")
+    if manager.retry_policy.retry_counts:
+        print(f"  🔁 Retries: {dict(manager.retry_policy.retry_counts)}")
     
     if updated_epics > 0 or updated_stories > 0:
         print(f"\n🎉 Successfully updated {updated_epics + updated_stories} work items!")
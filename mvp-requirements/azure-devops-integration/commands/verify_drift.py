@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Verify Drift - Compare work items in the local mirror with the HTML rendered from markdown
+Field HTML is compared in canonical form, so markup Azure DevOps rewrote on save
+(attribute order, whitespace, entities) is not reported as drift.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from azure_devops_manager import ConfigManager, HtmlCanonicalizer, ParseCache, WorkItemDocumentBuilder
+from work_item_mirror import WorkItemMirror
+
+
+def drifted_fields(operations, work_item):
+    """Field names whose mirrored value differs canonically from the rendered one"""
+    fields = work_item.fields or {}
+    drifted = []
+    for operation in operations:
+        field_name = operation.path[len("/fields/"):]
+        if HtmlCanonicalizer.digest(operation.value) != HtmlCanonicalizer.digest(fields.get(field_name)):
+            drifted.append(field_name)
+    return drifted
+
+
+def main():
+    """Report work items whose Azure DevOps content no longer matches the markdown"""
+    
+    print("🔍 Checking work items for drift from markdown...")
+    
+    config_dir = Path(__file__).parent.parent
+    markdown_file = Path(__file__).parent.parent.parent / "user story" / "mvp-user-stories.md"
+    if not markdown_file.exists():
+        print(f"❌ Markdown file not found: {markdown_file}")
+        return False
+    
+    # Read work items from the local mirror (refresh with commands/sync_mirror.py)
+    with WorkItemMirror.open(config_dir) as mirror:
+        if mirror.last_synced is None:
+            print("❌ Work item mirror is empty. Run commands/sync_mirror.py first")
+            return False
+        print(f"🗄️  Using work item mirror synced {mirror.last_synced}")
+        
+        mapping = ConfigManager.load_work_item_mapping(config_dir)
+        parse_cache = ParseCache()
+        epics = parse_cache.epics(markdown_file)
+        stories = parse_cache.user_stories(markdown_file)
+        builder = WorkItemDocumentBuilder()
+        
+        expected = {}
+        for epic_name, work_item_id in mapping.get('epics', {}).items():
+            if epic_name in epics:
+                expected[work_item_id] = (epic_name, builder.build_epic_updates(epics[epic_name]))
+        for story_id, work_item_id in mapping.get('stories', {}).items():
+            if story_id in stories:
+                expected[work_item_id] = (story_id, builder.build_story_updates(stories[story_id]))
+        
+        work_items = mirror.get_work_items_bulk(list(expected))
+        in_sync = 0
+        drifted = 0
+        missing = 0
+        
+        for work_item_id, (name, operations) in expected.items():
+            work_item = work_items.get(work_item_id)
+            if work_item is None:
+                print(f"❌ {name} (ID: {work_item_id}) - Not in mirror")
+                missing += 1
+                continue
+            
+            fields = drifted_fields(operations, work_item)
+            if fields:
+                print(f"⚠️  {name} (ID: {work_item_id}) - Drifted: {', '.join(fields)}")
+                drifted += 1
+            else:
+                in_sync += 1
+        
+        print(f"\n📊 Drift Summary:")
+        print(f"  ✅ In sync: {in_sync}")
+        print(f"  ⚠️  Drifted: {drifted}")
+        print(f"  ❌ Missing from mirror: {missing}")
+        
+        if drifted:
+            print("\n💡 Run commands/update_from_markdown.py to push the markdown content")
+        
+        return drifted == 0 and missing == 0
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,13 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from azure_devops_manager import AzureDevOpsManager, ConfigManager
+from azure_devops_manager import ConfigManager, DocumentIndex
+from mermaid_lint import lint_mermaid
+from story_rules import MERMAID_RULES, RuleSet
+from work_item_mirror import WorkItemMirror
+
+
+MERMAID_CHECKS = RuleSet(MERMAID_RULES)
 
 
 def check_workflow_format(file_path):
@@ -23,11 +29,10 @@ def check_workflow_format(file_path):
     issues = []
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
+        index = DocumentIndex.open(file_path)
+        
         # Check 1: Flowchart should come after Process Steps
-        sections = re.findall(r'^## (.+)$', content, re.MULTILINE)
+        sections = index.heading_titles(level=2)
         if sections:
             process_steps_index = None
             diagram_index = None
@@ -49,26 +54,25 @@ def check_workflow_format(file_path):
                 issues.append("✅ Flowchart positioning OK")
         
         # Check 2: Look for numeric characters in Mermaid diagrams
-        mermaid_blocks = re.findall(r'```mermaid\n(.*?)```', content, re.DOTALL)
+        mermaid_blocks = index.find_code_blocks('mermaid')
         if mermaid_blocks:
-            for block in mermaid_blocks:
-                # Check for problematic numeric patterns
-                numeric_issues = []
+            for record in mermaid_blocks:
+                block = index.text(record.start, record.end)
                 
-                # Check for "Rule 1:", "Cal 1:", etc.
-                if re.search(r'Rule \d+:', block):
-                    numeric_issues.append("Rule [number]:")
-                if re.search(r'Cal \d+:', block):
-                    numeric_issues.append("Cal [number]:")
-                if re.search(r'Status: \d+', block):
-                    numeric_issues.append("Status: [number]")
-                if re.search(r'subGraph\d+', block):
-                    numeric_issues.append("subGraph[number]")
+                # Check for problematic numeric patterns ("Rule 1:", "Cal 1:", etc.)
+                numeric_issues, _ = RuleSet.split(MERMAID_CHECKS.evaluate({'mermaid': block}))
                 
                 if numeric_issues:
-                    issues.append(f"❌ Numeric patterns found in Mermaid: {', '.join(numeric_issues)}")
+                    issues.extend(f"❌ {issue}" for issue in numeric_issues)
                 else:
                     issues.append("✅ No problematic numeric patterns in Mermaid")
+                
+                # Check for syntax and structure errors that would break rendering
+                syntax_issues = lint_mermaid(block, first_line=record.line + 1)
+                if syntax_issues:
+                    issues.extend(f"❌ Mermaid {issue}" for issue in syntax_issues)
+                else:
+                    issues.append("✅ Mermaid syntax valid")
         else:
             issues.append("⚠️  No Mermaid diagrams found")
         
@@ -77,7 +81,7 @@ def check_workflow_format(file_path):
         missing_sections = []
         
         for section in required_sections:
-            if section not in content:
+            if not index.contains(section):
                 missing_sections.append(section)
                 
         if missing_sections:
@@ -89,11 +93,11 @@ def check_workflow_format(file_path):
         azure_issues = []
         
         # Check for unsupported characters or patterns
-        if '→' in content:
+        if index.contains('→'):
             azure_issues.append("Unicode arrows (→)")
-        if re.search(r'[^\x00-\x7F]', content):
+        if index.search(rb'[^\x00-\x7F]'):
             # Count non-ASCII characters (excluding common ones we want)
-            non_ascii = re.findall(r'[^\x00-\x7F•×]', content)
+            non_ascii = re.findall(r'[^\x00-\x7F•×]', index.text())
             if non_ascii:
                 unique_chars = list(set(non_ascii))
                 if len(unique_chars) > 5:  # Allow some special chars
@@ -189,68 +193,66 @@ def verify_azure_devops_stories():
         print(f"❌ {e}")
         return False
     
-    # Initialize Azure DevOps manager
-    print("🔌 Connecting to Azure DevOps...")
-    try:
-        manager = AzureDevOpsManager(org_url, pat, project)
-        print("✅ Connected successfully!")
-    except Exception as e:
-        print(f"❌ Connection failed: {e}")
-        return False
-    
-    # Load work item mapping
-    mapping = ConfigManager.load_work_item_mapping(config_dir)
-    story_ids = mapping.get('stories', {})
-    
-    if not story_ids:
-        print("⚠️  No user stories found in mapping file")
-        return False
-    
-    print(f"\n🔍 Checking {len(story_ids)} user stories for Mermaid diagrams...")
-    
-    mermaid_count = 0
-    no_mermaid_count = 0
-    
-    for story_id, work_item_id in story_ids.items():
-        try:
-            # Get work item
-            work_item = manager.wit_client.get_work_item(work_item_id)
-            description = work_item.fields.get('System.Description', '')
-            
-            # Check for Mermaid diagram indicators
-            has_mermaid = ('mermaid-diagram' in description or 
-                          'System Workflow Diagram' in description or
-                          'language-mermaid' in description or
-                          'flowchart TD' in description)
-            
-            if has_mermaid:
-                print(f"✅ {story_id} (ID: {work_item_id}) - Mermaid diagram present")
-                mermaid_count += 1
-            else:
-                print(f"❌ {story_id} (ID: {work_item_id}) - No Mermaid diagram found")
-                no_mermaid_count += 1
+    # Read work items from the local mirror (refresh with commands/sync_mirror.py)
+    with WorkItemMirror.open(config_dir) as mirror:
+        if mirror.last_synced is None:
+            print("❌ Work item mirror is empty. Run commands/sync_mirror.py first")
+            return False
+        print(f"🗄️  Using work item mirror synced {mirror.last_synced}")
+        
+        # Load work item mapping
+        mapping = ConfigManager.load_work_item_mapping(config_dir)
+        story_ids = mapping.get('stories', {})
+        
+        if not story_ids:
+            print("⚠️  No user stories found in mapping file")
+            return False
+        
+        print(f"\n🔍 Checking {len(story_ids)} user stories for Mermaid diagrams...")
+        
+        mermaid_count = 0
+        no_mermaid_count = 0
+        
+        for story_id, work_item_id in story_ids.items():
+            try:
+                # Get work item
+                work_item = mirror.get_work_item(work_item_id)
+                description = work_item.fields.get('System.Description', '')
                 
-        except Exception as e:
-            print(f"❌ Error checking {story_id} (ID: {work_item_id}): {e}")
-            no_mermaid_count += 1
-    
-    # Summary
-    print(f"\n📊 Azure DevOps Verification Summary:")
-    print(f"  ✅ Stories with Mermaid diagrams: {mermaid_count}")
-    print(f"  ❌ Stories without Mermaid diagrams: {no_mermaid_count}")
-    print(f"  📋 Total stories checked: {len(story_ids)}")
-    
-    if mermaid_count == len(story_ids):
-        print(f"\n🎉 All {len(story_ids)} user stories have Mermaid diagrams!")
-        print(f"🔗 View project at: {org_url}/{project}/_backlogs/backlog/")
-        return True
-    elif mermaid_count > 0:
-        print(f"\n⚠️  {mermaid_count}/{len(story_ids)} stories have Mermaid diagrams")
-        print(f"🔗 View project at: {org_url}/{project}/_backlogs/backlog/")
-        return False
-    else:
-        print(f"\n❌ No Mermaid diagrams found in any stories")
-        return False
+                # Check for Mermaid diagram indicators
+                has_mermaid = ('mermaid-diagram' in description or 
+                              'System Workflow Diagram' in description or
+                              'language-mermaid' in description or
+                              'flowchart TD' in description)
+                
+                if has_mermaid:
+                    print(f"✅ {story_id} (ID: {work_item_id}) - Mermaid diagram present")
+                    mermaid_count += 1
+                else:
+                    print(f"❌ {story_id} (ID: {work_item_id}) - No Mermaid diagram found")
+                    no_mermaid_count += 1
+                    
+            except Exception as e:
+                print(f"❌ Error checking {story_id} (ID: {work_item_id}): {e}")
+                no_mermaid_count += 1
+        
+        # Summary
+        print(f"\n📊 Azure DevOps Verification Summary:")
+        print(f"  ✅ Stories with Mermaid diagrams: {mermaid_count}")
+        print(f"  ❌ Stories without Mermaid diagrams: {no_mermaid_count}")
+        print(f"  📋 Total stories checked: {len(story_ids)}")
+        
+        if mermaid_count == len(story_ids):
+            print(f"\n🎉 All {len(story_ids)} user stories have Mermaid diagrams!")
+            print(f"🔗 View project at: {org_url}/{project}/_backlogs/backlog/")
+            return True
+        elif mermaid_count > 0:
+            print(f"\n⚠️  {mermaid_count}/{len(story_ids)} stories have Mermaid diagrams")
+            print(f"🔗 View project at: {org_url}/{project}/_backlogs/backlog/")
+            return False
+        else:
+            print(f"\n❌ No Mermaid diagrams found in any stories")
+            return False
 
 
 def main():
@@ -12,15 +12,19 @@ from pathlib import Path
 
 # Add the directory to path
 sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import the main components from the original script
 from create_azure_work_items import AzureDevOpsClient
 from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from azure_devops_manager import ParseCache
 
 
 class EpicMarkdownParser:
     """Parser that extracts detailed epic information from markdown file"""
     
+    PARSER_VERSION = "1"  # Bump whenever parse_epics_from_markdown output changes, so cached results are not reused
+    
     @staticmethod
     def parse_epics_from_markdown(file_path: str) -> dict:
         """Parse epic information from markdown file"""
@@ -203,7 +207,9 @@ def main():
     print("📖 Parsing epic details from markdown...")
     
     parser = EpicMarkdownParser()
-    epics_from_markdown = parser.parse_epics_from_markdown(markdown_file)
+    epics_from_markdown = ParseCache().get_or_parse(
+        'legacy_epics', markdown_file, parser.parse_epics_from_markdown, version=EpicMarkdownParser.PARSER_VERSION
+    )
     
     print(f"📋 Parsed {len(epics_from_markdown)} epics from markdown:")
     for epic_title in epics_from_markdown:
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Mermaid Lint - flowchart parser and linter for the diagrams in the requirements
+Reports syntax errors and structure problems (styles of undefined nodes, duplicate
+IDs, unbalanced subgraphs) with the line they occur on, before a diagram is pushed.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from azure_devops_manager import DocumentIndex
+
+
+@dataclass
+class LintIssue:
+    line: int
+    message: str
+    
+    def __str__(self):
+        return f"line {self.line}: {self.message}"
+
+
+@dataclass
+class FlowNode:
+    id: str
+    label: Optional[str]
+    shape: str
+    line: int
+
+
+@dataclass
+class FlowEdge:
+    source: str
+    target: str
+    arrow: str
+    label: Optional[str]
+    line: int
+
+
+@dataclass
+class Subgraph:
+    id: str
+    title: str
+    line: int
+    end_line: Optional[int] = None
+    nodes: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Flowchart:
+    """Parsed flowchart; `kind` is the diagram type of any other Mermaid diagram, which is not parsed"""
+    kind: str = 'flowchart'
+    direction: str = 'TB'
+    nodes: Dict[str, FlowNode] = field(default_factory=dict)
+    edges: List[FlowEdge] = field(default_factory=list)
+    subgraphs: Dict[str, Subgraph] = field(default_factory=dict)
+    issues: List[LintIssue] = field(default_factory=list)
+
+
+class FlowchartParser:
+    """Line-oriented parser for Mermaid `flowchart`/`graph` diagrams.
+    
+    Covers nodes in every shape, chained and `&` links with labels, subgraphs,
+    `direction`, `style`, `classDef`, `class`, `linkStyle`, `click` and `%%`
+    comments. Anything else on a line is reported as a syntax error.
+    """
+    
+    DIRECTIONS = ('TB', 'TD', 'BT', 'RL', 'LR')
+    DIAGRAM_TYPES = (
+        'sequenceDiagram', 'classDiagram', 'stateDiagram', 'stateDiagram-v2', 'erDiagram', 'journey', 'gantt',
+        'pie', 'quadrantChart', 'requirementDiagram', 'gitGraph', 'mindmap', 'timeline', 'sankey-beta', 'C4Context',
+    )
+    
+    HEADER = re.compile(r'(flowchart|graph)(?:\s+(\w+))?\s*(?:;(.*))?$')
+    NODE_ID = re.compile(r'\w+(?:-\w+)*')  # order-api, but not the A in A-->B
+    CLASS_SUFFIX = re.compile(r':::\w+(?:-\w+)*')
+    # (opening, closings, shape), longest openings first
+    SHAPES = [
+        ('(((', (')))',), 'double-circle'), ('([', ('])',), 'stadium'), ('[[', (']]',), 'subroutine'),
+        ('[(', (')]',), 'cylinder'), ('((', ('))',), 'circle'), ('{{', ('}}',), 'hexagon'),
+        ('[/', ('/]', '\\]'), 'parallelogram'), ('[\\', ('\\]', '/]'), 'parallelogram-alt'),
+        ('[', (']',), 'rectangle'), ('(', (')',), 'rounded'), ('{', ('}',), 'rhombus'), ('>', (']',), 'asymmetric'),
+    ]
+    LINK = re.compile(r'\s*([<ox]?(?:-{2,}[->ox]?|={2,}[=>ox]?|-\.+-[>ox]?|~{3,}))')
+    LABELLED_LINK = re.compile(r'\s*(--|==|-\.)\s')
+    LABEL_CLOSE = {
+        '--': re.compile(r'\s(-{2,}[>ox]?)'),
+        '==': re.compile(r'\s(={2,}[>ox]?)'),
+        '-.': re.compile(r'\s(\.-+[>ox]?)'),
+    }
+    PIPE_LABEL = re.compile(r'\s*\|([^|]*)\|')
+    SUBGRAPH_KEYWORD = re.compile(r'subgraph(\s|$)')
+    SUBGRAPH = re.compile(r'subgraph\s+(\w+(?:-\w+)*)\s*(?:\[\s*(?:"([^"]*)"|([^\]"]*))\s*\])?\s*$')
+    SUBGRAPH_TITLE = re.compile(r'subgraph\s+(.+?)\s*$')
+    STATEMENTS = re.compile(r'(style|classDef|class|linkStyle|click|direction)\s+(.*?)\s*;?$')
+    RESERVED_IDS = {'end', 'subgraph', 'graph', 'flowchart', 'style', 'classDef', 'class', 'linkStyle', 'click'}
+    UNQUOTED_FORBIDDEN = set('()[]{}"')
+    
+    @classmethod
+    def parse(cls, source: str, first_line: int = 1) -> Flowchart:
+        """Parse a diagram; `first_line` is the line number of its first line in the enclosing file"""
+        chart = Flowchart()
+        state = _ParseState(chart)
+        header_seen = False
+        
+        for number, raw in enumerate(source.split('\n'), start=first_line):
+            line = raw.strip()
+            if not line or line.startswith('%%'):
+                continue
+            
+            if not header_seen:
+                header_seen = True
+                header = cls.HEADER.match(line)
+                if header:
+                    chart.direction = header.group(2) or 'TB'
+                    if chart.direction not in cls.DIRECTIONS:
+                        state.error(number, f"unknown direction '{chart.direction}'")
+                    if header.group(3) and header.group(3).strip():
+                        cls._parse_line(header.group(3).strip(), number, state)
+                    continue
+                kind = line.split()[0].rstrip(';')
+                if kind in cls.DIAGRAM_TYPES:
+                    chart.kind = kind
+                    return chart
+                state.error(number, f"unknown diagram type '{kind}'")
+                return chart
+            
+            cls._parse_line(line, number, state)
+        
+        if not header_seen:
+            state.error(first_line, "empty diagram")
+        cls._check_structure(state)
+        chart.issues.sort(key=lambda issue: issue.line)
+        return chart
+    
+    @classmethod
+    def _parse_line(cls, line: str, number: int, state: "_ParseState"):
+        if line == 'end' or line == 'end;':
+            if not state.open_subgraphs:
+                state.error(number, "'end' without a matching 'subgraph'")
+            else:
+                state.open_subgraphs.pop().end_line = number
+            return
+        
+        if cls.SUBGRAPH_KEYWORD.match(line):
+            match = cls.SUBGRAPH.match(line) or cls.SUBGRAPH_TITLE.match(line)
+            if not match:
+                state.error(number, "subgraph needs an ID or title")
+                return
+            subgraph_id = match.group(1)
+            title = subgraph_id
+            if match.re is cls.SUBGRAPH:
+                title = match.group(2) if match.group(2) is not None else (match.group(3) or subgraph_id)
+            if subgraph_id in state.chart.subgraphs:
+                first = state.chart.subgraphs[subgraph_id].line
+                state.error(number, f"duplicate subgraph ID '{subgraph_id}' (first defined on line {first})")
+            subgraph = Subgraph(subgraph_id, title.strip(), number)
+            state.chart.subgraphs.setdefault(subgraph_id, subgraph)
+            state.open_subgraphs.append(subgraph)
+            return
+        
+        statement = cls.STATEMENTS.match(line)
+        if statement:
+            cls._parse_statement(statement.group(1), statement.group(2), number, state)
+            return
+        
+        position = 0
+        while position < len(line):
+            position = cls._parse_chain(line, position, number, state)
+            if position is None:
+                return
+            rest = line[position:].lstrip()
+            if not rest:
+                return
+            if rest[0] != ';':
+                state.error(number, f"unexpected '{rest[:20]}'")
+                return
+            position = len(line) - len(rest) + 1
+    
+    @classmethod
+    def _parse_statement(cls, keyword: str, arguments: str, number: int, state: "_ParseState"):
+        words = arguments.split()
+        if not words:
+            state.error(number, f"'{keyword}' needs arguments")
+        elif keyword == 'direction':
+            if words[0] not in cls.DIRECTIONS:
+                state.error(number, f"unknown direction '{words[0]}'")
+        elif keyword in ('style', 'click'):
+            state.reference(words[0], number)
+        elif keyword == 'class':
+            if len(words) < 2:
+                state.error(number, "'class' needs node IDs and a class name")
+            for node_id in words[0].split(','):
+                state.reference(node_id, number)
+        elif keyword == 'linkStyle':
+            if words[0] != 'default':
+                for index in words[0].split(','):
+                    if not index.isdigit():
+                        state.error(number, f"linkStyle index '{index}' is not a number")
+                    else:
+                        state.link_styles.append((int(index), number))
+    
+    @classmethod
+    def _parse_chain(cls, line: str, position: int, number: int, state: "_ParseState") -> Optional[int]:
+        """Parse `nodes (link nodes)*` from position; return the position after it, or None after an error"""
+        sources = cls._parse_nodes(line, position, number, state)
+        if sources is None:
+            return None
+        node_ids, position = sources
+        linked = False
+        
+        while True:
+            link = cls._parse_link(line, position, number, state)
+            if link is None:
+                return None
+            arrow, label, after_link = link
+            if not arrow:
+                if not node_ids:
+                    state.error(number, f"unexpected '{line[position:].strip()[:20]}'")
+                    return None
+                if not linked:
+                    for node_id in node_ids:
+                        state.declare_bare(node_id, number)
+                return position
+            if not node_ids:
+                state.error(number, f"link '{arrow}' has no source node")
+                return None
+            linked = True
+            
+            targets = cls._parse_nodes(line, after_link, number, state)
+            if targets is None:
+                return None
+            target_ids, position = targets
+            if not target_ids:
+                state.error(number, f"link '{arrow}' has no target node")
+                return None
+            for source in node_ids:
+                for target in target_ids:
+                    state.chart.edges.append(FlowEdge(source, target, arrow, label, number))
+            # Linking a node declares it, as Mermaid does
+            for node_id in node_ids + target_ids:
+                state.declare_bare(node_id, number)
+            node_ids = target_ids
+    
+    @classmethod
+    def _parse_nodes(cls, line: str, position: int, number: int,
+                     state: "_ParseState") -> Optional[Tuple[List[str], int]]:
+        """Parse `node (& node)*`; an empty list means no node starts at position"""
+        node_ids = []
+        while True:
+            start = position + len(line[position:]) - len(line[position:].lstrip())
+            match = cls.NODE_ID.match(line, start)
+            if not match:
+                if node_ids:
+                    state.error(number, "'&' must be followed by a node")
+                    return None
+                return node_ids, position
+            
+            node_id = match.group()
+            if node_id in cls.RESERVED_IDS:
+                state.error(number, f"'{node_id}' is a reserved word and cannot be a node ID")
+                return None
+            shape = cls._parse_shape(line, match.end(), number, state)
+            if shape is None:
+                return None
+            label, shape_name, position = shape
+            if shape_name:
+                state.define(FlowNode(node_id, label, shape_name, number))
+            
+            suffix = cls.CLASS_SUFFIX.match(line, position)
+            if suffix:
+                position = suffix.end()
+            node_ids.append(node_id)
+            
+            ampersand = re.compile(r'\s*&').match(line, position)
+            if not ampersand:
+                return node_ids, position
+            position = ampersand.end()
+    
+    @classmethod
+    def _parse_shape(cls, line: str, position: int, number: int,
+                     state: "_ParseState") -> Optional[Tuple[Optional[str], Optional[str], int]]:
+        """(label, shape, position after it); shape is None for a bare node ID"""
+        for opening, closings, shape in cls.SHAPES:
+            if not line.startswith(opening, position):
+                continue
+            
+            text_start = position + len(opening)
+            stripped = line[text_start:].lstrip()
+            if stripped.startswith('"'):
+                quote = len(line) - len(stripped)
+                quote_end = line.find('"', quote + 1)
+                if quote_end == -1:
+                    state.error(number, "unterminated quoted label")
+                    return None
+                label = line[quote + 1:quote_end]
+                after = quote_end + 1 + len(line[quote_end + 1:]) - len(line[quote_end + 1:].lstrip())
+                for closing in closings:
+                    if line.startswith(closing, after):
+                        return label, shape, after + len(closing)
+                state.error(number, f"expected '{closings[0]}' after the quoted label")
+                return None
+            
+            ends = [(line.find(closing, text_start), closing) for closing in closings]
+            ends = [(end, closing) for end, closing in ends if end != -1]
+            if not ends:
+                state.error(number, f"'{opening}' is never closed with '{closings[0]}'")
+                return None
+            end, closing = min(ends)
+            label = line[text_start:end]
+            forbidden = sorted(cls.UNQUOTED_FORBIDDEN.intersection(label))
+            if forbidden:
+                state.error(number, f"unquoted label contains {' '.join(forbidden)}; wrap the label in double quotes")
+                return None
+            return label.strip(), shape, end + len(closing)
+        return None, None, position
+    
+    @classmethod
+    def _parse_link(cls, line: str, position: int, number: int,
+                    state: "_ParseState") -> Optional[Tuple[str, Optional[str], int]]:
+        """(arrow, label, position after it); arrow is '' when no link starts at position"""
+        labelled = cls.LABELLED_LINK.match(line, position)
+        if labelled:
+            closing = cls.LABEL_CLOSE[labelled.group(1)].search(line, labelled.end())
+            if not closing:
+                state.error(number, f"link label after '{labelled.group(1)}' is never closed")
+                return None
+            label = line[labelled.end():closing.start()].strip()
+            return closing.group(1), label, closing.end()
+        
+        link = cls.LINK.match(line, position)
+        if not link:
+            return '', None, position
+        
+        label = None
+        end = link.end()
+        if line[end:].lstrip().startswith('|'):
+            pipe = cls.PIPE_LABEL.match(line, end)
+            if not pipe:
+                state.error(number, "link label after '|' is never closed")
+                return None
+            label = pipe.group(1).strip()
+            end = pipe.end()
+        return link.group(1), label, end
+    
+    @staticmethod
+    def _check_structure(state: "_ParseState"):
+        chart = state.chart
+        for subgraph in state.open_subgraphs:
+            state.error(subgraph.line, f"subgraph '{subgraph.id}' is never closed with 'end'")
+        
+        for node_id, line in state.references.items():
+            if node_id not in chart.nodes and node_id not in chart.subgraphs:
+                state.error(line, f"undefined node '{node_id}'")
+        for node_id, node in list(chart.nodes.items()):
+            if node_id not in chart.subgraphs:
+                continue
+            if node.shape == 'bare':
+                # A link to a subgraph, not a node
+                del chart.nodes[node_id]
+                for subgraph in chart.subgraphs.values():
+                    if node_id in subgraph.nodes:
+                        subgraph.nodes.remove(node_id)
+            else:
+                state.error(node.line, f"'{node_id}' is used for both a node and a subgraph")
+        for index, line in state.link_styles:
+            if index >= len(chart.edges):
+                state.error(line, f"linkStyle {index} refers to a missing link ({len(chart.edges)} defined)")
+
+
+class _ParseState:
+    """Mutable state while parsing one flowchart"""
+    
+    def __init__(self, chart: Flowchart):
+        self.chart = chart
+        self.open_subgraphs: List[Subgraph] = []
+        self.references: Dict[str, int] = {}  # ID -> first line a style, class or click names it
+        self.link_styles: List[Tuple[int, int]] = []
+    
+    def error(self, line: int, message: str):
+        self.chart.issues.append(LintIssue(line, message))
+    
+    def define(self, node: FlowNode):
+        existing = self.chart.nodes.get(node.id)
+        if existing is not None and existing.shape != 'bare':
+            self.error(node.line, f"duplicate node ID '{node.id}' (first defined on line {existing.line})")
+            return
+        self.chart.nodes[node.id] = node
+        if self.open_subgraphs and node.id not in self.open_subgraphs[-1].nodes:
+            self.open_subgraphs[-1].nodes.append(node.id)
+    
+    def reference(self, node_id: str, line: int):
+        self.references.setdefault(node_id, line)
+    
+    def declare_bare(self, node_id: str, line: int):
+        """Declare a node by its ID alone, with the ID as label, unless it is already declared"""
+        if node_id not in self.chart.nodes:
+            self.chart.nodes[node_id] = FlowNode(node_id, None, 'bare', line)
+            if self.open_subgraphs:
+                self.open_subgraphs[-1].nodes.append(node_id)
+
+
+def lint_mermaid(source: str, first_line: int = 1) -> List[LintIssue]:
+    """Issues in a Mermaid diagram; diagrams other than flowcharts are not checked"""
+    return FlowchartParser.parse(source, first_line).issues
+
+
+def lint_file(file_path) -> List[LintIssue]:
+    """Issues in every ```mermaid block of a markdown file, numbered by file line"""
+    with DocumentIndex(file_path) as index:
+        issues = []
+        for block in index.find_code_blocks('mermaid'):
+            issues.extend(lint_mermaid(index.text(block.start, block.end), first_line=block.line + 1))
+        return issues
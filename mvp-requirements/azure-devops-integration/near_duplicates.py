@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Near Duplicates - MinHash/LSH detection of work items that are almost copies
+Reruns that created copies of stories, later edited slightly, are found by
+comparing shingled text instead of story IDs, in time linear in the item count.
+"""
+
+import bisect
+import html
+import operator
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+WORK_ITEM_TEXT_FIELDS = ['System.Title', 'System.Description', 'Microsoft.VSTS.Common.AcceptanceCriteria']
+
+
+def work_item_text(work_item) -> str:
+    """Title, description and acceptance criteria of a work item as one text"""
+    fields = work_item.fields or {}
+    return "\n".join(fields.get(name) or '' for name in WORK_ITEM_TEXT_FIELDS)
+
+
+class MinHasher:
+    """MinHash signatures of word shingles, using one-permutation hashing.
+    
+    Each shingle is hashed once and assigned to one of `num_perm` bins by its
+    hash; a bin keeps its smallest hash. Empty bins borrow from the next
+    filled bin (rotation densification), so signatures compare like classic
+    MinHash at a fraction of the cost of `num_perm` hash functions. Hashing is
+    deterministic, so signatures match across processes and runs.
+    """
+    
+    TAG = re.compile(r'<[^>]+>')
+    PUNCTUATION = str.maketrans({char: ' ' for char in '!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~•'})
+    HASH_MASK = (1 << 64) - 1
+    BORROW_OFFSET = 1 << 58  # Added per bin of distance to a borrowed value
+    
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+    
+    def words(self, text: str) -> List[str]:
+        """Lowercase words of text with HTML markup and punctuation removed"""
+        text = self.TAG.sub(' ', text)
+        if '&' in text:
+            text = html.unescape(text)
+        return text.lower().translate(self.PUNCTUATION).split()
+    
+    def shingles(self, text: str) -> Set[int]:
+        """Hashes of the word `shingle_size`-grams of text"""
+        hashes = list(map(zlib.crc32, map(str.encode, self.words(text))))
+        if len(hashes) < self.shingle_size:
+            return {hash(tuple(hashes))}
+        return set(map(hash, zip(*(hashes[offset:] for offset in range(self.shingle_size)))))
+    
+    def signature(self, text: str) -> Tuple[int, ...]:
+        bins = self.num_perm
+        # Descending order, so dict() keeps the smallest hash of each bin
+        values = sorted(map(self.HASH_MASK.__and__, self.shingles(text)), reverse=True)
+        smallest = dict(zip(map(bins.__rmod__, values), values))
+        signature = list(map(smallest.get, range(bins)))
+        if len(smallest) < bins:
+            filled = sorted(smallest)
+            for index in range(bins):
+                if signature[index] is None:
+                    position = bisect.bisect(filled, index)
+                    source = filled[position % len(filled)]
+                    signature[index] = smallest[source] + ((source - index) % bins) * self.BORROW_OFFSET
+        return tuple(signature)
+    
+    def signatures(self, texts: Iterable[str]) -> List[Tuple[int, ...]]:
+        return [self.signature(text) for text in texts]
+    
+    @staticmethod
+    def similarity(first: Tuple[int, ...], second: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity: the fraction of matching signature slots"""
+        return sum(map(operator.eq, first, second)) / len(first)
+
+
+def optimal_bands(threshold: float, num_perm: int, false_positive_weight: float = 0.5) -> Tuple[int, int]:
+    """(bands, rows) whose LSH S-curve best separates pairs at `threshold` similarity.
+    
+    Minimizes the weighted area of false positives below the threshold and
+    false negatives above it.
+    """
+    steps = 100
+    
+    def candidate_probability(similarity, bands, rows):
+        return 1 - (1 - similarity ** rows) ** bands
+    
+    def area(start, end, bands, rows, missed):
+        width = (end - start) / steps
+        total = 0.0
+        for step in range(steps):
+            probability = candidate_probability(start + (step + 0.5) * width, bands, rows)
+            total += (1 - probability if missed else probability) * width
+        return total
+    
+    best, best_error = (1, num_perm), float('inf')
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            error = (false_positive_weight * area(0.0, threshold, bands, rows, missed=False) +
+                     (1 - false_positive_weight) * area(threshold, 1.0, bands, rows, missed=True))
+            if error < best_error:
+                best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateIndex:
+    """LSH index of MinHash signatures for finding near-duplicate texts.
+        
+        index = NearDuplicateIndex(threshold=0.8)
+        index.add_many({work_item.id: work_item_text(work_item) for work_item in work_items})
+        for group in index.groups():
+            ...
+    
+    Signatures are split into bands; items sharing any band land in the same
+    bucket and become candidates, which are kept when their estimated
+    similarity reaches `threshold`. Raising the threshold also narrows the
+    bands, so fewer dissimilar pairs are compared.
+    """
+    
+    def __init__(self, threshold: float = 0.8, num_perm: int = 128, shingle_size: int = 3):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm, shingle_size)
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+        self.signatures: Dict[Hashable, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[int, List[Hashable]]] = [{} for _ in range(self.bands)]
+    
+    def __len__(self) -> int:
+        return len(self.signatures)
+    
+    def add(self, key: Hashable, text: str):
+        self.add_signature(key, self.hasher.signature(text))
+    
+    def add_many(self, texts: Mapping[Hashable, str], max_workers: Optional[int] = None):
+        """Add many texts, computing signatures in a process pool unless max_workers is 1 or there is little work"""
+        keys = list(texts)
+        workers = min(max_workers or os.cpu_count() or 1, max(1, len(keys) // 2000))
+        if workers == 1:
+            signatures = self.hasher.signatures(texts[key] for key in keys)
+        else:
+            chunk_size = -(-len(keys) // (workers * 4))
+            chunks = [[texts[key] for key in keys[start:start + chunk_size]] for start in range(0, len(keys), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                signatures = [signature for chunk in executor.map(self.hasher.signatures, chunks) for signature in chunk]
+        for key, signature in zip(keys, signatures):
+            self.add_signature(key, signature)
+    
+    def add_signature(self, key: Hashable, signature: Tuple[int, ...]):
+        if key in self.signatures:
+            raise ValueError(f"duplicate key: {key}")
+        self.signatures[key] = signature
+        for band, buckets in enumerate(self._buckets):
+            band_key = hash(signature[band * self.rows:(band + 1) * self.rows])
+            buckets.setdefault(band_key, []).append(key)
+    
+    def similarity(self, first: Hashable, second: Hashable) -> float:
+        return MinHasher.similarity(self.signatures[first], self.signatures[second])
+    
+    def candidate_pairs(self) -> Set[Tuple[Hashable, Hashable]]:
+        """Pairs sharing at least one band, in insertion order within each pair"""
+        pairs = set()
+        order = {key: position for position, key in enumerate(self.signatures)}
+        for buckets in self._buckets:
+            for members in buckets.values():
+                for position, first in enumerate(members):
+                    for second in members[position + 1:]:
+                        pairs.add((first, second) if order[first] < order[second] else (second, first))
+        return pairs
+    
+    def similar_pairs(self) -> List[Tuple[Hashable, Hashable, float]]:
+        """Candidate pairs at or above the threshold, most similar first"""
+        pairs = []
+        for first, second in self.candidate_pairs():
+            similarity = self.similarity(first, second)
+            if similarity >= self.threshold:
+                pairs.append((first, second, similarity))
+        pairs.sort(key=lambda pair: -pair[2])
+        return pairs
+    
+    def groups(self) -> List[List[Hashable]]:
+        """Items linked by similarity at or above the threshold, largest group first.
+        
+        The groups are the connected components of similar_pairs(). A candidate
+        pair already in one group is not compared, so a large cluster of copies
+        costs few similarity estimates.
+        """
+        parent = {key: key for key in self.signatures}
+        
+        def root(key):
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+        
+        dissimilar: Set[Tuple[Hashable, Hashable]] = set()  # Pairs sharing several bands are compared once
+        for buckets in self._buckets:
+            for members in buckets.values():
+                for position, first in enumerate(members):
+                    for second in members[position + 1:]:
+                        first_root, second_root = root(first), root(second)
+                        if first_root == second_root or (first, second) in dissimilar:
+                            continue
+                        if self.similarity(first, second) >= self.threshold:
+                            parent[second_root] = first_root
+                        else:
+                            dissimilar.add((first, second))
+        
+        groups: Dict[Hashable, List[Hashable]] = {}
+        for key in self.signatures:
+            groups.setdefault(root(key), []).append(key)
+        return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+    
+    def query(self, text: str) -> List[Tuple[Hashable, float]]:
+        """Indexed items similar to text, most similar first"""
+        signature = self.hasher.signature(text)
+        candidates = set()
+        for band, buckets in enumerate(self._buckets):
+            candidates.update(buckets.get(hash(signature[band * self.rows:(band + 1) * self.rows]), ()))
+        matches = [(key, MinHasher.similarity(signature, self.signatures[key])) for key in candidates]
+        return sorted((match for match in matches if match[1] >= self.threshold), key=lambda match: -match[1])
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Render Snapshot - offline record of the field payloads a sync would push
+Renders every epic and story to its final fields and streams them to a gzipped
+JSON Lines file; two snapshots are compared by per-field hashes.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from azure_devops_manager import Epic, UserStory, WorkItemDocumentBuilder
+
+SNAPSHOT_VERSION = 1
+
+
+@dataclass
+class SnapshotDiff:
+    """Items added, removed and changed between two snapshots, keyed by 'kind:key'"""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, List[str]] = field(default_factory=dict)  # Item -> names of changed fields
+    
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+def render_records(epics: Mapping[str, Epic], stories: Mapping[str, UserStory],
+                   builder: Optional[WorkItemDocumentBuilder] = None) -> Iterator[Dict]:
+    """Snapshot records for every epic and story, sorted by kind and key"""
+    builder = builder or WorkItemDocumentBuilder()
+    for title in sorted(epics):
+        yield _record('epic', title, builder.build_epic_document(epics[title]))
+    for story_id in sorted(stories):
+        yield _record('story', story_id, builder.build_story_document(stories[story_id]))
+
+
+def write_snapshot(path: Path, records: Iterable[Dict]) -> int:
+    """Stream records to a gzipped JSONL file atomically and return how many were written.
+    
+    The gzip header carries no timestamp, so identical renders give identical files.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    count = 0
+    try:
+        with os.fdopen(fd, 'wb') as raw, gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as compressed:
+            with io.TextIOWrapper(compressed, encoding='utf-8', newline='\n') as f:
+                f.write(json.dumps({'snapshot_version': SNAPSHOT_VERSION}) + '\n')
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + '\n')
+                    count += 1
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
+def read_snapshot(path: Path) -> Iterator[Dict]:
+    """Records of a snapshot file, in file order"""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        header = json.loads(f.readline() or '{}')
+        if header.get('snapshot_version') != SNAPSHOT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_VERSION} render snapshot")
+        for line in f:
+            yield json.loads(line)
+
+
+def read_snapshot_hashes(path: Path) -> Dict[str, Tuple[str, Dict[str, str]]]:
+    """'kind:key' -> (item hash, field hashes) for every record in a snapshot"""
+    return {f"{record['kind']}:{record['key']}": (record['hash'], record['field_hashes']) for record in read_snapshot(path)}
+
+
+def diff_snapshots(old_path: Path, new_path: Path) -> SnapshotDiff:
+    """Compare two snapshots by hash; only items whose hash differs are inspected field by field"""
+    old = read_snapshot_hashes(old_path)
+    new = read_snapshot_hashes(new_path)
+    diff = SnapshotDiff(
+        added=sorted(item for item in new if item not in old),
+        removed=sorted(item for item in old if item not in new)
+    )
+    
+    for item, (item_hash, field_hashes) in sorted(new.items()):
+        if item not in old or old[item][0] == item_hash:
+            continue
+        old_fields = old[item][1]
+        diff.changed[item] = sorted(
+            name for name in set(old_fields) | set(field_hashes) if old_fields.get(name) != field_hashes.get(name)
+        )
+    return diff
+
+
+def _record(kind: str, key: str, operations) -> Dict:
+    fields = {
+        operation.path[len("/fields/"):]: operation.value
+        for operation in operations if operation.path.startswith("/fields/")
+    }
+    field_hashes = {
+        path[len("/fields/"):]: digest
+        for path, digest in WorkItemDocumentBuilder.hash_field_values(operations).items() if path.startswith("/fields/")
+    }
+    item_hash = hashlib.sha256(json.dumps(field_hashes, sort_keys=True).encode('utf-8')).hexdigest()
+    return {'kind': kind, 'key': key, 'hash': item_hash, 'field_hashes': field_hashes, 'fields': fields}
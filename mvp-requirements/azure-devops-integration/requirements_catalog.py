@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Requirements Catalog - one indexed view of every requirements document
+Parses the markdown sources in a process pool and merges stories, epics,
+workflow documents and Mermaid blocks into a single catalog.
+"""
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from azure_devops_manager import CompactEpic, CompactUserStory, DocumentIndex, Epic, MarkdownParser, ParseCache, UserStory
+
+REQUIREMENTS_ROOT = Path(__file__).parent.parent
+SOURCE_DIRS = ("user story", "workflows", "data-models", "api-specs", "grooming")
+CATALOG_PARSER_VERSION = "1"
+
+
+@dataclass
+class MermaidBlock:
+    """A fenced Mermaid block and the heading it appears under"""
+    source: str
+    heading: str
+    line: int  # 1-based line of the opening fence
+    code: str
+
+
+@dataclass
+class DocumentEntry:
+    """Everything parsed from one markdown file"""
+    source: str  # Path relative to the requirements root
+    title: str
+    headings: List[str]
+    stories: Dict[str, UserStory] = field(default_factory=dict)
+    epics: Dict[str, Epic] = field(default_factory=dict)
+    mermaid_blocks: List[MermaidBlock] = field(default_factory=list)
+
+
+_USE_CASE_ID = re.compile(r'^([A-Z]+-\d+)')
+
+
+def scan_document(file_path: str, source: Optional[str] = None) -> DocumentEntry:
+    """Parse stories, epics, headings and Mermaid blocks from one file"""
+    source = source or Path(file_path).name
+    with DocumentIndex(file_path) as index:
+        headings = index.heading_titles()
+        mermaid_blocks = [
+            MermaidBlock(source, block.heading, block.line, index.text(block.start, block.end).strip())
+            for block in index.find_code_blocks('mermaid')
+        ]
+    
+    return DocumentEntry(
+        source=source,
+        title=headings[0] if headings else Path(file_path).stem,
+        headings=headings,
+        stories=MarkdownParser.parse_user_stories(file_path),
+        epics=MarkdownParser.parse_epics(file_path),
+        mermaid_blocks=mermaid_blocks
+    )
+
+
+def _scan_source(job) -> DocumentEntry:
+    """Process-pool entry point: (root, relative path, cache directory or None)"""
+    root, source, cache_dir = job
+    file_path = str(Path(root) / source)
+    if cache_dir is None:
+        return scan_document(file_path, source)
+    
+    document = ParseCache(cache_dir).get_or_parse(
+        'catalog_document', file_path, scan_document,
+        version=f"{MarkdownParser.PARSER_VERSION}.{CATALOG_PARSER_VERSION}"
+    )
+    # Identical files share a cache entry, so label the result with this path
+    document.source = source
+    for block in document.mermaid_blocks:
+        block.source = source
+    return document
+
+
+class RequirementsCatalog:
+    """Stories, epics, workflow documents and Mermaid blocks from all requirement sources.
+    
+    Documents are merged in path order; when a story ID or epic title appears in
+    more than one file the first definition wins and the others are listed in
+    `duplicates`:
+        
+        catalog = RequirementsCatalog.build()
+        story = catalog.stories['ORD-001']
+        diagram = catalog.mermaid_for('UC-004', heading='System Workflow Diagram')
+    
+    build(compact=True) keeps stories and epics as CompactUserStory / CompactEpic,
+    which matters once the catalog holds many thousands of stories.
+    """
+    
+    def __init__(self, documents: Sequence[DocumentEntry], compact: bool = False):
+        self.documents: Dict[str, DocumentEntry] = {}
+        self.stories: Dict[str, UserStory] = {}
+        self.epics: Dict[str, Epic] = {}
+        self.story_sources: Dict[str, str] = {}
+        self.epic_sources: Dict[str, str] = {}
+        self.mermaid_blocks: List[MermaidBlock] = []
+        self.duplicates: Dict[str, List[str]] = {}
+        
+        for document in sorted(documents, key=lambda document: document.source):
+            if compact:
+                document.stories = {key: CompactUserStory.from_story(story) for key, story in document.stories.items()}
+                document.epics = {key: CompactEpic.from_epic(epic) for key, epic in document.epics.items()}
+            self.documents[document.source] = document
+            self.mermaid_blocks.extend(document.mermaid_blocks)
+            self._merge(document.stories, self.stories, self.story_sources, document.source)
+            self._merge(document.epics, self.epics, self.epic_sources, document.source)
+    
+    @classmethod
+    def build(cls, root: Path = REQUIREMENTS_ROOT, source_dirs: Sequence[str] = SOURCE_DIRS,
+              max_workers: Optional[int] = None, parse_cache: Optional[ParseCache] = None,
+              compact: bool = False) -> "RequirementsCatalog":
+        """Parse every markdown file under `source_dirs` in a process pool and merge the results.
+        
+        With a parse_cache, documents that haven't changed are loaded instead of parsed.
+        max_workers=1 parses in this process.
+        """
+        root = Path(root)
+        sources = sorted(
+            str(path.relative_to(root))
+            for source_dir in source_dirs
+            for path in (root / source_dir).rglob('*.md')
+        )
+        cache_dir = str(parse_cache.cache_dir) if parse_cache else None
+        jobs = [(str(root), source, cache_dir) for source in sources]
+        
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs)) or 1
+        if workers == 1:
+            return cls([_scan_source(job) for job in jobs], compact)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return cls(list(executor.map(_scan_source, jobs, chunksize=max(1, len(jobs) // (workers * 4)))), compact)
+    
+    @property
+    def workflows(self) -> Dict[str, DocumentEntry]:
+        """Documents that contain at least one Mermaid diagram, keyed by source path"""
+        return {source: document for source, document in self.documents.items() if document.mermaid_blocks}
+    
+    def workflow_for(self, use_case_id: str) -> Optional[DocumentEntry]:
+        """The workflow document whose file name starts with `use_case_id`, e.g. 'UC-004'"""
+        for source, document in self.workflows.items():
+            match = _USE_CASE_ID.match(Path(source).name)
+            if match and match.group(1) == use_case_id:
+                return document
+        return None
+    
+    def mermaid_for(self, use_case_id: str, heading: Optional[str] = None) -> Optional[MermaidBlock]:
+        """First Mermaid block of a use case's workflow, optionally under a given heading"""
+        document = self.workflow_for(use_case_id)
+        if document is None:
+            return None
+        for block in document.mermaid_blocks:
+            if heading is None or block.heading == heading:
+                return block
+        return None
+    
+    def _merge(self, items: Dict, target: Dict, sources: Dict[str, str], source: str):
+        for key, item in items.items():
+            if key in target:
+                self.duplicates.setdefault(key, [sources[key]]).append(source)
+                continue
+            target[key] = item
+            sources[key] = source
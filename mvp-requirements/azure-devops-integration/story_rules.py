@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Story Rules - registry of quality checks for work item fields
+The indicators and patterns every verify command used to test inline are kept
+here as named rules, so commands share them and can extend them.
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import AbstractSet, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
+
+# Work item field read for each rule field name
+WORK_ITEM_FIELDS = {
+    'title': 'System.Title',
+    'description': 'System.Description',
+    'acceptance_criteria': 'Microsoft.VSTS.Common.AcceptanceCriteria',
+}
+
+
+def story_fields(work_item) -> Dict[str, str]:
+    """Rule field texts of a work item; missing fields are empty strings"""
+    fields = work_item.fields or {}
+    return {name: fields.get(reference) or '' for name, reference in WORK_ITEM_FIELDS.items()}
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One check over one or more fields.
+    
+    kind is 'literal' (substring), 'regex', 'min_length' (stripped text at least
+    `length` characters) or 'custom' (`check(text)` returns True). The condition
+    holds if it holds for any of the rule's fields. A Finding is reported when
+    the condition differs from `expect`: required content uses expect=True,
+    forbidden content expect=False. Findings sharing a `group` are reported as
+    one line, "group: message, message".
+    """
+    name: str
+    fields: Tuple[str, ...]
+    kind: str = 'literal'
+    pattern: str = ''
+    expect: bool = False
+    severity: str = 'issue'  # 'issue' or 'warning'
+    message: str = ''
+    group: str = ''
+    length: int = 0
+    ignore_case: bool = False
+    check: Optional[Callable[[str], bool]] = None  # Named function; its qualified name is part of RuleSet.version
+
+
+@dataclass(frozen=True)
+class Finding:
+    rule: str
+    severity: str
+    message: str
+    group: str = ''
+
+
+class RuleSet:
+    """Ordered, pluggable collection of rules, each checked on its own.
+    
+        rules = RuleSet(STORY_CONTENT_RULES)
+        rules.add(Rule('no_todo', ('description',), pattern='TODO', message='TODO left in description'))
+        findings = rules.evaluate(story_fields(work_item))
+        results = rules.evaluate_many({work_item.id: story_fields(work_item) for work_item in items})
+        results = rules.evaluate_mirror(mirror, ids)  # Cached per System.Rev
+    
+    `version` changes whenever a rule is added or altered, which invalidates
+    results cached in the mirror.
+    """
+    
+    def __init__(self, rules: Iterable[Rule] = ()):
+        self.rules: List[Rule] = []
+        self._literals: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._patterns: Dict[str, List[Tuple[str, re.Pattern]]] = {}
+        self._computed_rules: List[Rule] = []
+        self._findings: List[Tuple[str, bool, Finding]] = []
+        self.extend(rules)
+    
+    def add(self, rule: Rule):
+        if any(existing.name == rule.name for existing in self.rules):
+            raise ValueError(f"duplicate rule name: {rule.name}")
+        if rule.kind not in ('literal', 'regex', 'min_length', 'custom'):
+            raise ValueError(f"unknown rule kind: {rule.kind}")
+        self.rules.append(rule)
+        self._literals = None
+    
+    def extend(self, rules: Iterable[Rule]):
+        for rule in rules:
+            self.add(rule)
+    
+    @property
+    def version(self) -> str:
+        """Short hash of every rule definition"""
+        definitions = [
+            [rule.name, list(rule.fields), rule.kind, rule.pattern, rule.expect, rule.severity, rule.message,
+             rule.group, rule.length, rule.ignore_case, getattr(rule.check, '__qualname__', None)]
+            for rule in self.rules
+        ]
+        return hashlib.sha256(json.dumps(definitions).encode('utf-8')).hexdigest()[:16]
+    
+    def satisfied(self, fields: Mapping[str, str]) -> Set[str]:
+        """Names of rules whose condition holds for these field texts"""
+        literals, patterns, computed_rules = self._compiled()
+        names: Set[str] = set()
+        for field_name, field_literals in literals.items():
+            text = fields.get(field_name) or ''
+            names.update([name for name, pattern in field_literals if pattern in text])
+        for field_name, field_patterns in patterns.items():
+            text = fields.get(field_name) or ''
+            names.update([name for name, pattern in field_patterns if pattern.search(text)])
+        
+        for rule in computed_rules:
+            for name in rule.fields:
+                text = fields.get(name) or ''
+                if len(text.strip()) >= rule.length if rule.kind == 'min_length' else rule.check(text):
+                    names.add(rule.name)
+                    break
+        return names
+    
+    def evaluate(self, fields: Mapping[str, str]) -> List[Finding]:
+        """Findings in rule order"""
+        return self.findings(self.satisfied(fields))
+    
+    def findings(self, satisfied: AbstractSet[str]) -> List[Finding]:
+        """Findings, in rule order, for the names of the satisfied rules"""
+        self._compiled()
+        return [finding for name, expect, finding in self._findings if (name in satisfied) != expect]
+    
+    def evaluate_many(self, items: Mapping[int, Mapping[str, str]]) -> Dict[int, List[Finding]]:
+        """Findings of many items, by key"""
+        return {key: self.findings(names) for key, names in self.satisfied_many(items).items()}
+    
+    def satisfied_many(self, items: Mapping[int, Mapping[str, str]]) -> Dict[int, Set[str]]:
+        """Satisfied rule names of many items, by key"""
+        return {key: self.satisfied(fields) for key, fields in items.items()}
+    
+    def evaluate_mirror(self, mirror, ids: List[int], recheck: bool = False) -> Dict[int, List[Finding]]:
+        """Findings for mirrored work items; see satisfied_mirror"""
+        return {work_item_id: self.findings(names)
+                for work_item_id, names in self.satisfied_mirror(mirror, ids, recheck).items()}
+    
+    def satisfied_mirror(self, mirror, ids: List[int], recheck: bool = False) -> Dict[int, FrozenSet[str]]:
+        """Satisfied rule names of mirrored work items, cached in the mirror.
+        
+        Results are stored per (ID, System.Rev, version), so only items whose
+        revision moved since the last run with this rule set are read and
+        evaluated; `recheck` evaluates every item. IDs missing from the mirror
+        are omitted.
+        """
+        version = self.version
+        revisions = mirror.revisions(list(dict.fromkeys(ids)))
+        cached = {} if recheck else mirror.verification_results(version, list(revisions))
+        
+        results: Dict[int, FrozenSet[str]] = {}
+        decoded: Dict[str, FrozenSet[str]] = {}
+        stale = []
+        for work_item_id, rev in revisions.items():
+            stored_rev, result = cached.get(work_item_id, (None, None))
+            if stored_rev != rev:
+                stale.append(work_item_id)
+                continue
+            if result not in decoded:
+                decoded[result] = frozenset(json.loads(result))
+            results[work_item_id] = decoded[result]
+        
+        if stale:
+            work_items = mirror.get_work_items_bulk(stale, fields=list(WORK_ITEM_FIELDS.values()))
+            fresh = self.satisfied_many(
+                {work_item_id: story_fields(work_item) for work_item_id, work_item in work_items.items()}
+            )
+            mirror.save_verification_results(version, [
+                (work_item_id, work_items[work_item_id].rev, json.dumps(sorted(names)))
+                for work_item_id, names in fresh.items()
+            ])
+            results.update((work_item_id, frozenset(names)) for work_item_id, names in fresh.items())
+        return results
+    
+    @staticmethod
+    def split(findings: List[Finding]) -> Tuple[List[str], List[str]]:
+        """(issues, warnings) as messages, with grouped findings joined into one line per group"""
+        lines = {'issue': [], 'warning': []}
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for finding in findings:
+            if not finding.group:
+                lines[finding.severity].append(finding.message)
+                continue
+            key = (finding.severity, finding.group)
+            if key not in groups:
+                groups[key] = []
+                lines[finding.severity].append(key)
+            groups[key].append(finding.message)
+        
+        def render(line):
+            return f"{line[1]}: {', '.join(groups[line])}" if isinstance(line, tuple) else line
+        return [render(line) for line in lines['issue']], [render(line) for line in lines['warning']]
+    
+    def _compiled(self) -> Tuple[Dict[str, List[Tuple[str, str]]], Dict[str, List[Tuple[str, re.Pattern]]], List[Rule]]:
+        """(name, pattern) of the literal and regex rules by field, the rules computed directly, and each rule's finding"""
+        if self._literals is None:
+            self._literals, self._patterns = {}, {}
+            for rule in self.rules:
+                for field_name in rule.fields if rule.kind in ('literal', 'regex') else ():
+                    if rule.kind == 'literal':
+                        self._literals.setdefault(field_name, []).append((rule.name, rule.pattern))
+                    else:
+                        pattern = re.compile(rule.pattern, re.IGNORECASE if rule.ignore_case else 0)
+                        self._patterns.setdefault(field_name, []).append((rule.name, pattern))
+            self._computed_rules = [rule for rule in self.rules if rule.kind in ('min_length', 'custom')]
+            self._findings = [
+                (rule.name, rule.expect, Finding(rule.name, rule.severity, rule.message, rule.group))
+                for rule in self.rules
+            ]
+        return self._literals, self._patterns, self._computed_rules
+
+
+def _criteria_without_list(text: str) -> bool:
+    """Substantial acceptance criteria with no HTML list"""
+    return len(text) > 100 and '<ul>' not in text and '<li>' not in text
+
+
+CORRUPTION_INDICATORS = [
+    "## Implementation Phases",
+    "### Phase 1 (Sprint",
+    "## Success Criteria",
+    "### Technical Metrics",
+    "### Business Metrics",
+    "## Risk Mitigation",
+]
+USER_STORY_ELEMENTS = ['As a', 'I want', 'So that']
+
+# verify_all_stories
+STORY_CONTENT_RULES = [
+    Rule('description_length', ('description',), kind='min_length', length=50, expect=True,
+         message="Description too short or missing"),
+    Rule('criteria_length', ('acceptance_criteria',), kind='min_length', length=30, expect=True,
+         message="Acceptance criteria missing or too short"),
+    *[Rule(f'corruption:{indicator}', ('description', 'acceptance_criteria'), pattern=indicator,
+           message=f"Potential corruption detected: contains '{indicator}'") for indicator in CORRUPTION_INDICATORS],
+    Rule('criteria_not_html', ('acceptance_criteria',), kind='custom', check=_criteria_without_list,
+         severity='warning', message="Acceptance criteria may not be properly HTML formatted"),
+    *[Rule(f'element:{element}', ('description',), pattern=f'<strong>{element}', expect=True,
+           message=element, group="Missing user story elements") for element in USER_STORY_ELEMENTS],
+    Rule('technical_notes', ('description',), pattern='Technical Notes', expect=True, severity='warning',
+         message="Technical Notes section may be missing"),
+    Rule('dependencies', ('description',), pattern='Dependencies', expect=True, severity='warning',
+         message="Dependencies section may be missing"),
+]
+
+# final_comprehensive_verification
+STRICT_CORRUPTION_INDICATORS = CORRUPTION_INDICATORS + [
+    "### Assumptions",
+    "## Acceptance Criteria",  # Belongs in the Acceptance Criteria field, not the Description
+]
+CORRUPTION_RULES = [
+    *[Rule(f'description_corruption:{indicator}', ('description',), pattern=indicator,
+           message=f"CORRUPTION: '{indicator}' found in Description") for indicator in STRICT_CORRUPTION_INDICATORS],
+    *[Rule(f'criteria_corruption:{indicator}', ('acceptance_criteria',), pattern=indicator,
+           message=f"CORRUPTION: '{indicator}' found in Acceptance Criteria") for indicator in STRICT_CORRUPTION_INDICATORS],
+    *[Rule(f'element:{element}', ('description',), pattern=f'<strong>{element}', expect=True,
+           message=element, group="MISSING: User story elements") for element in USER_STORY_ELEMENTS],
+    Rule('description_length', ('description',), kind='min_length', length=50, expect=True,
+         message="MISSING: Description too short or empty"),
+    Rule('criteria_length', ('acceptance_criteria',), kind='min_length', length=30, expect=True,
+         message="MISSING: Acceptance criteria too short or empty"),
+    Rule('dependencies', ('description',), pattern='Dependencies', expect=True, severity='warning',
+         message="Dependencies section missing"),
+    Rule('technical_notes', ('description',), pattern='Technical Notes', expect=True, severity='warning',
+         message="Technical Notes section missing"),
+]
+
+# verify_user_story_format: rules are read as checks through RuleSet.satisfied
+FORMAT_RULES = [
+    *[Rule(name, ('description',), pattern=pattern, expect=True) for name, pattern in [
+        ('as_a', 'As a'), ('i_want', 'I want'), ('so_that', 'So that'), ('user_story_section', 'User Story'),
+        ('system_workflow', 'System Workflow'), ('language_mermaid', 'language-mermaid'),
+        ('technical_section', 'Technical Implementation'), ('h2', '<h2>'), ('div', '<div'),
+    ]],
+    *[Rule(name, ('acceptance_criteria',), pattern=pattern, expect=True) for name, pattern in [
+        ('given', 'Given'), ('when', 'When'), ('then', 'Then'), ('definition_of_done', 'Definition of Done'),
+    ]],
+    Rule('criteria_length', ('acceptance_criteria',), kind='min_length', length=101, expect=True),
+]
+
+# verify_mermaid_update: numbered labels that break Azure DevOps Mermaid rendering
+MERMAID_RULES = [
+    Rule('rule_number', ('mermaid',), kind='regex', pattern=r'Rule \d+:', message="Rule [number]:",
+         group="Numeric patterns found in Mermaid"),
+    Rule('cal_number', ('mermaid',), kind='regex', pattern=r'Cal \d+:', message="Cal [number]:",
+         group="Numeric patterns found in Mermaid"),
+    Rule('status_number', ('mermaid',), kind='regex', pattern=r'Status: \d+', message="Status: [number]",
+         group="Numeric patterns found in Mermaid"),
+    Rule('subgraph_number', ('mermaid',), kind='regex', pattern=r'subGraph\d+', message="subGraph[number]",
+         group="Numeric patterns found in Mermaid"),
+]
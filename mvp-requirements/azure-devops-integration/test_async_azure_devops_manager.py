@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Tests for AsyncAzureDevOpsManager's $batch error reporting
+Requests are answered by a replaced _send_once, so nothing leaves the process.
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from async_azure_devops_manager import AsyncAzureDevOpsManager
+from azure_devops_manager import RetryPolicy
+
+BATCH_URL = 'https://dev.azure.com/example/_apis/wit/$batch'
+
+
+@pytest.mark.parametrize('status_code, requests', [(400, 1), (503, 3)])
+def test_failed_batch_request_keeps_its_status(monkeypatch, status_code, requests):
+    manager = AsyncAzureDevOpsManager('https://dev.azure.com/example', 'pat', 'Project',
+                                      retry_policy=RetryPolicy(max_attempts=3, base_delay=0))
+    sent = []
+    
+    async def send_once(*args):
+        sent.append(args)
+        request_info = aiohttp.RequestInfo(URL(BATCH_URL), 'POST', CIMultiDictProxy(CIMultiDict()), URL(BATCH_URL))
+        raise aiohttp.ClientResponseError(request_info, (), status=status_code, message="batch failed")
+    
+    monkeypatch.setattr(manager, '_send_once', send_once)
+    
+    results = asyncio.run(manager._send_batch([(1, []), (2, [])]))
+    
+    assert len(sent) == requests
+    assert {result.status_code for result in results.values()} == {status_code}
+    assert not any(result.success for result in results.values())
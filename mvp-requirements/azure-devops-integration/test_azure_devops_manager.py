@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Tests for the retry status mapping of AzureDevOpsManager's SDK clients
+The HTTP transport below the rate-limit adapter is replaced by canned responses,
+or requests go through urllib3 to a stub server on localhost.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+from azure.devops.client import Client
+from azure.devops._models import ApiResourceLocation
+from azure.devops.v7_0.work_item_tracking.work_item_tracking_client import WorkItemTrackingClient
+from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
+from azure.devops.v7_1.work_item_tracking.work_item_tracking_client import WorkItemTrackingClient as WorkItemTrackingClientV7_1
+from msrest.authentication import BasicAuthentication
+from requests.adapters import HTTPAdapter
+
+from azure_devops_manager import AzureDevOpsManager, DocumentIndex, GovernedHTTPAdapter, RateLimitGovernor, RetryPolicy
+
+ORG_URL = 'https://dev.azure.com/example'
+WORK_ITEMS_LOCATION = '72c7ddf8-2cdc-4f60-90cd-ab71c14a399b'
+WORK_ITEM_TRACKING_CLIENT = WorkItemTrackingClient.__module__ + "." + WorkItemTrackingClient.__name__  # connection.clients serves 7.0
+
+
+def make_response(request, status_code, body, content_type='application/json; charset=utf-8'):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers['Content-Type'] = content_type
+    response.headers['Retry-After'] = '0'
+    response._content = body.encode('utf-8')
+    response.request = request
+    response.url = request.url
+    return response
+
+
+def service_error(message):
+    """Error body the service sends with throttling and server errors"""
+    return json.dumps({
+        '$id': '1', 'innerException': None, 'message': message, 'typeName': 'Microsoft.VisualStudio.Services.WebApi.VssServiceException',
+        'typeKey': 'VssServiceException', 'errorCode': 0, 'eventId': 3000
+    })
+
+
+def make_manager(monkeypatch, org_url=ORG_URL):
+    """Manager whose work item client is wired as usual, without resource area discovery"""
+    governor = RateLimitGovernor(rate=1000, burst=1000, min_rate=1000)  # Pacing is not under test
+    manager = AzureDevOpsManager(org_url, 'pat', 'Project', governor=governor, retry_policy=RetryPolicy(base_delay=0))
+    client = WorkItemTrackingClient(org_url, BasicAuthentication('', 'pat'))
+    monkeypatch.setitem(Client._locations_cache, client.normalized_url, [ApiResourceLocation(
+        id=WORK_ITEMS_LOCATION, area='wit', resource_name='workItems',
+        route_template='{project}/_apis/{area}/{resource}/{id}', resource_version=3,
+        min_version=1.0, max_version=7.1, released_version='7.0'
+    )])
+    manager.connection._client_cache[WORK_ITEM_TRACKING_CLIENT] = client
+    return manager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Manager that never leaves the process; tests answer its requests with serve()"""
+    manager = make_manager(monkeypatch)
+    yield manager
+    manager.close()
+
+
+class StubServer(ThreadingHTTPServer):
+    """Local server answering every request with one status and a service error body"""
+    
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.requests = 0
+        super().__init__(('127.0.0.1', 0), StubHandler)
+    
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/example"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.server.requests += 1
+        body = service_error("Service unavailable").encode('utf-8')
+        self.send_response(self.server.status_code)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Retry-After', '0')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Start a StubServer for a status with stub_server(status_code)"""
+    servers = []
+    
+    def start(status_code):
+        server = StubServer(status_code)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return server
+    
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def serve(monkeypatch, responses):
+    """Answer requests with (status, body, content type) tuples in order and return the sent requests"""
+    sent = []
+    
+    def send(adapter, request, **kwargs):
+        sent.append(request)
+        status_code, body, content_type = responses[min(len(sent), len(responses)) - 1]
+        return make_response(request, status_code, body, content_type)
+    
+    monkeypatch.setattr(HTTPAdapter, 'send', send)
+    return sent
+
+
+def test_json_bodied_429_is_retried(manager, monkeypatch):
+    sent = serve(monkeypatch, [
+        (429, service_error("Request was blocked due to exceeding usage of resource."), 'application/json'),
+        (200, json.dumps({'id': 1, 'rev': 3, 'fields': {'System.Title': 'Story'}}), 'application/json'),
+    ])
+    
+    work_item = manager.wit_client.get_work_item(1, project='Project')
+    
+    assert work_item.rev == 3
+    assert len(sent) == 2
+    assert manager.retry_policy.retry_counts['get_work_item'] == 1
+
+
+@pytest.mark.parametrize('content_type', ['application/json', 'text/plain'])
+def test_503_retried_until_attempts_run_out(manager, monkeypatch, content_type):
+    body = service_error("Service unavailable") if content_type == 'application/json' else "Service unavailable"
+    sent = serve(monkeypatch, [(503, body, content_type)])
+    
+    with pytest.raises(Exception):
+        manager.wit_client.get_work_item(1, project='Project')
+    
+    assert len(sent) == manager.retry_policy.max_attempts
+    assert manager.retry_policy.failure_counts['get_work_item'] == 1
+
+
+def test_json_bodied_404_fails_immediately(manager, monkeypatch):
+    sent = serve(monkeypatch, [(404, service_error("TF401232: Work item 1 does not exist."), 'application/json')])
+    
+    with pytest.raises(Exception) as raised:
+        manager.wit_client.get_work_item(1, project='Project')
+    
+    assert len(sent) == 1
+    assert RetryPolicy.status_code(raised.value) == 404
+
+
+def test_non_idempotent_call_retried_only_on_429(manager, monkeypatch):
+    sent = serve(monkeypatch, [(503, service_error("Service unavailable"), 'application/json')])
+    
+    with pytest.raises(Exception):
+        manager.wit_client.create_work_item([], project='Project', type='User Story')
+    
+    assert len(sent) == 1
+
+
+def test_status_code_sources():
+    class StatusError(Exception):
+        status = 502
+    
+    assert RetryPolicy.status_code(StatusError()) == 502
+    assert RetryPolicy.status_code(Exception("Operation returned a 429 status code.")) == 429
+    assert RetryPolicy.status_code(Exception("TF401232: does not exist")) is None
+
+
+def test_last_status_is_kept_per_thread(manager, monkeypatch):
+    serve(monkeypatch, [(503, "Service unavailable", 'text/plain')])
+    GovernedHTTPAdapter.clear_last_status()
+    
+    thread = threading.Thread(target=manager.session.get, args=(ORG_URL,))
+    thread.start()
+    thread.join()
+    assert GovernedHTTPAdapter.last_status() is None
+    
+    manager.session.get(ORG_URL)
+    assert GovernedHTTPAdapter.last_status() == 503
+
+
+class LostResponseStore:
+    """Work items held in memory whose first writes are applied but answered with a 503"""
+    
+    def __init__(self, lost_responses=1):
+        self.descriptions = {}
+        self.revisions = {}
+        self.lost_responses = lost_responses
+        self.writes = 0
+        self.requests = 0
+    
+    def get_work_items_bulk(self, ids, fields=None):
+        return {work_item_id: SimpleNamespace(id=work_item_id, rev=self.revisions[work_item_id],
+                                              fields={'System.Description': self.descriptions[work_item_id]})
+                for work_item_id in ids}
+    
+    def apply(self, work_item_id, document):
+        """Apply a patch document; a test /rev mismatch returns 412 like the service"""
+        test, *operations = [operation.serialize() if hasattr(operation, 'serialize') else operation for operation in document]
+        if test['value'] != self.revisions[work_item_id]:
+            return 412
+        self.descriptions[work_item_id] = operations[0]['value']
+        self.revisions[work_item_id] += 1
+        self.writes += 1
+        return 200
+    
+    def patch_work_item(self, work_item_id, document):
+        self.requests += 1
+        status_code = self.apply(work_item_id, document)
+        if self.lost_responses:
+            self.lost_responses -= 1
+            raise requests.HTTPError("503 Server Error", response=SimpleNamespace(status_code=503))
+        return status_code
+    
+    def post_batch(self, chunk):
+        self.requests += 1
+        responses = [{'code': self.apply(work_item_id, operations)} for work_item_id, operations in chunk]
+        if self.lost_responses:
+            self.lost_responses -= 1
+            raise requests.HTTPError("503 Server Error", response=SimpleNamespace(status_code=503))
+        return responses
+
+
+def append_note(work_item):
+    description = work_item.fields['System.Description']
+    if 'note' in description:
+        return None
+    return [JsonPatchOperation(op='replace', path='/fields/System.Description', value=description + ' note')]
+
+
+def test_conditional_write_with_lost_response_is_not_applied_twice(manager, monkeypatch):
+    store = LostResponseStore()
+    store.descriptions[1], store.revisions[1] = 'story', 7
+    monkeypatch.setattr(manager, 'get_work_items_bulk', store.get_work_items_bulk)
+    monkeypatch.setattr(manager, '_patch_work_item', store.patch_work_item)
+    
+    assert manager.update_work_item_conditional(1, append_note)
+    
+    assert store.descriptions[1] == 'story note'
+    assert store.writes == 1
+    assert store.requests == 1  # Re-read instead of re-sent
+    assert manager.retry_policy.retry_counts['unconfirmed write'] == 1
+
+
+def test_conditional_batch_with_lost_response_is_not_applied_twice(manager, monkeypatch):
+    store = LostResponseStore()
+    for work_item_id in (1, 2):
+        store.descriptions[work_item_id], store.revisions[work_item_id] = 'story', 3
+    monkeypatch.setattr(manager, 'get_work_items_bulk', store.get_work_items_bulk)
+    monkeypatch.setattr(manager, '_post_batch', store.post_batch)
+    
+    results = manager.update_work_items_conditional({1: None, 2: None}, append_note)
+    
+    assert all(result.success for result in results.values())
+    assert store.descriptions == {1: 'story note', 2: 'story note'}
+    assert store.writes == 2
+    assert store.requests == 1
+
+
+def test_batch_delete_with_lost_response_is_confirmed_not_re_sent(manager, monkeypatch):
+    existing = {1, 2, 3}
+    sent = []
+    
+    def delete_work_items(request, project=None):
+        sent.append(list(request.ids))
+        existing.difference_update(request.ids[:2])  # Two items are deleted, then the response is lost
+        raise requests.HTTPError("503 Server Error", response=SimpleNamespace(status_code=503))
+    
+    client = WorkItemTrackingClientV7_1(ORG_URL, BasicAuthentication('', 'pat'))  # Batch delete is only in 7.1
+    monkeypatch.setattr(client, 'delete_work_items', delete_work_items)
+    manager.connection._client_cache[WorkItemTrackingClientV7_1.__module__ + "." + WorkItemTrackingClientV7_1.__name__] = client
+    monkeypatch.setattr(manager, 'get_work_items_bulk', lambda ids, fields=None: {
+        work_item_id: SimpleNamespace(id=work_item_id) for work_item_id in ids if work_item_id in existing
+    })
+    
+    results = manager.delete_work_items([1, 2, 3])
+    
+    assert sent == [[1, 2, 3]]
+    assert [results[work_item_id].success for work_item_id in (1, 2, 3)] == [True, True, False]
+    assert results[3].status_code == 503
+
+
+def test_5xx_over_the_wire_reaches_retry_policy(monkeypatch, stub_server):
+    server = stub_server(503)
+    with make_manager(monkeypatch, server.url) as manager:
+        with pytest.raises(Exception) as raised:
+            manager.wit_client.get_work_item(1, project='Project')
+        
+        assert server.requests == manager.retry_policy.max_attempts
+        assert manager.retry_policy.retry_counts['get_work_item'] == manager.retry_policy.max_attempts - 1
+        assert RetryPolicy.status_code(raised.value) == 503
+
+
+def test_session_returns_5xx_after_an_sdk_client_is_created(monkeypatch, stub_server):
+    server = stub_server(500)
+    with make_manager(monkeypatch, server.url) as manager:
+        manager.wit_client  # Installs the SDK sender on the shared session
+        
+        response = manager.session.get(server.url)
+        
+        assert response.status_code == 500
+        assert GovernedHTTPAdapter.last_status() == 500
+        assert server.requests == 1
+
+
+def test_index_held_across_a_file_change_stays_readable(tmp_path):
+    path = tmp_path / "UC-001.md"
+    path.write_text("# Story\n## Process Steps\n1. Scan\n")
+    first = DocumentIndex.open(path)
+    
+    path.write_text("# Story\n## Process Steps\n1. Scan\n2. Pack\n")
+    second = DocumentIndex.open(path)
+    
+    assert second is not first
+    assert second.section_text('Process Steps') == "1. Scan\n2. Pack"
+    assert first.section_text('Process Steps') == "1. Scan"
+    assert DocumentIndex.open(path) is second
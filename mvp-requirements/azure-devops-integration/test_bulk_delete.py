@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for BulkDeleter's manifests and restores
+A stub manager keeps work items in memory and deletes them in batches of two.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+import bulk_delete
+from azure_devops_manager import BatchItemResult
+from bulk_delete import MANIFEST_DIR, BulkDeleter
+
+
+class StubManager:
+    """Work items in memory; items in `fail` cannot be deleted or restored"""
+    
+    project_name = 'Project'
+    
+    def __init__(self, config_dir, ids, fail=()):
+        self.config_dir = config_dir
+        self.work_items = {work_item_id: {'System.WorkItemType': 'User Story', 'System.Title': f"Story {work_item_id}",
+                                          'System.State': 'New'} for work_item_id in ids}
+        self.recycle_bin = {}
+        self.fail = set(fail)
+        self.manifests_seen = []  # Manifest statuses before each batch was sent
+    
+    def query_ids(self, conditions):
+        return [work_item_id for work_item_id in self.work_items if conditions == 'all']
+    
+    def get_work_items_bulk(self, ids, fields=None):
+        return {work_item_id: SimpleNamespace(id=work_item_id, fields=self.work_items[work_item_id])
+                for work_item_id in ids if work_item_id in self.work_items}
+    
+    def delete_work_items(self, ids, destroy=False, on_batch=None):
+        results = {}
+        for start in range(0, len(ids), 2):
+            self.manifests_seen.append(self.manifest_statuses())
+            batch = {}
+            for work_item_id in ids[start:start + 2]:
+                if work_item_id in self.fail:
+                    batch[work_item_id] = BatchItemResult(work_item_id, False, 403, "access denied")
+                    continue
+                fields = self.work_items.pop(work_item_id)
+                if not destroy:
+                    self.recycle_bin[work_item_id] = fields
+                batch[work_item_id] = BatchItemResult(work_item_id, True, 200)
+            results.update(batch)
+            if on_batch:
+                on_batch(batch)
+        return results
+    
+    def restore_work_items(self, ids):
+        results = {}
+        for work_item_id in ids:
+            if work_item_id in self.recycle_bin:
+                self.work_items[work_item_id] = self.recycle_bin.pop(work_item_id)
+                results[work_item_id] = BatchItemResult(work_item_id, True, 200)
+            else:
+                results[work_item_id] = BatchItemResult(work_item_id, False, 404, "not in the Recycle Bin")
+        return results
+    
+    def manifest_statuses(self):
+        return {path.name: {entry['id']: entry['status'] for entry in json.loads(path.read_text())['items']}
+                for path in sorted((self.config_dir / MANIFEST_DIR).glob('deletion-*.json'))}
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return StubManager(tmp_path, [1, 2, 3, 4, 5])
+
+
+def statuses(manifest_path):
+    return {entry['id']: entry['status'] for entry in BulkDeleter.load_manifest(manifest_path)['items']}
+
+
+def test_plan_leaves_protected_and_missing_items_alone(manager, tmp_path):
+    plan = BulkDeleter(manager, tmp_path, protected_ids=[2]).plan(ids=[1, 2, 9], conditions='all')
+    
+    assert list(plan.work_items) == [1, 3, 4, 5]
+    assert plan.protected == [2]
+    assert plan.missing == [9]
+    assert plan.work_items[1]['System.Title'] == "Story 1"
+
+
+def test_manifest_is_written_before_the_first_batch_and_after_each(manager, tmp_path):
+    deleter = BulkDeleter(manager, tmp_path)
+    
+    manifest_path, results = deleter.delete(deleter.plan(ids=[1, 2, 3]))
+    
+    name = manifest_path.name
+    assert [seen[name] for seen in manager.manifests_seen] == [
+        {1: 'pending', 2: 'pending', 3: 'pending'},
+        {1: 'deleted', 2: 'deleted', 3: 'pending'},
+    ]
+    assert statuses(manifest_path) == {1: 'deleted', 2: 'deleted', 3: 'deleted'}
+    assert all(result.success for result in results.values())
+
+
+def test_delete_and_restore_round_trip(tmp_path):
+    manager = StubManager(tmp_path, [1, 2, 3, 4, 5], fail=[4])
+    deleter = BulkDeleter(manager, tmp_path)
+    manifest_path, _ = deleter.delete(deleter.plan(conditions='all'))
+    
+    manifest = BulkDeleter.load_manifest(manifest_path)
+    assert manifest['project'] == 'Project' and manifest['destroy'] is False
+    assert statuses(manifest_path) == {1: 'deleted', 2: 'deleted', 3: 'deleted', 4: 'failed', 5: 'deleted'}
+    assert manifest['items'][3]['error'] == "access denied"
+    
+    results = deleter.restore(manifest_path, ids=[1, 2])
+    assert set(results) == {1, 2}
+    assert statuses(manifest_path) == {1: 'restored', 2: 'restored', 3: 'deleted', 4: 'failed', 5: 'deleted'}
+    
+    results = deleter.restore(manifest_path)
+    assert set(results) == {3, 5}  # Failed and already restored items are skipped
+    assert sorted(manager.work_items) == [1, 2, 3, 4, 5]
+    assert deleter.restore(manifest_path) == {}
+
+
+def test_restore_tries_items_an_interrupted_run_left_pending(manager, tmp_path):
+    deleter = BulkDeleter(manager, tmp_path)
+    manifest_path, _ = deleter.delete(deleter.plan(ids=[1, 2]))
+    manifest = BulkDeleter.load_manifest(manifest_path)
+    manifest['items'][1]['status'] = 'pending'  # Deleted, but the run stopped before recording it
+    manifest['items'].append({'id': 3, 'type': 'User Story', 'title': "Story 3", 'state': 'New',
+                              'status': 'pending', 'error': ''})  # Never sent
+    BulkDeleter.save_manifest(manifest_path, manifest)
+    
+    results = deleter.restore(manifest_path)
+    
+    assert {work_item_id: result.success for work_item_id, result in results.items()} == {1: True, 2: True, 3: False}
+    assert statuses(manifest_path) == {1: 'restored', 2: 'restored', 3: 'pending'}
+
+
+def test_destroyed_items_cannot_be_restored(manager, tmp_path):
+    deleter = BulkDeleter(manager, tmp_path)
+    manifest_path, _ = deleter.delete(deleter.plan(ids=[1]), destroy=True)
+    
+    with pytest.raises(ValueError):
+        deleter.restore(manifest_path)
+
+
+def test_runs_in_the_same_instant_get_separate_manifests(manager, tmp_path, monkeypatch):
+    instant = datetime(2026, 10, 16, 9, 30, tzinfo=timezone.utc)
+    clock = iter([instant, instant, instant, instant + timedelta(microseconds=1), instant])
+    monkeypatch.setattr(bulk_delete, 'datetime', SimpleNamespace(now=lambda tz=None: next(clock)))
+    deleter = BulkDeleter(manager, tmp_path)
+    
+    first_path, _ = deleter.delete(deleter.plan(ids=[1]))
+    second_path, _ = deleter.delete(deleter.plan(ids=[2]))
+    
+    assert first_path.name == "deletion-20261016-093000-000000.json"
+    assert second_path.name == "deletion-20261016-093000-000001.json"
+    assert statuses(first_path) == {1: 'deleted'}
+    assert statuses(second_path) == {2: 'deleted'}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the Mermaid flowchart linter
+"""
+
+import pytest
+
+from mermaid_lint import FlowchartParser, lint_mermaid
+
+
+def messages(source):
+    return [str(issue) for issue in lint_mermaid(source)]
+
+
+def test_linked_nodes_need_no_declaration():
+    chart = FlowchartParser.parse("flowchart TD\n    A --> B\n    B --> C & D")
+    
+    assert chart.issues == []
+    assert list(chart.nodes) == ['A', 'B', 'C', 'D']
+    assert all(node.shape == 'bare' for node in chart.nodes.values())
+
+
+def test_linked_node_can_be_given_a_shape_later():
+    chart = FlowchartParser.parse("flowchart TD\n    A --> B\n    B{Valid?}")
+    
+    assert chart.issues == []
+    assert chart.nodes['B'].shape == 'rhombus'
+
+
+@pytest.mark.parametrize('source', [
+    "flowchart LR\n    order-api --> db",
+    "flowchart LR\n    order-api[Order API] -->|writes| order-db[(Orders)]",
+    "flowchart LR\n    A-->B\n    A-.->C\n    B---D",
+])
+def test_hyphens_inside_node_ids(source):
+    assert messages(source) == []
+
+
+def test_hyphenated_id_is_one_node():
+    chart = FlowchartParser.parse("flowchart LR\n    order-api --> db")
+    
+    assert list(chart.nodes) == ['order-api', 'db']
+    assert [(edge.source, edge.target) for edge in chart.edges] == [('order-api', 'db')]
+
+
+def test_linked_nodes_belong_to_their_subgraph():
+    chart = FlowchartParser.parse("flowchart TD\n    subgraph checkout\n    A --> B\n    end\n    C --> checkout")
+    
+    assert chart.issues == []
+    assert chart.subgraphs['checkout'].nodes == ['A', 'B']
+    assert 'checkout' not in chart.nodes
+
+
+@pytest.mark.parametrize('source, expected', [
+    ("flowchart TD\n    A --> B\n    style C fill:#f96", "line 3: undefined node 'C'"),
+    ("flowchart TD\n    A[One] --> B\n    A[Two]", "line 3: duplicate node ID 'A' (first defined on line 2)"),
+    ("flowchart TD\n    subgraph s1\n    A --> B", "line 2: subgraph 's1' is never closed with 'end'"),
+    ("flowchart TD\n    A --> B\n    end", "line 3: 'end' without a matching 'subgraph'"),
+    ("flowchart TD\n    A[Pay (card)] --> B", "line 2: unquoted label contains ( ); wrap the label in double quotes"),
+    ("flowchart TD\n    A --> end", "line 2: 'end' is a reserved word and cannot be a node ID"),
+    ("flowchart TD\n    A --> B\n    linkStyle 1 stroke:red", "line 3: linkStyle 1 refers to a missing link (1 defined)"),
+    ("flowchart XY\n    A --> B", "line 1: unknown direction 'XY'"),
+])
+def test_errors_are_reported_with_their_line(source, expected):
+    assert messages(source) == [expected]
+
+
+def test_other_diagram_types_are_skipped():
+    assert messages("sequenceDiagram\n    Alice->>Bob: Hello") == []
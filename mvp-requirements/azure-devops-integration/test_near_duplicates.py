@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for near-duplicate grouping
+Signatures are set by hand, so which items share a band and how similar they
+are is known exactly.
+"""
+
+from near_duplicates import NearDuplicateIndex
+
+
+def components(keys, pairs):
+    """Connected components of pairs with more than one member, as sets"""
+    parent = {key: key for key in keys}
+    
+    def root(key):
+        while parent[key] != key:
+            key = parent[key]
+        return key
+    
+    for first, second, _ in pairs:
+        parent[root(second)] = root(first)
+    groups = {}
+    for key in keys:
+        groups.setdefault(root(key), set()).add(key)
+    return sorted((group for group in groups.values() if len(group) > 1), key=len, reverse=True)
+
+
+def signature_index(signatures, threshold=0.5):
+    """Index of 10-slot signatures (5 bands of 2 rows) given as strings, one character per slot"""
+    index = NearDuplicateIndex(threshold=threshold, num_perm=10)
+    index.bands, index.rows = 5, 2
+    index._buckets = [{} for _ in range(index.bands)]
+    for key, signature in signatures.items():
+        index.add_signature(key, tuple(signature))
+    return index
+
+
+def test_member_similar_only_to_a_later_member_is_grouped():
+    # All three share only the first band; c matches b but not a, the first member of that bucket
+    index = signature_index({
+        'a': 'xxadadadad',
+        'b': 'xxabababab',
+        'c': 'xxcbcbcbcb',
+    }, threshold=0.6)
+    
+    assert index.similarity('a', 'c') < index.threshold <= index.similarity('b', 'c')
+    assert [set(group) for group in index.groups()] == [{'a', 'b', 'c'}]
+
+
+def test_groups_are_the_components_of_similar_pairs():
+    index = signature_index({
+        'a1': 'aabbccddee', 'a2': 'aabbccddff', 'a3': 'gghhccddff',  # a1 - a3 only through a2
+        'b1': 'hhiijjkkll', 'b2': 'hhiijjmmnn',
+        'solo': 'hhoopppqqr',  # shares a band with b1 and b2 but is too different
+        'c1': 'sstt' + 'uuvvww', 'c2': 'sstt' + 'uuvvxx', 'c3': 'yytt' + 'uuvvxx', 'c4': 'yyzz' + 'uuvvxx',
+    })
+    
+    expected = components(index.signatures, index.similar_pairs())
+    assert [set(group) for group in index.groups()] == expected
+    assert {'a1', 'a2', 'a3'} in expected and not any('solo' in group for group in expected)
+
+
+def test_groups_largest_first_and_singletons_left_out():
+    index = signature_index({
+        'x1': 'aabbccddee', 'x2': 'aabbccddee', 'x3': 'aabbccddee',
+        'y1': 'ffgghhiijj', 'y2': 'ffgghhiijj',
+        'z': 'kkllmmnnoo',
+    })
+    
+    assert [set(group) for group in index.groups()] == [{'x1', 'x2', 'x3'}, {'y1', 'y2'}]
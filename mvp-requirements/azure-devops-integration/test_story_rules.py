@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the story rule engine
+Results are compared with one plain substring or length check per rule.
+"""
+
+import re
+
+import pytest
+
+from story_rules import CORRUPTION_RULES, FORMAT_RULES, MERMAID_RULES, STORY_CONTENT_RULES, Rule, RuleSet
+
+
+def satisfied_one_by_one(rules, fields):
+    """Names of satisfied rules, checking each rule on its own"""
+    names = set()
+    for rule in rules:
+        texts = [fields.get(name) or '' for name in rule.fields]
+        if rule.kind == 'literal':
+            holds = any(rule.pattern in text for text in texts)
+        elif rule.kind == 'regex':
+            holds = any(re.search(rule.pattern, text, re.I if rule.ignore_case else 0) for text in texts)
+        elif rule.kind == 'min_length':
+            holds = any(len(text.strip()) >= rule.length for text in texts)
+        else:
+            holds = any(rule.check(text) for text in texts)
+        if holds:
+            names.add(rule.name)
+    return names
+
+
+SAMPLES = [
+    {},
+    {'description': '<strong>As a</strong> buyer <strong>I want</strong> Dependencies Technical Notes ' * 3},
+    {'description': 'Overview\n## Risk Mitigation\n### Assumptions', 'acceptance_criteria': '### Phase 1 (Sprint 2)'},
+    {'description': '## Other heading only', 'acceptance_criteria': 'Given a cart When I pay Then it is paid' * 4},
+    {'description': 'As a user I want <h2>User Story</h2><div>', 'acceptance_criteria': '<ul><li>Definition of Done'},
+    {'mermaid': 'A[Rule 1: check] --> B[Status: 2]\nsubGraph3'},
+]
+
+
+@pytest.mark.parametrize('rules', [STORY_CONTENT_RULES, CORRUPTION_RULES, FORMAT_RULES, MERMAID_RULES])
+@pytest.mark.parametrize('fields', SAMPLES)
+def test_satisfied_matches_one_check_per_rule(rules, fields):
+    assert RuleSet(rules).satisfied(fields) == satisfied_one_by_one(rules, fields)
+
+
+def test_overlapping_literals_are_each_found():
+    rules = RuleSet([
+        Rule('heading', ('description',), pattern='## Risk'),
+        Rule('subheading', ('description',), pattern='### Risk'),
+        Rule('single', ('description',), pattern='#'),
+    ])
+    
+    assert rules.satisfied({'description': 'x ### Risk'}) == {'heading', 'subheading', 'single'}
+    assert rules.satisfied({'description': 'x # Risk'}) == {'single'}
+
+
+def test_split_returns_fresh_lists():
+    rules = RuleSet(CORRUPTION_RULES)
+    findings = rules.evaluate({'description': 'short'})
+    
+    issues, warnings = RuleSet.split(findings)
+    assert issues[0] == "MISSING: User story elements: As a, I want, So that"
+    assert warnings == ["Dependencies section missing", "Technical Notes section missing"]
+    
+    issues.append("changed")
+    assert RuleSet.split(findings)[0][-1] != "changed"
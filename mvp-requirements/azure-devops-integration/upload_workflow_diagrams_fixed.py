@@ -72,11 +72,8 @@ def upload_attachment_to_azure_devops(manager: AzureDevOpsManager, file_path: st
         # Create a BytesIO stream for the file content
         file_stream = io.BytesIO(file_content)
         
-        # Upload attachment using Azure DevOps REST API
-        attachment_client = manager.connection.clients.get_work_item_tracking_client()
-        
-        # Upload the attachment
-        attachment = attachment_client.create_attachment(
+        # Upload the attachment using the manager's cached client
+        attachment = manager.wit_client.create_attachment(
             upload_stream=file_stream,
             project=manager.project_name,
             file_name=file_name
@@ -89,15 +86,6 @@ def upload_attachment_to_azure_devops(manager: AzureDevOpsManager, file_path: st
         print(f"   ❌ Failed to upload attachment {file_path}: {str(e)}")
         return None
 
-def get_current_description(manager: AzureDevOpsManager, work_item_id: int) -> str:
-    """Get current description of a work item"""
-    try:
-        work_item = manager.wit_client.get_work_item(work_item_id)
-        return work_item.fields.get('System.Description', '')
-    except Exception as e:
-        print(f"   ❌ Failed to get current description for work item {work_item_id}: {str(e)}")
-        return ''
-
 def update_description_with_diagram(manager: AzureDevOpsManager, work_item_id: int, diagram_path: str, story_id: str) -> bool:
     """Update work item description to include workflow diagram"""
     try:
@@ -106,9 +94,6 @@ def update_description_with_diagram(manager: AzureDevOpsManager, work_item_id: i
         if not attachment_url:
             return False
         
-        # Get current description
-        current_description = get_current_description(manager, work_item_id)
-        
         # Add workflow diagram section to description
         diagram_section = f"""
 
@@ -117,19 +102,23 @@ def update_description_with_diagram(manager: AzureDevOpsManager, work_item_id: i
 <img src="{attachment_url}" alt="{story_id} Workflow Diagram" style="max-width: 100%; height: auto;" />
 <p><em>Visual representation of the {story_id} workflow process showing all system interactions and data flow.</em></p>"""
 
-        # Combine current description with diagram section
-        updated_description = current_description + diagram_section
-        
-        # Update the work item
-        updates = [
-            JsonPatchOperation(
-                op="replace",
-                path="/fields/System.Description",
-                value=updated_description
-            )
-        ]
+        def append_diagram(work_item):
+            # Combine current description with diagram section
+            current_description = (work_item.fields or {}).get('System.Description') or ''
+            if attachment_url in current_description:
+                return None  # An earlier attempt was applied although its response was lost
+            return [
+                JsonPatchOperation(
+                    op="replace",
+                    path="/fields/System.Description",
+                    value=current_description + diagram_section
+                )
+            ]
         
-        return manager.update_work_item(work_item_id, updates)
+        # Update the work item only if nobody changed it since we read it
+        return manager.update_work_item_conditional(
+            work_item_id, append_diagram, fields=['System.Description']
+        )
         
     except Exception as e:
         print(f"   ❌ Failed to update description with diagram: {str(e)}")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Work Item Mirror - local SQLite copy of the project's work items
+Read-only commands query the mirror instead of Azure DevOps, so they run offline.
+"""
+
+import json
+import re
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from azure.devops.v7_1.work_item_tracking.models import WorkItem
+
+
+class WorkItemMirror:
+    """SQLite mirror of work item fields, relations and revision numbers.
+    
+    Each row keeps the full work item document next to a few indexed columns,
+    so lookups return the same WorkItem objects the SDK does:
+    
+        with WorkItemMirror.open(config_dir) as mirror:
+            work_items = mirror.get_work_items_bulk(ids, fields=['System.Title'])
+    """
+    
+    DEFAULT_FILE = "work_item_mirror.db"
+    TOKEN_KEY = "revisions_continuation_token"
+    FEED_FIELDS = ['System.Id', 'System.Rev', 'System.IsDeleted']
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS work_items (
+            id INTEGER PRIMARY KEY,
+            rev INTEGER NOT NULL,
+            work_item_type TEXT,
+            state TEXT,
+            title TEXT,
+            changed_date TEXT,
+            document TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS work_items_type_state ON work_items (work_item_type, state);
+        CREATE TABLE IF NOT EXISTS work_item_relations (
+            source_id INTEGER NOT NULL,
+            target_id INTEGER,
+            rel TEXT NOT NULL,
+            url TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS work_item_relations_source ON work_item_relations (source_id);
+        CREATE INDEX IF NOT EXISTS work_item_relations_target ON work_item_relations (target_id);
+        CREATE TABLE IF NOT EXISTS sync_state (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS verification_results (
+            rule_set TEXT NOT NULL,
+            id INTEGER NOT NULL,
+            rev INTEGER NOT NULL,
+            result TEXT NOT NULL,
+            PRIMARY KEY (rule_set, id)
+        );
+    """
+    _WORK_ITEM_URL = re.compile(r'/workItems/(\d+)$', re.IGNORECASE)
+    
+    def __init__(self, path: Path):
+        """Open (and create if needed) the mirror database at `path`"""
+        self.path = Path(path)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(self.SCHEMA)
+    
+    @classmethod
+    def open(cls, config_dir: Path) -> "WorkItemMirror":
+        """Open the mirror kept next to work_item_mapping.json"""
+        return cls(Path(config_dir) / cls.DEFAULT_FILE)
+    
+    def __enter__(self) -> "WorkItemMirror":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def close(self):
+        self.connection.close()
+    
+    @property
+    def last_synced(self) -> Optional[str]:
+        """UTC timestamp of the last completed sync, or None if never synced"""
+        return self.get_state('last_synced')
+    
+    def get_state(self, key: str) -> Optional[str]:
+        row = self.connection.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def set_state(self, key: str, value: Optional[str]):
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+    
+    def count(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM work_items").fetchone()[0]
+    
+    def upsert(self, work_items: Iterable[WorkItem]) -> int:
+        """Insert or replace work items, ignoring any older than the stored revision"""
+        count = 0
+        with self.connection:
+            for work_item in work_items:
+                stored = self.connection.execute("SELECT rev FROM work_items WHERE id = ?", (work_item.id,)).fetchone()
+                if stored and stored[0] > work_item.rev:
+                    continue
+                
+                fields = work_item.fields or {}
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO work_items (id, rev, work_item_type, state, title, changed_date, document) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (work_item.id, work_item.rev, fields.get('System.WorkItemType'), fields.get('System.State'),
+                     fields.get('System.Title'), fields.get('System.ChangedDate'), json.dumps(work_item.serialize()))
+                )
+                self.connection.execute("DELETE FROM work_item_relations WHERE source_id = ?", (work_item.id,))
+                self.connection.executemany(
+                    "INSERT INTO work_item_relations (source_id, target_id, rel, url) VALUES (?, ?, ?, ?)",
+                    [(work_item.id, self._target_id(relation.url), relation.rel, relation.url)
+                     for relation in work_item.relations or []]
+                )
+                count += 1
+        return count
+    
+    def delete(self, ids: Iterable[int]):
+        """Remove work items (and their outgoing relations) from the mirror"""
+        rows = [(work_item_id,) for work_item_id in ids]
+        with self.connection:
+            self.connection.executemany("DELETE FROM work_items WHERE id = ?", rows)
+            self.connection.executemany("DELETE FROM work_item_relations WHERE source_id = ?", rows)
+            self.connection.executemany("DELETE FROM verification_results WHERE id = ?", rows)
+    
+    def revisions(self, ids: List[int]) -> Dict[int, int]:
+        """Mirrored System.Rev of each ID; IDs missing from the mirror are omitted"""
+        revisions = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            revisions.update(self.connection.execute(
+                f"SELECT id, rev FROM work_items WHERE id IN ({placeholders})", chunk
+            ))
+        return revisions
+    
+    def verification_results(self, rule_set: str, ids: List[int]) -> Dict[int, Tuple[int, str]]:
+        """Stored (rev, result) of each ID checked with `rule_set` (a rule-set version)"""
+        results = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for work_item_id, rev, result in self.connection.execute(
+                f"SELECT id, rev, result FROM verification_results WHERE rule_set = ? AND id IN ({placeholders})",
+                [rule_set, *chunk]
+            ):
+                results[work_item_id] = (rev, result)
+        return results
+    
+    def save_verification_results(self, rule_set: str, results: Iterable[Tuple[int, int, str]]):
+        """Store (id, rev, result) rows checked with `rule_set`, replacing earlier results"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO verification_results (rule_set, id, rev, result) VALUES (?, ?, ?, ?)",
+                [(rule_set, work_item_id, rev, result) for work_item_id, rev, result in results]
+            )
+    
+    def get_work_item(self, work_item_id: int, fields: Optional[List[str]] = None) -> WorkItem:
+        """Single work item from the mirror, raising LookupError if it is not mirrored"""
+        work_item = self.get_work_items_bulk([work_item_id], fields=fields).get(work_item_id)
+        if work_item is None:
+            raise LookupError(f"work item {work_item_id} is not in the mirror")
+        return work_item
+    
+    def get_work_items_bulk(self, ids: List[int], fields: Optional[List[str]] = None,
+                            expand: Optional[str] = None) -> Dict[int, WorkItem]:
+        """Mirror counterpart of AzureDevOpsManager.get_work_items_bulk.
+        
+        Only the requested fields are returned; IDs missing from the mirror are
+        omitted. Relations are always available, so `expand` is accepted and ignored.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        work_items = {}
+        
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(unique_ids), 500):
+            chunk = unique_ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for (document,) in self.connection.execute(
+                f"SELECT document FROM work_items WHERE id IN ({placeholders})", chunk
+            ):
+                work_item = self._load(document, fields)
+                work_items[work_item.id] = work_item
+        
+        return work_items
+    
+    def query(self, work_item_type: Optional[str] = None, state: Optional[str] = None,
+              title_contains: Optional[str] = None, fields: Optional[List[str]] = None) -> List[WorkItem]:
+        """Work items matching all given filters, ordered by ID"""
+        conditions, params = [], []
+        if work_item_type:
+            conditions.append("work_item_type = ?")
+            params.append(work_item_type)
+        if state:
+            conditions.append("state = ?")
+            params.append(state)
+        if title_contains:
+            conditions.append("instr(title, ?) > 0")
+            params.append(title_contains)
+        
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        rows = self.connection.execute(f"SELECT document FROM work_items{where} ORDER BY id", params)
+        return [self._load(document, fields) for (document,) in rows]
+    
+    def related_ids(self, work_item_id: int, rel: Optional[str] = None) -> List[int]:
+        """IDs of work items linked from `work_item_id`, optionally filtered by link type"""
+        sql = "SELECT target_id FROM work_item_relations WHERE source_id = ? AND target_id IS NOT NULL"
+        params = [work_item_id]
+        if rel:
+            sql += " AND rel = ?"
+            params.append(rel)
+        return [row[0] for row in self.connection.execute(sql, params)]
+    
+    def sync(self, manager, full: bool = False) -> int:
+        """Bring the mirror up to date and return the number of work items downloaded.
+        
+        Walks the reporting revisions feed from the continuation token saved by
+        the previous sync, so only items changed since then are transferred. The
+        token is saved after every page, so an interrupted sync resumes where it
+        stopped. `full` first re-downloads the whole project, which also drops
+        items that were destroyed without passing through the feed.
+        """
+        downloaded = self._replace_all(manager) if full else 0
+        token = None if full else self.get_state(self.TOKEN_KEY)
+        
+        while True:
+            page = manager.read_reporting_revisions(token, fields=self.FEED_FIELDS)
+            changed, deleted = self._diff_revisions(page.get('values') or [])
+            
+            if changed:
+                work_items = manager.get_work_items_bulk(changed, expand='Relations')
+                self.upsert(work_items.values())
+                downloaded += len(work_items)
+                # Changed items that are gone by now were deleted after the feed was read
+                deleted.extend(work_item_id for work_item_id in changed if work_item_id not in work_items)
+            self.delete(deleted)
+            
+            token = page.get('continuationToken') or token
+            self.set_state(self.TOKEN_KEY, token)
+            if page.get('isLastBatch', True):
+                break
+        
+        self.set_state('last_synced', datetime.now(timezone.utc).isoformat(timespec='seconds'))
+        return downloaded
+    
+    def _replace_all(self, manager) -> int:
+        """Download every work item in the project and drop mirrored items that no longer exist"""
+        ids = manager.query_ids()
+        work_items = manager.get_work_items_bulk(ids, expand='Relations')
+        
+        self.upsert(work_items.values())
+        stored_ids = {row[0] for row in self.connection.execute("SELECT id FROM work_items")}
+        self.delete(stored_ids - set(work_items))
+        return len(work_items)
+    
+    def _diff_revisions(self, values: List[Dict]) -> Tuple[List[int], List[int]]:
+        """Split a feed page into IDs newer than the mirror and IDs that were deleted"""
+        latest = {}
+        deleted = []
+        for value in values:
+            fields = value.get('fields') or {}
+            work_item_id = value.get('id') or fields.get('System.Id')
+            if fields.get('System.IsDeleted'):
+                deleted.append(work_item_id)
+            else:
+                latest[work_item_id] = value.get('rev') or fields.get('System.Rev') or 0
+        
+        stored = self.revisions(list(latest))
+        changed = [work_item_id for work_item_id, rev in latest.items() if rev > stored.get(work_item_id, 0)]
+        return changed, deleted
+    
+    @classmethod
+    def _target_id(cls, url: str) -> Optional[int]:
+        match = cls._WORK_ITEM_URL.search(url or '')
+        return int(match.group(1)) if match else None
+    
+    @staticmethod
+    def _load(document: str, fields: Optional[List[str]]) -> WorkItem:
+        work_item = WorkItem.deserialize(json.loads(document))
+        if fields:
+            work_item.fields = {name: work_item.fields[name] for name in fields if name in (work_item.fields or {})}
+        return work_item